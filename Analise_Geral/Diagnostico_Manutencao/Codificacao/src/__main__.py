@@ -0,0 +1,6 @@
+#ponto de entrada do pacote: python src (a partir da pasta Codificacao) abre o menu do software, como python app.py
+import sys
+
+from app import main
+
+sys.exit(main())
@@ -1,9 +1,7 @@
 import sys
-import time
 from pathlib import Path
 file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
+parent = file.parent
 
 #models
 from model.pedido import Pedido
@@ -15,21 +13,17 @@ from controler.pedidoControler import PedidoControler
 from controler.itemControler import ItemControler
 from controler.databaseControler import DatabaseControler
 from controler.relatorioController import RelatorioControler
+from controler.instrumentacaoControler import InstrumentacaoControler
+from controler.filaRelatorios import FilaRelatorios
 
 #views
 from view.janela1 import Janela1
 from view.janela2 import Janela2
 from view.janela3 import Janela3 # adcionando o direitorio de Janela3
+from view.janela4 import Janela4
+from view.janela5 import Janela5
 
-#report
-from report.relatorio1 import PDF
-
-database = Database('TESTE.db') #criação do banco
-cursor = DatabaseControler.conect_database(database.name)
-
-DatabaseControler.create_table_itens(cursor)
-DatabaseControler.create_table_pedidos(cursor)
-DatabaseControler.create_table_itens_pedidos(cursor)
+#report: report.relatorio1 (e o reportlab) só é importado ao gerar o primeiro relatório, na thread da FilaRelatorios
 
 
 #item1 = Item('calabresa', 35.5, 'pizza', 'fatias de calabresa, molho de tomate, queijo')
@@ -42,34 +36,84 @@ DatabaseControler.create_table_itens_pedidos(cursor)
 #ItemControler.insert_into_item(database.name, item3)
 
 
-a = 'y'
-print('''
+def iniciar_banco(database_name: str) -> Database:
+    """
+    Lê config.ini, cria o banco caso não exista e aplica o esquema atual
+    (tabelas, migrações, índices e gatilhos)
+
+    :return: database (Database) ou None se não foi possível conectar ao banco
+    """
+    #perfil de desempenho do SQLite ("safe" ou "fast"), lido de config.ini
+    #também pode ser escolhido aqui: DatabaseControler.definir_perfil('fast')
+    if DatabaseControler.carregar_configuracao(str(parent / 'config.ini')) == 'D7':
+        print('config.ini: seção [database] inválida, usando o perfil padrão do banco')
+    #instrumentação de desempenho (desativada por padrão), seção [instrumentacao] de config.ini
+    InstrumentacaoControler.carregar_configuracao(str(parent / 'config.ini'))
+
+    database = Database(database_name) #criação do banco
+    conn = DatabaseControler.conect_database(database.name)
+    if isinstance(conn, str):
+        print(f'Erro na conexão com o banco {database.name} ({conn})')
+        return None
+
+    #conexão usada só para o esquema: as telas usam o pool de conexões
+    try:
+        DatabaseControler.create_table_itens(conn)
+        DatabaseControler.create_table_pedidos(conn)
+        DatabaseControler.create_table_itens_pedidos(conn)
+        DatabaseControler.create_table_resumo_diario(conn)
+        DatabaseControler.migrar(conn)
+        DatabaseControler.create_indexes(conn)
+        DatabaseControler.create_triggers(conn)
+    finally:
+        conn.close()
+    return database
+
+
+def main() -> int:
+    database = iniciar_banco('TESTE.db')
+    if database is None:
+        return 1
+    #relatórios gerados em segundo plano, sem bloquear o menu; em paralelo só com [relatorio] processos > 1
+    processos = FilaRelatorios.carregar_configuracao(str(parent / 'config.ini'))
+    relatorios = FilaRelatorios(database.name, processos=processos)
+
+    a = 'y'
+    print('''
                 Bem-vindo ao software Pizza Mais
                         -Criando Sonhos-
                 Estabelecimento: Pizza Ciclano
                 "Seus sonhos tem formato e borda"
                 ---------------------------------
             ''')
-while a == 'y':
-    opcao = str(input('\n1 - Cadastrar\n2 - Pesquisar\n3 - Relatorio\n4 - Inserir Itens Menu\n5 - Encerrar\nDigite: '))
-    if opcao == '1':
-        Janela1.mostrar_janela1(database.name)
-    if opcao == '2':
-        Janela2.mostrar_janela2(database.name)
-    if opcao == '3':
-        timestamp_atual = str(time.time())
-        dados_relatorio = RelatorioControler.preparar_dados_relatorio(database.name)
-        relatorio = PDF.gerar_pdf(f'Relatorio{timestamp_atual}.pdf', dados_relatorio["pedidos"],dados_relatorio["faturamento_total"])
-        
-        if relatorio:
-            print("Relatório gerado com sucesso em 'Relatorio.pdf'.")
-        else:
-            print("Erro ao gerar o relatório.")
-    if opcao == '4':
-        Janela3.mostrar_janela3(database.name) # adcionando o novo view (Janela3)
-    if opcao == '5':
-        a = 'n'
-        break
-exit()
+    while a == 'y':
+        opcao = str(input('\n1 - Cadastrar\n2 - Pesquisar\n3 - Relatorio\n4 - Inserir Itens Menu\n5 - Encerrar\n6 - Painel da Cozinha\n7 - Instrumentação\n8 - Relatórios Solicitados\nDigite: '))
+        if opcao == '1':
+            Janela1.mostrar_janela1(database.name)
+        if opcao == '2':
+            Janela2.mostrar_janela2(database.name)
+        if opcao == '3':
+            Janela5.solicitar_relatorio(relatorios)
+        if opcao == '4':
+            Janela3.mostrar_janela3(database.name) # adcionando o novo view (Janela3)
+        if opcao == '5':
+            a = 'n'
+            break
+        if opcao == '6':
+            Janela4.mostrar_janela4(database.name)
+        if opcao == '7':
+            InstrumentacaoControler.mostrar_resumo()
+        if opcao == '8':
+            Janela5.mostrar_janela5(relatorios)
+    if relatorios.pendentes():
+        print(f'Aguardando {relatorios.pendentes()} relatório(s) em geração...')
+    relatorios.encerrar()
+    InstrumentacaoControler.encerrar()
+    DatabaseControler.fechar_conexoes()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
 
 #manutenções em: itemControler.py, janela1.py, pedidoControler.py
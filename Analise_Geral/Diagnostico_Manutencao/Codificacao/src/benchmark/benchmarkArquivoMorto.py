@@ -0,0 +1,104 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+
+from model.database import Database
+from model.pedido import Pedido
+from controler.pedidoControler import PedidoControler
+from controler.arquivoMortoControler import ArquivoMortoControler
+from benchmark.gerador import Gerador
+
+
+class BenchmarkArquivoMorto:
+    """
+    Mede as operações do dia a dia antes e depois de mover os pedidos entregues antigos
+    para o arquivo morto (ArquivoMortoControler.arquivar com --compactar), e o custo das
+    consultas que passam a ler os dois bancos. Os resultados de cada consulta são comparados
+    antes e depois do arquivamento.
+    """
+
+    @staticmethod
+    def operacoes(database_name: str, ultimo_dia: date, ultimo_id: int) -> list:
+        """
+        :return: lista de (nome, repetições, função)
+        """
+        semana = (ultimo_dia - timedelta(days=6)).isoformat()
+        mes = (ultimo_dia - timedelta(days=29)).isoformat()
+        fim = ultimo_dia.isoformat()
+        return [
+            ('pedido recente por id', 2000, lambda: Pedido.search_in_pedidos_id(database_name, ultimo_id)),
+            ('fila da cozinha', 200, lambda: PedidoControler.fila_cozinha(database_name)),
+            ('pedidos da última semana', 20, lambda: [p.id_pedido for p in Pedido.iter_pedidos(database_name, inicio=semana, fim=fim)]),
+            ('faturamento do último mês', 2000, lambda: Pedido.faturamento_periodo(database_name, mes, fim)),
+            ('faturamento total', 2000, lambda: Pedido.faturamento_total(database_name)),
+            ('pedido antigo por id', 2000, lambda: Pedido.search_in_pedidos_id(database_name, 1)),
+            ('todos os pedidos', 2, lambda: [p.id_pedido for p in Pedido.search_in_pedidos_all(database_name)]),
+            ('cópia de segurança', 1, lambda: BenchmarkArquivoMorto.copiar(database_name)),
+        ]
+
+    @staticmethod
+    def copiar(database_name: str) -> None:
+        """
+        Cópia de segurança do banco principal com a API de backup do sqlite3
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            origem = sqlite3.connect(database_name)
+            destino = sqlite3.connect(os.path.join(pasta, 'copia.db'))
+            origem.backup(destino)
+            destino.close()
+            origem.close()
+
+    @staticmethod
+    def medir(operacoes: list) -> dict:
+        """
+        :return: {nome: (milissegundos por execução, resultado)}
+        """
+        medidas = {}
+        for nome, repeticoes, funcao in operacoes:
+            resultado = funcao()
+            inicio = time.perf_counter()
+            for _ in range(repeticoes):
+                funcao()
+            medidas[nome] = ((time.perf_counter() - inicio) * 1000 / repeticoes, resultado)
+        return medidas
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    dias = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        Gerador.gerar(database_name, quantidade)
+        ultimo_dia, ultimo_id = sqlite3.connect(database_name).execute('SELECT MAX(Data), MAX(IdPedido) FROM Pedidos;').fetchone()
+        ultimo_dia = date.fromisoformat(ultimo_dia)
+        operacoes = BenchmarkArquivoMorto.operacoes(database_name, ultimo_dia, ultimo_id)
+        tamanho_antes = os.path.getsize(database_name) / 2 ** 20
+        antes = BenchmarkArquivoMorto.medir(operacoes)
+
+        inicio = time.perf_counter()
+        result = ArquivoMortoControler.arquivar(database_name, dias, compactar=True, hoje=ultimo_dia + timedelta(days=1))
+        duracao = time.perf_counter() - inicio
+        assert isinstance(result, dict), result
+        Database.fechar_conexoes()
+        tamanho_depois = os.path.getsize(database_name) / 2 ** 20
+        tamanho_arquivo = os.path.getsize(ArquivoMortoControler.nome_arquivo(database_name)) / 2 ** 20
+        depois = BenchmarkArquivoMorto.medir(operacoes)
+
+        print(f'{quantidade} pedidos: {result["pedidos"]} arquivados (anteriores a {result["corte"]}) '
+              f'em {result["lotes"]} lotes, {duracao:.2f} s')
+        print(f'banco principal: {tamanho_antes:.1f} MiB -> {tamanho_depois:.1f} MiB '
+              f'(arquivo morto: {tamanho_arquivo:.1f} MiB)')
+        print(f'{"Operação":<28}| {"Antes (ms)":>10} | {"Depois (ms)":>11} | Mesmo resultado')
+        for nome, _, _ in operacoes:
+            iguais = antes[nome][1] == depois[nome][1]
+            print(f'{nome:<28}| {antes[nome][0]:>10.3f} | {depois[nome][0]:>11.3f} | {"sim" if iguais else "NÃO"}')
+        Database.fechar_conexoes()
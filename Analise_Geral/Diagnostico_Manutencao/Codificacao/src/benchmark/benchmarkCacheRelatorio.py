@@ -0,0 +1,89 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from model.database import Database
+from controler.databaseControler import DatabaseControler
+from controler.relatorioController import RelatorioControler
+from controler.cacheRelatorio import CacheRelatorio
+from report.relatorio1 import PDF
+from benchmark.gerador import Gerador
+from benchmark.benchmarkPdfParalelo import BenchmarkPdfParalelo
+
+
+class BenchmarkCacheRelatorio:
+    """
+    Mede o relatório de todo o histórico com o cache de partes (CacheRelatorio) em um dia de
+    movimento: primeira geração (cache vazio), geração depois de um dia de pedidos novos e
+    depois da alteração de um pedido antigo. Cada resultado é comparado, página a página,
+    com o relatório em série do mesmo banco.
+    """
+
+    @staticmethod
+    def novos_pedidos(database_name: str, quantidade: int) -> None:
+        """
+        Copia os primeiros pedidos (e os seus itens) como pedidos novos, um ano depois
+        """
+        conn = DatabaseControler.conect_database(database_name)
+        maximo = conn.execute('SELECT MAX(IdPedido) FROM Pedidos;').fetchone()[0]
+        with conn:
+            conn.execute('''INSERT INTO Pedidos (IdPedido, Status, Delivery, Endereco, Data, ValorTotal)
+                            SELECT IdPedido + ?, 'preparo', Delivery, Endereco, date(Data, '+1 year'), ValorTotal
+                            FROM Pedidos WHERE IdPedido <= ?;''', (maximo, quantidade))
+            conn.execute('''INSERT INTO ItensPedidos (IdPedido, IdItem, Quantidade)
+                            SELECT IdPedido + ?, IdItem, Quantidade FROM ItensPedidos
+                            WHERE IdPedido <= ? ORDER BY Id;''', (maximo, quantidade))
+
+    @staticmethod
+    def alterar_pedido(database_name: str, id_pedido: int) -> None:
+        conn = DatabaseControler.conect_database(database_name)
+        with conn:
+            conn.execute('UPDATE Pedidos SET ValorTotal = ValorTotal + 1 WHERE IdPedido = ?;', (id_pedido,))
+
+    @staticmethod
+    def medir(database_name: str, pasta: str, nome: str) -> tuple:
+        """
+        Gera o relatório com o cache e o relatório em série do mesmo banco
+
+        :return: (duração com o cache, duração em série, páginas iguais)
+        """
+        com_cache = os.path.join(pasta, f'{nome}_cache.pdf')
+        serie = os.path.join(pasta, f'{nome}_serie.pdf')
+        inicio = time.perf_counter()
+        assert CacheRelatorio.gerar_pdf(database_name, com_cache, processos=1)
+        duracao = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        assert PDF.gerar_pdf(serie, RelatorioControler.iter_dados_relatorio(database_name),
+                             RelatorioControler.faturamento_total(database_name))
+        duracao_serie = time.perf_counter() - inicio
+        iguais = BenchmarkPdfParalelo.paginas(com_cache) == BenchmarkPdfParalelo.paginas(serie)
+        return duracao, duracao_serie, iguais
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    dia = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        Gerador.gerar(database_name, quantidade)
+        print(f'{quantidade} pedidos, {dia} pedidos novos por dia')
+        print(f'{"Geração":<28}| {"Cache (s)":>10} | {"Série (s)":>10} | Páginas iguais')
+        cenarios = (
+            ('cache vazio', None),
+            (f'+{dia} pedidos novos', lambda: BenchmarkCacheRelatorio.novos_pedidos(database_name, dia)),
+            ('pedido do meio alterado', lambda: BenchmarkCacheRelatorio.alterar_pedido(database_name, quantidade // 2)),
+            ('sem mudanças', None),
+        )
+        for nome, mudanca in cenarios:
+            if mudanca:
+                mudanca()
+            duracao, serie, iguais = BenchmarkCacheRelatorio.medir(database_name, pasta, nome.replace(' ', '_'))
+            print(f'{nome:<28}| {duracao:>10.2f} | {serie:>10.2f} | {"sim" if iguais else "NÃO"}')
+        Database.fechar_conexoes()
@@ -0,0 +1,126 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from model.database import Database
+from model.pedido import Pedido
+from model.item import Item
+from controler.databaseControler import DatabaseControler
+from controler.pedidoControler import PedidoControler
+from controler.itemControler import ItemControler
+
+
+class BenchmarkConexao:
+    """
+    Mede quantos pedidos por segundo o fluxo de cadastro (Janela1) consegue gravar,
+    abrindo uma conexão por chamada (comportamento antigo), usando o pool de conexões
+    e gravando o pedido inteiro em uma única transação.
+    """
+
+    @staticmethod
+    def preparar_banco(database_name: str, quantidade_itens: int = 10) -> None:
+        """
+        Cria as tabelas e um menu de itens para o teste
+
+        :param database_name: nome do banco de dados temporário (string)
+        :param quantidade_itens: quantidade de itens no menu (int)
+        :return None
+        """
+        conn = DatabaseControler.conect_database(database_name)
+        DatabaseControler.create_table_itens(conn)
+        DatabaseControler.create_table_pedidos(conn)
+        DatabaseControler.create_table_itens_pedidos(conn)
+        DatabaseControler.migrar(conn)
+        DatabaseControler.create_indexes(conn)
+        conn.close()
+        for i in range(quantidade_itens):
+            item = Item(f'item-{i}', 10.0 + i, 'Pizza', f'descricao do item {i}')
+            ItemControler.insert_into_item(database_name, item)
+
+    @staticmethod
+    def cadastrar_pedido(database_name: str, itens: list) -> None:
+        """
+        Reproduz as chamadas que a Janela1 fazia para cadastrar um pedido (um commit por linha)
+
+        :param database_name: nome do banco de dados (string)
+        :param itens: lista de tuplas (IdItem, quantidade)
+        :return None
+        """
+        numero_pedido = len(PedidoControler.search_in_pedidos_all(database_name)) + 1
+        valor_total = 0
+        lista_itens = []
+        for item, quantidade in itens:
+            ItemControler.valor_item(database_name, item)
+            valor_total += ItemControler.valor_item(database_name, item)[0][0] * quantidade
+            for x in range(quantidade):
+                lista_itens.append((numero_pedido, item))
+        pedido = Pedido('preparo', 'False', 'Retirada no local', '2025-01-01', valor_total)
+        PedidoControler.insert_into_pedidos(database_name, pedido)
+        for elem in lista_itens:
+            ItemControler.insert_into_itens_pedidos(database_name, elem)
+
+    @staticmethod
+    def cadastrar_pedido_completo(database_name: str, itens: list) -> None:
+        """
+        Cadastra o pedido como a Janela1 faz agora: pedido e itens em uma única transação
+
+        :param database_name: nome do banco de dados (string)
+        :param itens: lista de tuplas (IdItem, quantidade)
+        :return None
+        """
+        valor_total = 0
+        for item, quantidade in itens:
+            valor_total += ItemControler.valor_item(database_name, item)[0][0] * quantidade
+        pedido = Pedido('preparo', 'False', 'Retirada no local', '2025-01-01', valor_total)
+        PedidoControler.criar_pedido_completo(database_name, pedido, itens)
+
+    @staticmethod
+    def medir(tamanho_pool: int, quantidade_pedidos: int = 200, completo: bool = False) -> float:
+        """
+        Mede a vazão de cadastro de pedidos com o tamanho de pool informado.
+        Com tamanho_pool = 0 toda conexão é fechada ao ser devolvida, como antes do pool.
+
+        :param tamanho_pool: quantidade de conexões mantidas no pool (int)
+        :param quantidade_pedidos: quantidade de pedidos cadastrados (int)
+        :param completo: usa PedidoControler.criar_pedido_completo (bool)
+        :return: pedidos por segundo (float)
+        """
+        tamanho_original = Database.TAMANHO_POOL
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            Database.TAMANHO_POOL = tamanho_pool
+            try:
+                BenchmarkConexao.preparar_banco(database_name)
+                itens = [(1, 2), (3, 1), (5, 3)]
+                if completo:
+                    cadastrar = BenchmarkConexao.cadastrar_pedido_completo
+                else:
+                    cadastrar = BenchmarkConexao.cadastrar_pedido
+                inicio = time.perf_counter()
+                for x in range(quantidade_pedidos):
+                    cadastrar(database_name, itens)
+                duracao = time.perf_counter() - inicio
+            finally:
+                Database.TAMANHO_POOL = tamanho_original
+                Database.fechar_conexoes(database_name)
+        return quantidade_pedidos / duracao
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    antes = BenchmarkConexao.medir(0, quantidade)
+    depois = BenchmarkConexao.medir(Database.TAMANHO_POOL, quantidade)
+    transacao = BenchmarkConexao.medir(Database.TAMANHO_POOL, quantidade, completo=True)
+    print(f'Pedidos cadastrados: {quantidade}')
+    print(f'Conexão por chamada: {antes:10.1f} pedidos/s')
+    print(f'Pool de conexões:    {depois:10.1f} pedidos/s  ({depois / antes:.2f}x)')
+    print(f'Transação única:     {transacao:10.1f} pedidos/s  ({transacao / antes:.2f}x)')
+    estatisticas = ItemControler.estatisticas_cache()
+    print(f'Cache do menu: {estatisticas["acertos"]} acertos, {estatisticas["faltas"]} leituras da tabela Itens')
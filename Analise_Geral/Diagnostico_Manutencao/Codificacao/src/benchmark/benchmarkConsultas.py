@@ -0,0 +1,83 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from model.database import Database
+from model.item import Item
+from model.pedido import Pedido
+from benchmark.benchmarkRelatorio import BenchmarkRelatorio
+
+
+class BenchmarkConsultas:
+    """
+    Microbenchmark das consultas do cadastro de pedidos (Item.valor_item, Item.search_item_id,
+    Pedido.search_in_pedidos_id): SQL montado com f-string, um texto diferente a cada chamada
+    (como era antes), contra as consultas com parâmetros vinculados de model/consultas.py.
+    """
+
+    #consultas antigas, com o valor embutido no texto
+    CONSULTAS_ANTIGAS = (
+        ('valor_item', 'SELECT Preco FROM Itens WHERE IdItens = {};'),
+        ('search_item_id', 'SELECT Nome,Tipo,Descricao,Preco FROM Itens WHERE IdItens = {};'),
+        ('search_in_pedidos_id', 'SELECT * FROM Pedidos WHERE IdPedido = {};'),
+    )
+
+    @staticmethod
+    def medir_antigo(database_name: str, consulta: str, indices: list) -> float:
+        """
+        Executa a consulta montada com f-string em uma conexão do pool
+
+        :param database_name: nome do banco de dados (string)
+        :param consulta: consulta com "{}" no lugar do valor (string)
+        :param indices: valores consultados (list)
+        :return: latência média por consulta em microssegundos (float)
+        """
+        inicio = time.perf_counter()
+        for indice in indices:
+            with Database.conexao(database_name) as conn:
+                conn.cursor().execute(consulta.format(indice)).fetchall()
+        return (time.perf_counter() - inicio) / len(indices) * 1e6
+
+    @staticmethod
+    def medir_novo(funcao, database_name: str, indices: list) -> float:
+        """
+        Executa o método do model, que usa a consulta com parâmetro vinculado
+
+        :param funcao: método do model (Item.valor_item, ...)
+        :param database_name: nome do banco de dados (string)
+        :param indices: valores consultados (list)
+        :return: latência média por consulta em microssegundos (float)
+        """
+        inicio = time.perf_counter()
+        for indice in indices:
+            funcao(database_name, indice)
+        return (time.perf_counter() - inicio) / len(indices) * 1e6
+
+
+if __name__ == '__main__':
+    consultas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        BenchmarkRelatorio.popular_banco(database_name, 5000, quantidade_itens=500)
+        indices = [(i * 7919) % 500 + 1 for i in range(consultas)]
+        novos = {
+            'valor_item': Item.valor_item,
+            'search_item_id': Item.search_item_id,
+            'search_in_pedidos_id': Pedido.search_in_pedidos_id,
+        }
+        print(f'{"Consulta":<22}| {"f-string (µs)":>14} | {"parâmetro (µs)":>15}')
+        try:
+            for nome, consulta in BenchmarkConsultas.CONSULTAS_ANTIGAS:
+                antigo = BenchmarkConsultas.medir_antigo(database_name, consulta, indices)
+                novo = BenchmarkConsultas.medir_novo(novos[nome], database_name, indices)
+                print(f'{nome:<22}| {antigo:>14.1f} | {novo:>15.1f}')
+        finally:
+            Database.fechar_conexoes(database_name)
+    print(f'({consultas} consultas por método, 500 valores distintos)')
@@ -0,0 +1,56 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from model.database import Database
+from controler.pedidoControler import PedidoControler
+from benchmark.benchmarkRelatorio import BenchmarkRelatorio
+
+
+class BenchmarkCozinha:
+    """
+    Custo de cada ciclo do painel da cozinha (Janela4): a verificação de alteração
+    (PRAGMA data_version) contra a releitura completa da fila.
+    """
+
+    @staticmethod
+    def medir(funcao, repeticoes: int) -> float:
+        """
+        Latência média de uma função sem argumentos
+
+        :param funcao: função medida
+        :param repeticoes: quantidade de chamadas medidas (int)
+        :return: latência média em microssegundos (float)
+        """
+        funcao()
+        inicio = time.perf_counter()
+        for x in range(repeticoes):
+            funcao()
+        return (time.perf_counter() - inicio) / repeticoes * 1e6
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    abertos = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        BenchmarkRelatorio.popular_banco(database_name, quantidade)
+        with Database.conexao(database_name) as conn:
+            conn.execute("UPDATE Pedidos SET Status = 'preparo' WHERE IdPedido > ?;", (quantidade - abertos,))
+        monitor = PedidoControler.abrir_monitor(database_name)
+        try:
+            verificacao = BenchmarkCozinha.medir(lambda: PedidoControler.versao_dados(monitor), 10000)
+            releitura = BenchmarkCozinha.medir(lambda: PedidoControler.fila_cozinha(database_name), 1000)
+        finally:
+            monitor.close()
+            Database.fechar_conexoes(database_name)
+    print(f'verificação (PRAGMA data_version): {verificacao:8.1f} µs por ciclo')
+    print(f'releitura da fila:                 {releitura:8.1f} µs por ciclo')
+    print(f'({quantidade} pedidos, {abertos} em aberto)')
@@ -0,0 +1,54 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from model.database import Database
+from controler.exportacaoControler import ExportacaoControler
+from benchmark.gerador import Gerador
+
+
+class BenchmarkExportacao:
+    """
+    Mede a exportação de pedidos (ExportacaoControler.exportar_pedidos) em cada formato e
+    tamanho de banco: tempo, tamanho do arquivo e pico de memória alocada (tracemalloc),
+    que deve ficar constante com o crescimento do banco.
+    """
+
+    ARQUIVOS = ('pedidos.csv', 'pedidos.jsonl', 'pedidos.csv.gz', 'pedidos.jsonl.gz')
+
+    @staticmethod
+    def medir(database_name: str, arquivo: str) -> tuple:
+        """
+        :return: (duração em segundos, pico de memória em KiB, tamanho do arquivo em KiB)
+        """
+        inicio = time.perf_counter()
+        result = ExportacaoControler.exportar_pedidos(database_name, arquivo)
+        duracao = time.perf_counter() - inicio
+        assert isinstance(result, dict), result
+        #o pico é medido em uma segunda exportação, porque o tracemalloc deixa a execução mais lenta
+        tracemalloc.start()
+        ExportacaoControler.exportar_pedidos(database_name, arquivo)
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return duracao, pico / 1024, os.path.getsize(arquivo) / 1024
+
+
+if __name__ == '__main__':
+    tamanhos = [int(valor) for valor in sys.argv[1:]] or [10000, 100000]
+    print(f'{"Pedidos":>9} | {"Arquivo":<17}| {"Tempo (s)":>9} | {"Pico (KiB)":>10} | {"Tamanho (KiB)":>13}')
+    for tamanho in tamanhos:
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            Gerador.gerar(database_name, tamanho)
+            for nome in BenchmarkExportacao.ARQUIVOS:
+                duracao, pico, bytes_arquivo = BenchmarkExportacao.medir(database_name, os.path.join(pasta, nome))
+                print(f'{tamanho:>9} | {nome:<17}| {duracao:>9.2f} | {pico:>10.0f} | {bytes_arquivo:>13.0f}')
+            Database.fechar_conexoes()
@@ -0,0 +1,66 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from pypdf import PdfReader
+
+from model.database import Database
+from controler.relatorioController import RelatorioControler
+from report.relatorio1 import PDF
+from benchmark.gerador import Gerador
+
+
+class BenchmarkMemoriaPdf:
+    """
+    Pico de memória (tracemalloc) do relatório desenhado em um único Canvas (PDF.desenhar_pdf)
+    e em partes unidas no final (PDF.gerar_pdf com o pypdf), para bancos de tamanhos diferentes.
+    As páginas dos dois PDFs são comparadas.
+    """
+
+    @staticmethod
+    def medir(database_name: str, nome_arquivo: str, gerar) -> tuple:
+        """
+        :param gerar: PDF.desenhar_pdf ou PDF.gerar_pdf
+        :return: (pico de memória em bytes, duração em segundos)
+        """
+        pedidos = RelatorioControler.iter_dados_relatorio(database_name)
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        assert gerar(nome_arquivo, pedidos)
+        duracao = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return pico, duracao
+
+    @staticmethod
+    def paginas(nome_arquivo: str) -> list:
+        """
+        :return: conteúdo (comandos de desenho) de cada página do PDF (list de bytes)
+        """
+        return [pagina.get_contents().get_data() for pagina in PdfReader(nome_arquivo).pages]
+
+
+if __name__ == '__main__':
+    tamanhos = [int(valor) for valor in sys.argv[1:]] or [2500, 5000, 10000, 20000]
+    print(f'{"Pedidos":>8} | {"Páginas":>7} | {"Um Canvas (MiB)":>15} | {"Em partes (MiB)":>15} | Páginas iguais')
+    for quantidade in tamanhos:
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            Gerador.gerar(database_name, quantidade)
+            unico = os.path.join(pasta, 'unico.pdf')
+            partes = os.path.join(pasta, 'partes.pdf')
+            pico_unico, duracao_unico = BenchmarkMemoriaPdf.medir(database_name, unico, PDF.desenhar_pdf)
+            pico_partes, duracao_partes = BenchmarkMemoriaPdf.medir(database_name, partes, PDF.gerar_pdf)
+            paginas = BenchmarkMemoriaPdf.paginas(unico)
+            iguais = BenchmarkMemoriaPdf.paginas(partes) == paginas
+            print(f'{quantidade:>8} | {len(paginas):>7} | {pico_unico / 2 ** 20:>8.1f} ({duracao_unico:4.0f} s) | '
+                  f'{pico_partes / 2 ** 20:>8.1f} ({duracao_partes:4.0f} s) | {"sim" if iguais else "NÃO"}')
+            Database.fechar_conexoes(database_name)
@@ -0,0 +1,82 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import tracemalloc
+
+from model.database import Database
+from model.pedido import Pedido
+from controler.pedidoControler import PedidoControler
+from benchmark.benchmarkRelatorio import BenchmarkRelatorio
+
+
+class PedidoAntigo:
+    """
+    Pedido como era antes: __dict__ por instância e endereço embrulhado em uma tupla
+    """
+    def __init__(self, status, delivery, endereco, date, valor_total):
+        self.status = status
+        self.delivery = delivery
+        self.endereco = endereco,
+        self.date = date
+        self.valor_total = valor_total
+
+
+class BenchmarkModelos:
+    """
+    Memória da listagem de todos os pedidos (PedidoControler.search_in_pedidos_all): objetos
+    Pedido antigos, montados a partir das tuplas, contra os Pedido com __slots__ criados
+    direto pela fábrica de linhas do cursor.
+    """
+
+    @staticmethod
+    def listar_antigo(database_name: str) -> list:
+        """
+        Laço antigo do controller: busca as tuplas e cria um PedidoAntigo por linha
+
+        :param database_name: nome do banco de dados (string)
+        :return: lista de PedidoAntigo (list)
+        """
+        with Database.conexao(database_name) as conn:
+            search = conn.execute('SELECT * FROM Pedidos order by IdPedido asc;').fetchall()
+        result = []
+        for elem in search:
+            result.append(PedidoAntigo(elem[1], elem[2], elem[3], elem[4], elem[5]))
+        return result
+
+    @staticmethod
+    def medir(funcao, database_name: str) -> tuple:
+        """
+        Mede a memória retida pela lista retornada e o pico durante a montagem
+
+        :param funcao: função que recebe o nome do banco e retorna a lista de pedidos
+        :param database_name: nome do banco de dados (string)
+        :return: tupla (memória retida, pico) em bytes
+        """
+        tracemalloc.start()
+        pedidos = funcao(database_name)
+        retida, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del pedidos
+        return retida, pico
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        BenchmarkRelatorio.popular_banco(database_name, quantidade)
+        try:
+            antigo = BenchmarkModelos.medir(BenchmarkModelos.listar_antigo, database_name)
+            novo = BenchmarkModelos.medir(PedidoControler.search_in_pedidos_all, database_name)
+        finally:
+            Database.fechar_conexoes(database_name)
+    print(f'{"Listagem":<28}| {"Retida (MiB)":>13} | {"Pico (MiB)":>11}')
+    print(f'{"tuplas + Pedido com __dict__":<28}| {antigo[0] / 2**20:>13.1f} | {antigo[1] / 2**20:>11.1f}')
+    print(f'{"fábrica de linhas + slots":<28}| {novo[0] / 2**20:>13.1f} | {novo[1] / 2**20:>11.1f}')
+    print(f'({quantidade} pedidos)')
@@ -0,0 +1,69 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from pypdf import PdfReader
+
+from model.database import Database
+from controler.relatorioController import RelatorioControler
+from report.relatorio1 import PDF
+from report.relatorioParalelo import PDFParalelo
+from benchmark.gerador import Gerador
+
+
+class BenchmarkPdfParalelo:
+    """
+    Compara o relatório em série (PDF.gerar_pdf, em um único processo) com o relatório em
+    paralelo (PDFParalelo.gerar_pdf) para cada quantidade de processos, verificando que as
+    páginas geradas são iguais (mesma quantidade e mesmo conteúdo em cada página).
+    """
+
+    @staticmethod
+    def paginas(nome_arquivo: str) -> list:
+        """
+        :return: conteúdo (comandos de desenho) de cada página do PDF (list de bytes)
+        """
+        return [pagina.get_contents().get_data() for pagina in PdfReader(nome_arquivo).pages]
+
+    @staticmethod
+    def medir(database_name: str, pasta: str, processos: int) -> tuple:
+        """
+        Gera o relatório completo do banco
+
+        :param processos: 0 para o relatório em série
+        :return: (duração em segundos, arquivo gerado)
+        """
+        nome_arquivo = os.path.join(pasta, f'relatorio_{processos}.pdf')
+        faturamento = RelatorioControler.faturamento_total(database_name)
+        pedidos = RelatorioControler.iter_dados_relatorio(database_name)
+        inicio = time.perf_counter()
+        if processos:
+            assert PDFParalelo.gerar_pdf(nome_arquivo, pedidos, faturamento, processos=processos)
+        else:
+            assert PDF.gerar_pdf(nome_arquivo, pedidos, faturamento)
+        return time.perf_counter() - inicio, nome_arquivo
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    contagens = [int(valor) for valor in sys.argv[2:]] or sorted({2, os.cpu_count() or 1} | {1})
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        Gerador.gerar(database_name, quantidade)
+        serie, arquivo_serie = BenchmarkPdfParalelo.medir(database_name, pasta, 0)
+        paginas_serie = BenchmarkPdfParalelo.paginas(arquivo_serie)
+        print(f'{quantidade} pedidos, {len(paginas_serie)} páginas, {os.cpu_count()} núcleo(s)')
+        print(f'{"Processos":<10}| {"Tempo (s)":>10} | {"Aceleração":>10} | Páginas iguais')
+        print(f'{"série":<10}| {serie:>10.2f} | {1:>10.2f} | -')
+        for processos in contagens:
+            duracao, arquivo = BenchmarkPdfParalelo.medir(database_name, pasta, processos)
+            iguais = BenchmarkPdfParalelo.paginas(arquivo) == paginas_serie
+            print(f'{processos:<10}| {duracao:>10.2f} | {serie / duracao:>10.2f} | {"sim" if iguais else "NÃO"}')
+        Database.fechar_conexoes()
@@ -0,0 +1,80 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from model.database import Database
+from model.pedido import Pedido
+from controler.databaseControler import DatabaseControler
+from controler.pedidoControler import PedidoControler
+from controler.relatorioController import RelatorioControler
+from benchmark.benchmarkRelatorio import BenchmarkRelatorio
+
+
+class BenchmarkPerfil:
+    """
+    Compara os perfis de desempenho do SQLite (Database.PERFIS): vazão de cadastro de
+    pedidos (um commit por pedido) e latência de leitura do relatório.
+    """
+
+    @staticmethod
+    def medir_insercao(quantidade_pedidos: int) -> float:
+        """
+        Cadastra pedidos com PedidoControler.criar_pedido_completo em um banco vazio
+
+        :param quantidade_pedidos: quantidade de pedidos cadastrados (int)
+        :return: pedidos por segundo (float)
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            BenchmarkRelatorio.popular_banco(database_name, 0)
+            try:
+                itens = [(1, 2), (3, 1), (5, 3)]
+                inicio = time.perf_counter()
+                for x in range(quantidade_pedidos):
+                    pedido = Pedido('preparo', 'False', 'Retirada no local', '2025-01-01', 100.0)
+                    PedidoControler.criar_pedido_completo(database_name, pedido, itens)
+                duracao = time.perf_counter() - inicio
+            finally:
+                Database.fechar_conexoes(database_name)
+        return quantidade_pedidos / duracao
+
+    @staticmethod
+    def medir_leitura(quantidade_pedidos: int, repeticoes: int = 3) -> float:
+        """
+        Mede a latência média de montagem dos dados do relatório
+
+        :param quantidade_pedidos: quantidade de pedidos no banco (int)
+        :param repeticoes: quantidade de leituras medidas (int)
+        :return: latência média em segundos (float)
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            BenchmarkRelatorio.popular_banco(database_name, quantidade_pedidos)
+            try:
+                RelatorioControler.preparar_dados_relatorio(database_name)
+                inicio = time.perf_counter()
+                for x in range(repeticoes):
+                    RelatorioControler.preparar_dados_relatorio(database_name)
+                duracao = time.perf_counter() - inicio
+            finally:
+                Database.fechar_conexoes(database_name)
+        return duracao / repeticoes
+
+
+if __name__ == '__main__':
+    quantidade_insercao = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    quantidade_leitura = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    print(f'{"Perfil":<8}| {"Inserção (pedidos/s)":>22} | {"Leitura do relatório (s)":>25}')
+    for nome in Database.PERFIS:
+        DatabaseControler.definir_perfil(nome)
+        insercao = BenchmarkPerfil.medir_insercao(quantidade_insercao)
+        leitura = BenchmarkPerfil.medir_leitura(quantidade_leitura)
+        print(f'{nome:<8}| {insercao:>22.1f} | {leitura:>25.3f}')
+    print(f'({quantidade_insercao} pedidos inseridos, relatório sobre {quantidade_leitura} pedidos)')
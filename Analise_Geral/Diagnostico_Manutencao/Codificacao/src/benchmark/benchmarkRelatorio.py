@@ -0,0 +1,147 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from model.database import Database
+from controler.databaseControler import DatabaseControler
+from controler.pedidoControler import PedidoControler
+from controler.itemControler import ItemControler
+from controler.relatorioController import RelatorioControler
+
+
+class BenchmarkRelatorio:
+    """
+    Mede o tempo de montagem dos dados do relatório (RelatorioControler.preparar_dados_relatorio)
+    com uma única consulta, comparando com o laço antigo de uma consulta por pedido,
+    e o pico de memória da lista completa contra a leitura em fluxo.
+    """
+
+    @staticmethod
+    def popular_banco(database_name: str, quantidade_pedidos: int, quantidade_itens: int = 20, dias: int = 1) -> None:
+        """
+        Cria as tabelas e insere pedidos com 1 a 3 itens cada
+
+        :param database_name: nome do banco de dados temporário (string)
+        :param quantidade_pedidos: quantidade de pedidos a inserir (int)
+        :param quantidade_itens: quantidade de itens no menu (int)
+        :param dias: quantidade de dias, a partir de 01/01/2025, pelos quais os pedidos são distribuídos (int)
+        :return None
+        """
+        conn = DatabaseControler.conect_database(database_name)
+        DatabaseControler.create_table_itens(conn)
+        DatabaseControler.create_table_pedidos(conn)
+        DatabaseControler.create_table_itens_pedidos(conn)
+        DatabaseControler.migrar(conn)
+        DatabaseControler.create_indexes(conn)
+        aleatorio = random.Random(42)
+        with conn:
+            conn.executemany('INSERT INTO Itens (Nome, Preco, Tipo, Descricao) VALUES (?,?,?,?);',
+                             [(f'item-{i}', 20.0 + i, 'Pizza', f'descricao do item {i}') for i in range(1, quantidade_itens + 1)])
+            conn.executemany('INSERT INTO Pedidos (IdPedido, Status, Delivery, Endereco, Data, ValorTotal) VALUES (?,?,?,?,?,?);',
+                             [(i, 'entregue', 'False', 'Retirada no local', (date(2025, 1, 1) + timedelta(days=i % dias)).isoformat(), 50.0)
+                              for i in range(1, quantidade_pedidos + 1)])
+            linhas = []
+            for id_pedido in range(1, quantidade_pedidos + 1):
+                for item in aleatorio.sample(range(1, quantidade_itens + 1), aleatorio.randint(1, 3)):
+                    linhas.append((id_pedido, item, aleatorio.randint(1, 4)))
+            conn.executemany('INSERT INTO ItensPedidos (IdPedido, IdItem, Quantidade) VALUES (?,?,?);', linhas)
+        conn.close()
+
+    @staticmethod
+    def preparar_dados_relatorio_antigo(database_name: str) -> dict:
+        """
+        Laço antigo: lista de IDs e lista de pedidos separadas e uma consulta de itens por pedido
+
+        :param database_name: nome do banco de dados (string)
+        :return: dicionário no mesmo formato de RelatorioControler.preparar_dados_relatorio
+        """
+        id_pedidos = PedidoControler.get_id_all(database_name)
+        pedidos = PedidoControler.search_in_pedidos_all(database_name)
+        dados_relatorio = []
+        faturamento_total = 0
+        for id_pedido, pedido in zip(id_pedidos, pedidos):
+            itens_pedido = ItemControler.search_into_itens_pedidos_id(database_name, id_pedido)
+            dados_relatorio.append({
+                "id": id_pedido,
+                "data": pedido.date,
+                "valor": pedido.valor_total,
+                "itens": list(itens_pedido)
+            })
+            faturamento_total += pedido.valor_total
+        return {"pedidos": dados_relatorio, "faturamento_total": faturamento_total}
+
+    @staticmethod
+    def medir(quantidade_pedidos: int, antigo: bool = False) -> float:
+        """
+        Mede o tempo de montagem dos dados do relatório
+
+        :param quantidade_pedidos: quantidade de pedidos no banco (int)
+        :param antigo: mede o laço antigo em vez da consulta única (bool)
+        :return: duração em segundos (float)
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            BenchmarkRelatorio.popular_banco(database_name, quantidade_pedidos)
+            try:
+                if antigo:
+                    preparar = BenchmarkRelatorio.preparar_dados_relatorio_antigo
+                else:
+                    preparar = RelatorioControler.preparar_dados_relatorio
+                inicio = time.perf_counter()
+                dados = preparar(database_name)
+                duracao = time.perf_counter() - inicio
+                assert len(dados["pedidos"]) == quantidade_pedidos
+            finally:
+                Database.fechar_conexoes(database_name)
+        return duracao
+
+    @staticmethod
+    def medir_memoria(quantidade_pedidos: int, fluxo: bool) -> int:
+        """
+        Mede o pico de memória (tracemalloc) ao percorrer os dados do relatório
+
+        :param quantidade_pedidos: quantidade de pedidos no banco (int)
+        :param fluxo: usa RelatorioControler.iter_dados_relatorio em vez da lista completa (bool)
+        :return: pico de memória em bytes (int)
+        """
+        with tempfile.TemporaryDirectory() as pasta:
+            database_name = os.path.join(pasta, 'benchmark.db')
+            BenchmarkRelatorio.popular_banco(database_name, quantidade_pedidos)
+            try:
+                tracemalloc.start()
+                if fluxo:
+                    quantidade = sum(1 for pedido in RelatorioControler.iter_dados_relatorio(database_name))
+                else:
+                    quantidade = len(RelatorioControler.preparar_dados_relatorio(database_name)["pedidos"])
+                pico = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                assert quantidade == quantidade_pedidos
+            finally:
+                Database.fechar_conexoes(database_name)
+        return pico
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    #o laço antigo é quadrático (uma varredura de ItensPedidos por pedido), por isso é medido em uma amostra menor
+    quantidade_antigo = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    antigo = BenchmarkRelatorio.medir(quantidade_antigo, antigo=True)
+    novo_amostra = BenchmarkRelatorio.medir(quantidade_antigo)
+    novo = BenchmarkRelatorio.medir(quantidade)
+    print(f'{quantidade_antigo} pedidos - laço antigo:     {antigo:8.3f} s')
+    print(f'{quantidade_antigo} pedidos - consulta única:  {novo_amostra:8.3f} s  ({antigo / novo_amostra:.1f}x)')
+    print(f'{quantidade} pedidos - consulta única: {novo:8.3f} s')
+    for amostra in (quantidade // 10, quantidade):
+        lista = BenchmarkRelatorio.medir_memoria(amostra, fluxo=False)
+        fluxo = BenchmarkRelatorio.medir_memoria(amostra, fluxo=True)
+        print(f'{amostra} pedidos - pico de memória: lista {lista / 1024:10.0f} KiB | fluxo {fluxo / 1024:8.0f} KiB')
@@ -0,0 +1,88 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+import time
+
+from model.database import Database
+from model.consultas import Consultas
+from model.pedido import Pedido
+from controler.pedidoControler import PedidoControler
+from benchmark.benchmarkRelatorio import BenchmarkRelatorio
+
+
+class BenchmarkResumo:
+    """
+    Faturamento calculado a partir de Pedidos (como era antes) contra a leitura do
+    ResumoDiario mantido pelos gatilhos, e o custo dos gatilhos no cadastro de pedidos.
+    """
+
+    #consultas antigas, agregando a tabela Pedidos
+    FATURAMENTO_TOTAL_ANTIGO = 'SELECT COALESCE(SUM(ValorTotal), 0), COUNT(*) FROM Pedidos;'
+    FATURAMENTO_PERIODO_ANTIGO = 'SELECT COALESCE(SUM(ValorTotal), 0), COUNT(*) FROM Pedidos WHERE Data BETWEEN ? AND ?;'
+
+    @staticmethod
+    def medir_consulta(database_name: str, consulta: str, parametros: tuple = (), repeticoes: int = 50) -> float:
+        """
+        Latência média de uma consulta em uma conexão do pool
+
+        :param database_name: nome do banco de dados (string)
+        :param consulta: consulta SQL (string)
+        :param parametros: parâmetros da consulta (tuple)
+        :param repeticoes: quantidade de execuções medidas (int)
+        :return: latência média em milissegundos (float)
+        """
+        with Database.conexao(database_name) as conn:
+            conn.execute(consulta, parametros).fetchall()
+            inicio = time.perf_counter()
+            for x in range(repeticoes):
+                conn.execute(consulta, parametros).fetchall()
+            return (time.perf_counter() - inicio) / repeticoes * 1000
+
+    @staticmethod
+    def medir_insercao(database_name: str, quantidade_pedidos: int) -> float:
+        """
+        Cadastra pedidos com PedidoControler.criar_pedido_completo
+
+        :param database_name: nome do banco de dados (string)
+        :param quantidade_pedidos: quantidade de pedidos cadastrados (int)
+        :return: pedidos por segundo (float)
+        """
+        inicio = time.perf_counter()
+        for x in range(quantidade_pedidos):
+            pedido = Pedido('preparo', 'False', 'Retirada no local', '2025-06-01', 100.0)
+            PedidoControler.criar_pedido_completo(database_name, pedido, [(1, 2), (3, 1)])
+        return quantidade_pedidos / (time.perf_counter() - inicio)
+
+
+if __name__ == '__main__':
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    dias = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    insercoes = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+    periodo = ('2025-03-01', '2025-05-31')
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        BenchmarkRelatorio.popular_banco(database_name, quantidade, dias=dias)
+        try:
+            medir = BenchmarkResumo.medir_consulta
+            total = (medir(database_name, BenchmarkResumo.FATURAMENTO_TOTAL_ANTIGO),
+                     medir(database_name, Consultas.FATURAMENTO_TOTAL))
+            no_periodo = (medir(database_name, BenchmarkResumo.FATURAMENTO_PERIODO_ANTIGO, periodo),
+                          medir(database_name, Consultas.FATURAMENTO_PERIODO, periodo))
+            com_gatilhos = BenchmarkResumo.medir_insercao(database_name, insercoes)
+            with Database.conexao(database_name) as conn:
+                for nome, corpo in Database.GATILHOS:
+                    conn.execute(f'DROP TRIGGER {nome};')
+            sem_gatilhos = BenchmarkResumo.medir_insercao(database_name, insercoes)
+        finally:
+            Database.fechar_conexoes(database_name)
+    print(f'{"Consulta":<22}| {"Pedidos (ms)":>13} | {"ResumoDiario (ms)":>18}')
+    print(f'{"faturamento total":<22}| {total[0]:>13.3f} | {total[1]:>18.3f}')
+    print(f'{"faturamento 3 meses":<22}| {no_periodo[0]:>13.3f} | {no_periodo[1]:>18.3f}')
+    print(f'cadastro de pedidos: {sem_gatilhos:.1f} pedidos/s sem gatilhos, {com_gatilhos:.1f} com gatilhos')
+    print(f'({quantidade} pedidos em {dias} dias)')
@@ -0,0 +1,150 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from model.database import Database
+from model.pedido import Pedido
+from controler.pedidoControler import PedidoControler
+from servico.servidor import Servidor
+from servico.cliente import Cliente
+from benchmark.benchmarkRelatorio import BenchmarkRelatorio
+
+
+class BenchmarkServico:
+    """
+    Teste de carga com N atendentes simultâneos, cada um em um processo, cadastrando
+    pedidos e consultando o pedido cadastrado: acesso direto ao banco (cada terminal com
+    as suas conexões, como no app.py) contra o serviço de pedidos com um único escritor.
+    """
+
+    ITENS = [[1, 2], [3, 1], [5, 1]]
+
+    @staticmethod
+    def atendente_direto(argumentos: tuple) -> tuple:
+        """
+        Atendente que grava direto no banco pelos controllers
+
+        :param argumentos: (nome do banco, quantidade de pedidos)
+        :return: (latências em segundos, quantidade de erros)
+        """
+        database_name, pedidos = argumentos
+        latencias = []
+        erros = 0
+        for x in range(pedidos):
+            inicio = time.perf_counter()
+            itens = [tuple(item) for item in BenchmarkServico.ITENS]
+            valor_total = PedidoControler.calcular_valor_total(database_name, itens)
+            pedido = Pedido('preparo', 'False', 'Retirada no local', '2025-06-01', valor_total)
+            numero_pedido = PedidoControler.criar_pedido_completo(database_name, pedido, itens)
+            latencias.append(time.perf_counter() - inicio)
+            if not isinstance(numero_pedido, int):
+                erros += 1
+                continue
+            inicio = time.perf_counter()
+            PedidoControler.search_in_pedidos_id(database_name, numero_pedido)
+            latencias.append(time.perf_counter() - inicio)
+        Database.fechar_conexoes()
+        return latencias, erros
+
+    @staticmethod
+    def atendente_servico(argumentos: tuple) -> tuple:
+        """
+        Atendente que usa o serviço de pedidos pelo Cliente
+
+        :param argumentos: (porta do serviço, quantidade de pedidos)
+        :return: (latências em segundos, quantidade de erros)
+        """
+        porta, pedidos = argumentos
+        cliente = Cliente(porta=porta)
+        latencias = []
+        erros = 0
+        for x in range(pedidos):
+            inicio = time.perf_counter()
+            numero_pedido = cliente.criar_pedido(BenchmarkServico.ITENS)
+            latencias.append(time.perf_counter() - inicio)
+            if not isinstance(numero_pedido, int):
+                erros += 1
+                continue
+            inicio = time.perf_counter()
+            cliente.pedido(numero_pedido)
+            latencias.append(time.perf_counter() - inicio)
+        cliente.fechar()
+        return latencias, erros
+
+    @staticmethod
+    def executar(atendente, alvo, atendentes: int, pedidos: int) -> dict:
+        """
+        Executa os atendentes em processos separados e consolida as medidas
+
+        :param atendente: BenchmarkServico.atendente_direto ou atendente_servico
+        :param alvo: nome do banco ou porta do serviço
+        :param atendentes: quantidade de atendentes simultâneos (int)
+        :param pedidos: pedidos cadastrados por atendente (int)
+        :return: {"vazao": requisições/s, "p50": ms, "p99": ms, "erros": int}
+        """
+        with multiprocessing.Pool(atendentes) as processos:
+            inicio = time.perf_counter()
+            resultados = processos.map(atendente, [(alvo, pedidos)] * atendentes)
+            duracao = time.perf_counter() - inicio
+        latencias = sorted(latencia for parcial, erros in resultados for latencia in parcial)
+        return {
+            "vazao": len(latencias) / duracao,
+            "p50": latencias[len(latencias) // 2] * 1000,
+            "p99": latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))] * 1000,
+            "erros": sum(erros for parcial, erros in resultados),
+        }
+
+    @staticmethod
+    def iniciar_servidor(database_name: str) -> tuple:
+        """
+        Inicia o serviço de pedidos em uma thread, em uma porta livre
+
+        :param database_name: nome do banco de dados (string)
+        :return: (Servidor, loop do serviço, thread)
+        """
+        servidor = Servidor(database_name, porta=0)
+        loop = asyncio.new_event_loop()
+        pronto = threading.Event()
+
+        def rodar():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(servidor.iniciar())
+            pronto.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=rodar, daemon=True)
+        thread.start()
+        pronto.wait()
+        return servidor, loop, thread
+
+
+if __name__ == '__main__':
+    atendentes = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    pedidos = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'benchmark.db')
+        BenchmarkRelatorio.popular_banco(database_name, 10000)
+        direto = BenchmarkServico.executar(BenchmarkServico.atendente_direto, database_name, atendentes, pedidos)
+
+        servidor, loop, thread = BenchmarkServico.iniciar_servidor(database_name)
+        try:
+            servico = BenchmarkServico.executar(BenchmarkServico.atendente_servico, servidor.porta, atendentes, pedidos)
+        finally:
+            asyncio.run_coroutine_threadsafe(servidor.encerrar(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+    print(f'{"Acesso":<8}| {"Requisições/s":>14} | {"p50 (ms)":>9} | {"p99 (ms)":>9} | {"Erros":>6}')
+    for nome, medida in (('direto', direto), ('serviço', servico)):
+        print(f'{nome:<8}| {medida["vazao"]:>14.1f} | {medida["p50"]:>9.2f} | {medida["p99"]:>9.2f} | {medida["erros"]:>6}')
+    print(f'({atendentes} atendentes x {pedidos} pedidos, cada pedido seguido de uma consulta; '
+          f'{servidor.gravacoes} gravações em {servidor.lotes} commits no serviço)')
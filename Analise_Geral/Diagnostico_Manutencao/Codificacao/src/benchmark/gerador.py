@@ -0,0 +1,145 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import argparse
+import random
+from datetime import date, timedelta
+
+from model.database import Database
+from controler.databaseControler import DatabaseControler
+
+
+class Gerador:
+    """
+    Gera bancos de dados sintéticos, reproduzíveis pela semente, para os benchmarks:
+    menu com itens de vários tipos, pedidos distribuídos por um intervalo de datas (mais
+    pedidos às sextas e fins de semana), 1 a 4 itens por pedido e cerca de 60% de delivery.
+    Os pedidos dos últimos dias ficam em preparo ou prontos; os demais, entregues.
+    """
+
+    SABORES = ('calabresa', 'mussarela', 'frango com catupiry', 'portuguesa', 'marguerita', 'quatro queijos',
+               'pepperoni', 'napolitana', 'atum', 'bacon', 'palmito', 'vegetariana', 'baiana', 'toscana')
+    TIPOS = (('Pizza', 30.0, 70.0), ('Bebida', 5.0, 15.0), ('Sobremesa', 10.0, 35.0), ('Outro', 12.0, 30.0))
+    RUAS = ('Rua São Joaquim', 'Av. dos Holandeses', 'Rua do Sol', 'Rua Grande', 'Av. Litorânea', 'Rua das Flores')
+
+    #peso de cada dia da semana (segunda = 0) na quantidade de pedidos do dia
+    PESO_DIA_SEMANA = (0.7, 0.7, 0.8, 0.9, 1.3, 1.5, 1.3)
+
+    #pedidos inseridos por executemany
+    LOTE = 10000
+
+    @staticmethod
+    def gerar(database_name: str, pedidos: int, itens: int = 40, inicio: date = date(2024, 1, 1),
+              dias: int = 365, semente: int = 42) -> dict:
+        """
+        Cria o esquema atual em database_name e insere o menu e os pedidos.
+        Os gatilhos do resumo diário ficam desligados durante a carga e o resumo é
+        reconstruído no final, em uma única agregação.
+
+        :param database_name: banco de dados a ser criado (string); deve estar vazio
+        :param pedidos: quantidade de pedidos (int)
+        :param itens: quantidade de itens no menu (int)
+        :param inicio: data do primeiro dia (date)
+        :param dias: quantidade de dias do intervalo (int)
+        :param semente: semente do gerador aleatório (int)
+        :return: dicionário com as quantidades geradas (dict)
+        """
+        aleatorio = random.Random(semente)
+        conn = DatabaseControler.conect_database(database_name)
+        DatabaseControler.create_table_itens(conn)
+        DatabaseControler.create_table_pedidos(conn)
+        DatabaseControler.create_table_itens_pedidos(conn)
+        DatabaseControler.create_table_resumo_diario(conn)
+        DatabaseControler.migrar(conn)
+        DatabaseControler.create_indexes(conn)
+        for nome, corpo in Database.GATILHOS:
+            conn.execute(f'DROP TRIGGER IF EXISTS {nome};')
+
+        menu = Gerador._menu(aleatorio, itens)
+        with conn:
+            conn.executemany('INSERT INTO Itens (IdItens, Nome, Preco, Tipo, Descricao) VALUES (?,?,?,?,?);', menu)
+        precos = {item[0]: item[2] for item in menu}
+
+        linhas_geradas = 0
+        lote_pedidos = []
+        lote_linhas = []
+        for id_pedido, data in enumerate(Gerador._datas(aleatorio, pedidos, inicio, dias), start=1):
+            escolhidos = aleatorio.sample(range(1, itens + 1), aleatorio.choices((1, 2, 3, 4), (40, 35, 18, 7))[0])
+            valor_total = 0
+            for item in escolhidos:
+                quantidade = aleatorio.choices((1, 2, 3), (75, 20, 5))[0]
+                valor_total += precos[item] * quantidade
+                lote_linhas.append((id_pedido, item, quantidade))
+            delivery = aleatorio.random() < 0.6
+            endereco = f'{aleatorio.choice(Gerador.RUAS)}, {aleatorio.randint(1, 999)}' if delivery else 'Retirada no local'
+            recente = (inicio + timedelta(days=dias - 1) - data).days < 2
+            status = aleatorio.choice(('preparo', 'pronto', 'entregue')) if recente else 'entregue'
+            lote_pedidos.append((id_pedido, status, str(delivery), endereco, data.isoformat(), round(valor_total, 2)))
+            if len(lote_pedidos) >= Gerador.LOTE:
+                linhas_geradas += Gerador._gravar(conn, lote_pedidos, lote_linhas)
+                lote_pedidos, lote_linhas = [], []
+        linhas_geradas += Gerador._gravar(conn, lote_pedidos, lote_linhas)
+
+        DatabaseControler.reconstruir_resumo_diario(conn)
+        DatabaseControler.create_triggers(conn)
+        conn.execute('ANALYZE;')
+        conn.close()
+        return {"itens": itens, "pedidos": pedidos, "linhas": linhas_geradas, "dias": dias}
+
+    @staticmethod
+    def _menu(aleatorio: random.Random, itens: int) -> list:
+        """
+        Itens do menu: (IdItens, Nome, Preco, Tipo, Descricao)
+        """
+        menu = []
+        for id_item in range(1, itens + 1):
+            tipo, minimo, maximo = aleatorio.choices(Gerador.TIPOS, (60, 20, 12, 8))[0]
+            sabor = Gerador.SABORES[(id_item - 1) % len(Gerador.SABORES)]
+            nome = f'{tipo.lower()} {sabor} {id_item}'
+            preco = round(aleatorio.uniform(minimo, maximo), 2)
+            menu.append((id_item, nome, preco, tipo, f'{sabor}, ingredientes da casa'))
+        return menu
+
+    @staticmethod
+    def _datas(aleatorio: random.Random, pedidos: int, inicio: date, dias: int):
+        """
+        Gerador com a data de cada pedido, em ordem crescente, respeitando PESO_DIA_SEMANA
+        """
+        pesos = [Gerador.PESO_DIA_SEMANA[(inicio + timedelta(days=dia)).weekday()] * aleatorio.uniform(0.8, 1.2)
+                 for dia in range(dias)]
+        total = sum(pesos)
+        restantes = pedidos
+        for dia, peso in enumerate(pesos):
+            quantidade = restantes if dia == dias - 1 else min(restantes, round(pedidos * peso / total))
+            restantes -= quantidade
+            data = inicio + timedelta(days=dia)
+            for x in range(quantidade):
+                yield data
+
+    @staticmethod
+    def _gravar(conn: object, pedidos: list, linhas: list) -> int:
+        with conn:
+            conn.executemany('INSERT INTO Pedidos (IdPedido, Status, Delivery, Endereco, Data, ValorTotal) VALUES (?,?,?,?,?,?);', pedidos)
+            conn.executemany('INSERT INTO ItensPedidos (IdPedido, IdItem, Quantidade) VALUES (?,?,?);', linhas)
+        return len(linhas)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gera um banco de dados sintético para os benchmarks')
+    parser.add_argument('banco', help='arquivo do banco a ser criado (não pode existir)')
+    parser.add_argument('--pedidos', type=int, default=100000)
+    parser.add_argument('--itens', type=int, default=40)
+    parser.add_argument('--inicio', type=date.fromisoformat, default=date(2024, 1, 1), help='AAAA-MM-DD')
+    parser.add_argument('--dias', type=int, default=365)
+    parser.add_argument('--semente', type=int, default=42)
+    argumentos = parser.parse_args()
+    if Path(argumentos.banco).exists():
+        print(f'O banco {argumentos.banco} já existe')
+        sys.exit(1)
+    gerado = Gerador.gerar(argumentos.banco, argumentos.pedidos, argumentos.itens, argumentos.inicio,
+                           argumentos.dias, argumentos.semente)
+    print(f'{gerado["pedidos"]} pedidos, {gerado["linhas"]} linhas de itens e {gerado["itens"]} itens em {gerado["dias"]} dias')
@@ -0,0 +1,110 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import tempfile
+
+from model.consultas import Consultas
+from controler.databaseControler import DatabaseControler
+
+
+class PlanosConsulta:
+    """
+    Confere, com EXPLAIN QUERY PLAN, que as consultas mais usadas continuam usando os
+    índices declarados em Database.INDICES. Deve ser executado após qualquer mudança de
+    esquema ou de consulta: termina com código 1 se algum plano regredir.
+    """
+
+    #(descrição, consulta, parâmetros, trechos que devem aparecer no plano)
+    CONSULTAS = (
+        ('itens de um pedido (Item.search_into_itens_pedidos_id)', Consultas.ITENS_DO_PEDIDO, (1,),
+         ['SEARCH p USING INTEGER PRIMARY KEY', 'SEARCH ip USING INDEX idx_itens_pedidos_pedido',
+          'SEARCH i USING INTEGER PRIMARY KEY']),
+        ('dados do relatório (Pedido.iter_pedidos_com_itens)', Consultas.PEDIDOS_COM_ITENS, (),
+         ['SEARCH ip USING INDEX idx_itens_pedidos_pedido', 'SEARCH i USING INTEGER PRIMARY KEY']),
+        ('relatório de um período (Pedido.iter_pedidos_com_itens)', Consultas.PEDIDOS_COM_ITENS_PERIODO,
+         ('2025-01-01', '2025-01-07'), ['idx_pedidos_data', 'SEARCH ip USING INDEX idx_itens_pedidos_pedido']),
+        ('faturamento do período (Pedido.faturamento_periodo)', Consultas.FATURAMENTO_PERIODO,
+         ('2025-01-01', '2025-01-07'), ['SEARCH ResumoDiario USING PRIMARY KEY']),
+        ('resumo de cada dia (Pedido.search_resumo_diario)', Consultas.RESUMO_DIARIO_PERIODO,
+         ('2025-01-01', '2025-01-07'), ['SEARCH ResumoDiario USING PRIMARY KEY']),
+        ('pedidos por estado', '''
+            SELECT IdPedido FROM Pedidos WHERE Status = ?;
+            ''', ('preparo',), ['SEARCH Pedidos USING COVERING INDEX idx_pedidos_fila']),
+        ('fila da cozinha (Pedido.search_fila_cozinha)', Consultas.FILA_COZINHA, ('preparo', 'pronto'),
+         ['SEARCH p USING COVERING INDEX idx_pedidos_fila', 'SEARCH ip USING INDEX idx_itens_pedidos_pedido']),
+        ('pedidos que usam um item', '''
+            SELECT COUNT(*) FROM ItensPedidos WHERE IdItem = ?;
+            ''', (1,), ['SEARCH ItensPedidos USING COVERING INDEX idx_itens_pedidos_item']),
+        ('pedidos por estado e período (Pedido.iter_pedidos)',
+         Consultas.pedidos_filtrados({'status': 1, 'inicio': 1, 'fim': 1}), ('preparo', '2025-01-01', '2025-01-07'),
+         ['idx_pedidos_']),
+        ('linhas de itens de todos os pedidos (Item.iter_itens_pedido)', Consultas.LINHAS_ITENS_PEDIDOS, (),
+         ['idx_itens_pedidos_pedido', 'SEARCH i USING INTEGER PRIMARY KEY']),
+        ('linhas de itens de um pedido (Item.iter_itens_pedido)', Consultas.LINHAS_ITENS_DO_PEDIDO, (1,),
+         ['SEARCH ip USING INDEX idx_itens_pedidos_pedido']),
+        ('valor de um item (Item.valor_item)', Consultas.VALOR_ITEM, (1,),
+         ['SEARCH Itens USING INTEGER PRIMARY KEY']),
+        ('pedido por id (Pedido.search_in_pedidos_id)', Consultas.PEDIDO_POR_ID, (1,),
+         ['SEARCH Pedidos USING INTEGER PRIMARY KEY']),
+        ('próxima página (Pedido.search_pedidos_pagina)', Consultas.PAGINA_PEDIDOS_PROXIMA, (0, 20),
+         ['SEARCH Pedidos USING INTEGER PRIMARY KEY']),
+        ('página anterior (Pedido.search_pedidos_pagina)', Consultas.PAGINA_PEDIDOS_ANTERIOR, (40, 20),
+         ['SEARCH Pedidos USING INTEGER PRIMARY KEY']),
+    )
+
+    @staticmethod
+    def plano(conn: object, consulta: str, parametros: tuple) -> list:
+        """
+        Retorna as linhas de detalhe do EXPLAIN QUERY PLAN de uma consulta
+
+        :param conn: conexão com o banco (object)
+        :param consulta: consulta SQL (string)
+        :param parametros: parâmetros da consulta (tuple)
+        :return: lista com o detalhe de cada passo do plano (list)
+        """
+        return [linha[3] for linha in conn.execute('EXPLAIN QUERY PLAN ' + consulta, parametros)]
+
+    @staticmethod
+    def verificar(database_name: str) -> list:
+        """
+        Confere o plano de cada consulta de PlanosConsulta.CONSULTAS
+
+        :param database_name: banco de dados com o esquema atual (string)
+        :return: lista de falhas (descrição, trecho esperado, plano obtido), vazia se tudo estiver correto
+        """
+        conn = DatabaseControler.conect_database(database_name)
+        falhas = []
+        try:
+            for descricao, consulta, parametros, esperados in PlanosConsulta.CONSULTAS:
+                plano = PlanosConsulta.plano(conn, consulta, parametros)
+                texto = '\n'.join(plano)
+                for esperado in esperados:
+                    if esperado not in texto:
+                        falhas.append((descricao, esperado, plano))
+        finally:
+            conn.close()
+        return falhas
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'planos.db')
+        conn = DatabaseControler.conect_database(database_name)
+        DatabaseControler.create_table_itens(conn)
+        DatabaseControler.create_table_pedidos(conn)
+        DatabaseControler.create_table_itens_pedidos(conn)
+        DatabaseControler.migrar(conn)
+        DatabaseControler.create_indexes(conn)
+        conn.close()
+        falhas = PlanosConsulta.verificar(database_name)
+    for descricao, esperado, plano in falhas:
+        print(f'FALHA - {descricao}: esperado "{esperado}"')
+        for passo in plano:
+            print(f'    {passo}')
+    print(f'{len(PlanosConsulta.CONSULTAS)} consultas verificadas, {len(falhas)} falha(s)')
+    sys.exit(1 if falhas else 0)
@@ -0,0 +1,271 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from model.database import Database
+from model.pedido import Pedido
+from controler.pedidoControler import PedidoControler
+from controler.itemControler import ItemControler
+from controler.relatorioController import RelatorioControler
+from report.relatorio1 import PDF
+from benchmark.gerador import Gerador
+
+
+class Suite:
+    """
+    Suíte de benchmarks da inicialização do software e das camadas model/controler sobre bancos
+    sintéticos (benchmark/gerador.py) de vários tamanhos. O resultado é gravado em JSON, com a versão do código, para comparar
+    duas versões: python benchmark/suite.py --comparar antes.json depois.json
+    """
+
+    TAMANHOS = (1000, 100000, 1000000)
+
+    #operações por repetição das medidas de operações isoladas
+    OPERACOES = {"carregar_menu": 200, "criar_pedido": 200, "buscar_pedido": 1000}
+
+    #acima deste tamanho o PDF mede apenas os últimos DIAS_PDF dias, e não o relatório geral
+    PDF_LIMITE = 100000
+    DIAS_PDF = 30
+
+    #o PDF domina o tempo da suíte, por isso é medido uma única vez
+    REPETICOES_PDF = 1
+
+    @staticmethod
+    def banco(pasta: str, pedidos: int, semente: int) -> str:
+        """
+        Banco sintético com a quantidade de pedidos, gerado apenas se ainda não existir na pasta
+
+        :return: caminho do banco (string)
+        """
+        database_name = str(Path(pasta) / f'suite_{pedidos}_{semente}.db')
+        if not Path(database_name).exists():
+            Gerador.gerar(database_name + '.tmp', pedidos, semente=semente)
+            Path(database_name + '.tmp').rename(database_name)
+        return database_name
+
+    @staticmethod
+    def medir(funcao, repeticoes: int, operacoes: int = 1) -> dict:
+        """
+        Executa funcao() repeticoes vezes; cada execução realiza `operacoes` operações
+
+        :return: {"operacoes", "segundos" (menor tempo), "mediana", "ms_por_operacao"}
+        """
+        tempos = []
+        for x in range(repeticoes):
+            inicio = time.perf_counter()
+            funcao()
+            tempos.append(time.perf_counter() - inicio)
+        return {
+            "operacoes": operacoes,
+            "segundos": min(tempos),
+            "mediana": statistics.median(tempos),
+            "ms_por_operacao": min(tempos) * 1000 / operacoes,
+        }
+
+    @staticmethod
+    def executar_tamanho(database_name: str, pasta_pdf: str, pedidos: int, repeticoes: int, pdf_limite: int) -> dict:
+        """
+        Mede todas as operações em um banco (que é alterado pela criação de pedidos)
+
+        :return: {nome da medida: resultado de Suite.medir}
+        """
+        aleatorio = random.Random(pedidos)
+        medidas = {}
+        #último dia gerado, lido antes que a criação de pedidos acrescente pedidos de hoje
+        conn = sqlite3.connect(database_name)
+        ultimo = date.fromisoformat(conn.execute('SELECT MAX(Data) FROM Pedidos;').fetchone()[0])
+        conn.close()
+
+        def carregar_menu():
+            for x in range(Suite.OPERACOES["carregar_menu"]):
+                ItemControler.invalidar_cache(database_name)
+                assert not isinstance(ItemControler.mostrar_itens_menu(database_name), str)
+        medidas["carregar_menu"] = Suite.medir(carregar_menu, repeticoes, Suite.OPERACOES["carregar_menu"])
+
+        menu = [item[0] for item in ItemControler.mostrar_itens_menu(database_name)]
+
+        def criar_pedido():
+            for x in range(Suite.OPERACOES["criar_pedido"]):
+                itens = [(item, aleatorio.randint(1, 3)) for item in aleatorio.sample(menu, aleatorio.randint(1, 4))]
+                valor_total = PedidoControler.calcular_valor_total(database_name, itens)
+                pedido = Pedido('preparo', 'False', 'Retirada no local', date.today().isoformat(), valor_total)
+                assert isinstance(PedidoControler.criar_pedido_completo(database_name, pedido, itens), int)
+        medidas["criar_pedido"] = Suite.medir(criar_pedido, repeticoes, Suite.OPERACOES["criar_pedido"])
+
+        def buscar_pedido():
+            for x in range(Suite.OPERACOES["buscar_pedido"]):
+                indice = aleatorio.randint(1, pedidos)
+                assert PedidoControler.search_in_pedidos_id(database_name, indice)
+                ItemControler.search_into_itens_pedidos_id(database_name, indice)
+        medidas["buscar_pedido"] = Suite.medir(buscar_pedido, repeticoes, Suite.OPERACOES["buscar_pedido"])
+
+        medidas["listar_pedidos"] = Suite.medir(
+            lambda: PedidoControler.search_in_pedidos_all(database_name), repeticoes, pedidos)
+        medidas["dados_relatorio"] = Suite.medir(
+            lambda: sum(1 for pedido in RelatorioControler.iter_dados_relatorio(database_name)), repeticoes, pedidos)
+
+        nome_pdf = str(Path(pasta_pdf) / f'suite_{pedidos}.pdf')
+        if pedidos <= pdf_limite:
+            medidas["gerar_pdf"] = Suite.medir(
+                lambda: PDF.gerar_pdf(nome_pdf, RelatorioControler.iter_dados_relatorio(database_name),
+                                      RelatorioControler.faturamento_total(database_name)),
+                Suite.REPETICOES_PDF, pedidos)
+        else:
+            inicio, fim = ultimo - timedelta(days=Suite.DIAS_PDF - 1), ultimo
+            no_periodo = PedidoControler.faturamento_periodo(database_name, inicio, fim)["quantidade"]
+            medidas["gerar_pdf_periodo"] = Suite.medir(
+                lambda: PDF.gerar_pdf(nome_pdf, RelatorioControler.iter_dados_relatorio(database_name, inicio=inicio, fim=fim),
+                                      RelatorioControler.faturamento_periodo(database_name, inicio, fim),
+                                      f'{inicio} a {fim}'),
+                Suite.REPETICOES_PDF, no_periodo)
+        return medidas
+
+    @staticmethod
+    def medir_inicializacao(repeticoes: int) -> dict:
+        """
+        Inicialização a frio do software: app.py é executado em um processo novo, em uma pasta
+        vazia, e encerrado na primeira tela do menu (opção 5). Também mede, com -X importtime,
+        o tempo de importação dos módulos (soma dos módulos importados diretamente).
+
+        :return: {"iniciar_app": resultado de Suite.medir, "importacao": resultado de Suite.medir}
+        """
+        app = str(root / 'app.py')
+        importacoes = []
+        with tempfile.TemporaryDirectory() as temporaria:
+            def iniciar():
+                subprocess.run([sys.executable, app], cwd=temporaria, input='5\n', capture_output=True, text=True, check=True)
+            iniciar_app = Suite.medir(iniciar, repeticoes)
+            for x in range(repeticoes):
+                saida = subprocess.run([sys.executable, '-X', 'importtime', app], cwd=temporaria, input='5\n',
+                                       capture_output=True, text=True, check=True).stderr
+                importacoes.append(Suite.tempo_importacao(saida))
+        importacao = min(importacoes)
+        return {
+            "iniciar_app": iniciar_app,
+            "importacao": {"operacoes": 1, "segundos": importacao, "mediana": statistics.median(importacoes),
+                           "ms_por_operacao": importacao * 1000},
+        }
+
+    @staticmethod
+    def tempo_importacao(saida: str) -> float:
+        """
+        Soma, em segundos, o tempo acumulado dos módulos de primeiro nível na saída de -X importtime
+        """
+        total = 0
+        for linha in saida.splitlines():
+            if not linha.startswith('import time:') or 'cumulative' in linha:
+                continue
+            proprio, acumulado, modulo = linha[len('import time:'):].split('|')
+            if not modulo.startswith('  '):
+                total += int(acumulado)
+        return total / 1000000
+
+    @staticmethod
+    def versao_codigo() -> object:
+        """
+        Commit atual do repositório, ou None fora de um repositório git
+        """
+        try:
+            return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    @staticmethod
+    def executar(tamanhos: list, pasta: str, repeticoes: int, semente: int, pdf_limite: int) -> dict:
+        """
+        Executa a suíte em cada tamanho. Os bancos gerados ficam em `pasta` e são reaproveitados;
+        as medidas usam uma cópia, já que a criação de pedidos altera o banco.
+
+        :return: resultado completo, no formato gravado em JSON (dict)
+        """
+        resultado = {
+            "versao": Suite.versao_codigo(),
+            "data": datetime.now().isoformat(timespec='seconds'),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "semente": semente,
+            "repeticoes": repeticoes,
+            "inicializacao": Suite.medir_inicializacao(repeticoes),
+            "tamanhos": {},
+        }
+        Suite.imprimir('Inicialização', resultado["inicializacao"])
+        for pedidos in tamanhos:
+            original = Suite.banco(pasta, pedidos, semente)
+            with tempfile.TemporaryDirectory() as temporaria:
+                database_name = shutil.copy(original, Path(temporaria) / 'suite.db')
+                try:
+                    resultado["tamanhos"][str(pedidos)] = Suite.executar_tamanho(
+                        str(database_name), temporaria, pedidos, repeticoes, pdf_limite)
+                finally:
+                    ItemControler.invalidar_cache()
+                    Database.fechar_conexoes()
+            Suite.imprimir(pedidos, resultado["tamanhos"][str(pedidos)])
+        return resultado
+
+    @staticmethod
+    def imprimir(titulo: object, medidas: dict) -> None:
+        print(f'\n{titulo} pedidos' if isinstance(titulo, int) else f'\n{titulo}')
+        print(f'{"Medida":<18}| {"Operações":>10} | {"Tempo (s)":>10} | {"ms/operação":>12}')
+        for nome, medida in medidas.items():
+            print(f'{nome:<18}| {medida["operacoes"]:>10} | {medida["segundos"]:>10.3f} | {medida["ms_por_operacao"]:>12.4f}')
+
+    @staticmethod
+    def comparar(antes: dict, depois: dict) -> None:
+        """
+        Imprime, para cada tamanho e medida presentes nos dois resultados, o tempo por operação
+        e a razão depois/antes (abaixo de 1 é melhora)
+        """
+        print(f'{antes["versao"]} ({antes["data"]}) -> {depois["versao"]} ({depois["data"]})')
+        grupos = [('Inicialização', antes.get("inicializacao"), depois.get("inicializacao"))]
+        for pedidos, medidas in depois["tamanhos"].items():
+            grupos.append((f'{pedidos} pedidos', antes["tamanhos"].get(pedidos), medidas))
+        for titulo, medidas_antes, medidas in grupos:
+            if not medidas_antes or not medidas:
+                continue
+            print(f'\n{titulo}')
+            print(f'{"Medida":<18}| {"Antes (ms/op)":>14} | {"Depois (ms/op)":>14} | {"Razão":>7}')
+            for nome, medida in medidas.items():
+                anterior = medidas_antes.get(nome)
+                if anterior is None:
+                    continue
+                razao = medida["ms_por_operacao"] / anterior["ms_por_operacao"]
+                print(f'{nome:<18}| {anterior["ms_por_operacao"]:>14.4f} | {medida["ms_por_operacao"]:>14.4f} | {razao:>7.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Suíte de benchmarks das camadas model/controler')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=list(Suite.TAMANHOS), help='quantidades de pedidos')
+    parser.add_argument('--pasta', default=tempfile.gettempdir(), help='pasta dos bancos gerados (reaproveitados)')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--pdf-limite', type=int, default=Suite.PDF_LIMITE,
+                        help='acima deste tamanho o PDF mede apenas um período')
+    parser.add_argument('--saida', help='arquivo JSON com o resultado')
+    parser.add_argument('--comparar', nargs=2, metavar=('ANTES', 'DEPOIS'), help='compara dois resultados JSON')
+    argumentos = parser.parse_args()
+    if argumentos.comparar:
+        with open(argumentos.comparar[0], encoding='utf-8') as antes, open(argumentos.comparar[1], encoding='utf-8') as depois:
+            Suite.comparar(json.load(antes), json.load(depois))
+        sys.exit(0)
+    resultado = Suite.executar(argumentos.tamanhos, argumentos.pasta, argumentos.repeticoes, argumentos.semente,
+                               argumentos.pdf_limite)
+    if argumentos.saida:
+        with open(argumentos.saida, 'w', encoding='utf-8') as saida:
+            json.dump(resultado, saida, indent=2)
+        print(f'\nResultado gravado em {argumentos.saida}')
@@ -0,0 +1,93 @@
+#Necessário para realizar import em python
+import sys
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+import os
+import sqlite3
+import tempfile
+
+from model.database import Database
+from model.item import Item
+from controler.databaseControler import DatabaseControler
+
+
+class VerificarMigracoes:
+    """
+    Confere a atualização de bancos antigos para o esquema atual, com a mesma sequência da
+    inicialização do software (app.iniciar_banco): um banco com o esquema original, com linhas
+    repetidas de um mesmo item no pedido. Cada item do pedido deve ficar em uma única linha
+    com a quantidade.
+    """
+
+    #esquema do banco antes das migrações (ItensPedidos apontando para Produtos, Pedidos sem Data)
+    ESQUEMA_ORIGINAL = (
+        '''CREATE TABLE Itens (
+            IdItens INTEGER PRIMARY KEY AUTOINCREMENT, Nome VARHCAR(30), Preco REAL, Tipo VARCHAR(30),
+            Descricao VARCHAR(255), CONSTRAINT Produto_Unique UNIQUE (Nome));''',
+        '''CREATE TABLE Pedidos (
+            IdPedido INTEGER PRIMARY KEY AUTOINCREMENT, Status VARCHAR(30) NOT NULL, Delivery BOLL,
+            Endereco VARCHAR(100), ValorTotal REAL NOT NULL);''',
+        '''CREATE TABLE ItensPedidos (
+            Id INTEGER PRIMARY KEY AUTOINCREMENT, IdPedido INTEGER NOT NULL, IdItem INTEGER NOT NULL,
+            FOREIGN KEY(IdPedido) REFERENCES Pedidos(IdPedido),
+            FOREIGN KEY(IdItem) REFERENCES Produtos(IdItem));''',
+    )
+
+    #linhas de ItensPedidos esperadas: (Id, IdPedido, IdItem, Quantidade)
+    ESPERADO = [(1, 1, 1, 3), (4, 1, 2, 1), (5, 2, 1, 1)]
+
+    @staticmethod
+    def atualizar(database_name: str) -> None:
+        """
+        Aplica o esquema atual como app.iniciar_banco
+        """
+        conn = DatabaseControler.conect_database(database_name)
+        DatabaseControler.create_table_itens(conn)
+        DatabaseControler.create_table_pedidos(conn)
+        DatabaseControler.create_table_itens_pedidos(conn)
+        DatabaseControler.create_table_resumo_diario(conn)
+        assert DatabaseControler.migrar(conn) is True
+        DatabaseControler.create_indexes(conn)
+        DatabaseControler.create_triggers(conn)
+        conn.close()
+
+    @staticmethod
+    def conferir(database_name: str) -> None:
+        conn = DatabaseControler.conect_database(database_name)
+        versao = conn.execute('PRAGMA user_version;').fetchone()[0]
+        linhas = conn.execute('SELECT Id, IdPedido, IdItem, Quantidade FROM ItensPedidos ORDER BY Id;').fetchall()
+        conn.close()
+        assert versao == len(Database._migracoes()), versao
+        assert linhas == VerificarMigracoes.ESPERADO, linhas
+        #o pedido 1 aparece nas telas e no relatório com uma linha por item
+        itens = Item.search_into_itens_pedidos_id(database_name, 1)
+        assert [(nome, quantidade) for nome, preco, tipo, descricao, quantidade in itens] == \
+            [('calabresa', 3), ('guarana', 1)], itens
+        Database.fechar_conexoes(database_name)
+
+    @staticmethod
+    def banco_original(database_name: str) -> None:
+        #sem foreign_keys, como nas versões antigas: a chave para Produtos não é conferida
+        conn = sqlite3.connect(database_name)
+        for comando in VerificarMigracoes.ESQUEMA_ORIGINAL:
+            conn.execute(comando)
+        with conn:
+            conn.execute("INSERT INTO Itens (Nome, Preco, Tipo, Descricao) VALUES ('calabresa', 40, 'pizza', ''), "
+                         "('guarana', 8, 'bebida', '');")
+            conn.execute("INSERT INTO Pedidos (Status, Delivery, Endereco, ValorTotal) VALUES "
+                         "('entregue', 'True', '', 128), ('preparo', 'False', '', 40);")
+            conn.executemany('INSERT INTO ItensPedidos (IdPedido, IdItem) VALUES (?, ?);',
+                             [(1, 1), (1, 1), (1, 1), (1, 2), (2, 1)])
+        conn.close()
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as pasta:
+        database_name = os.path.join(pasta, 'original.db')
+        VerificarMigracoes.banco_original(database_name)
+        VerificarMigracoes.atualizar(database_name)
+        VerificarMigracoes.conferir(database_name)
+        print('esquema original: ok')
@@ -0,0 +1,266 @@
+#comandos executados fora do menu do software (manutenção do banco e painel da cozinha)
+#uso: python comandos.py [--banco TESTE.db] [--instrumentar] reconstruir-resumo | cozinha | servidor | terminal
+#                        | importar-menu arquivo | exportar-menu arquivo | exportar-pedidos arquivo | arquivar
+import sys
+import argparse
+import asyncio
+from pathlib import Path
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+
+from controler.databaseControler import DatabaseControler
+from controler.instrumentacaoControler import InstrumentacaoControler
+from controler.menuArquivoControler import MenuArquivoControler
+from controler.exportacaoControler import ExportacaoControler
+from controler.arquivoMortoControler import ArquivoMortoControler
+from view.janela4 import Janela4
+from servico.servidor import Servidor
+from servico.cliente import Cliente
+from servico.terminal import Terminal
+
+
+def preparar_banco(database_name: str) -> object:
+    """
+    Abre o banco e aplica o esquema atual (tabelas, migrações, índices e gatilhos), como na inicialização do app
+
+    :param database_name: nome do banco de dados (string)
+    :return: conexão (object) ou None se o banco não existir
+    """
+    if not Path(database_name).exists():
+        print(f'Banco de dados não encontrado: {database_name}')
+        return None
+    conn = DatabaseControler.conect_database(database_name)
+    if isinstance(conn, str):
+        return None
+    DatabaseControler.create_table_itens(conn)
+    DatabaseControler.create_table_pedidos(conn)
+    DatabaseControler.create_table_itens_pedidos(conn)
+    DatabaseControler.create_table_resumo_diario(conn)
+    DatabaseControler.migrar(conn)
+    DatabaseControler.create_indexes(conn)
+    DatabaseControler.create_triggers(conn)
+    return conn
+
+
+def reconstruir_resumo(argumentos) -> int:
+    """
+    Recalcula a tabela ResumoDiario a partir de todos os pedidos
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    try:
+        result = DatabaseControler.reconstruir_resumo_diario(conn)
+        if result is not True:
+            return 1
+        dias, pedidos = conn.execute('SELECT COUNT(*), COALESCE(SUM(Pedidos), 0) FROM ResumoDiario;').fetchone()
+        print(f'Resumo diário reconstruído: {dias} dia(s), {pedidos} pedido(s)')
+        return 0
+    finally:
+        conn.close()
+
+
+def painel_cozinha(argumentos) -> int:
+    """
+    Abre o painel da cozinha (Janela4) em um terminal separado do cadastro de pedidos
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    conn.close()
+    try:
+        Janela4.mostrar_janela4(argumentos.banco, argumentos.intervalo)
+    finally:
+        DatabaseControler.fechar_conexoes()
+    return 0
+
+
+def servidor(argumentos) -> int:
+    """
+    Inicia o serviço local de pedidos, usado pelos terminais de atendimento (Ctrl+C encerra)
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    conn.close()
+    try:
+        asyncio.run(Servidor(argumentos.banco, porta=argumentos.porta).executar())
+    except KeyboardInterrupt:
+        print('Serviço de pedidos encerrado')
+    return 0
+
+
+def terminal(argumentos) -> int:
+    """
+    Abre um terminal de atendimento conectado ao serviço de pedidos
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    try:
+        cliente = Cliente(argumentos.host, argumentos.porta)
+    except OSError as e:
+        print(f'Serviço de pedidos indisponível: {e}')
+        return 1
+    try:
+        Terminal.mostrar_terminal(cliente)
+    finally:
+        cliente.fechar()
+    return 0
+
+
+def importar_menu(argumentos) -> int:
+    """
+    Importa (insere ou atualiza pelo nome) os itens do menu de um arquivo CSV, JSON ou JSON Lines
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    conn.close()
+    try:
+        result = MenuArquivoControler.importar(argumentos.banco, argumentos.arquivo)
+    finally:
+        DatabaseControler.fechar_conexoes()
+    if isinstance(result, str):
+        print(f'Erro ao importar o menu: {result}')
+        return 1
+    for linha, erro in result["erros"]:
+        print(f'Linha {linha}: {erro}')
+    print(f'{result["registros"]} registro(s): {result["novos"]} item(ns) novo(s), '
+          f'{result["atualizados"]} atualizado(s), {len(result["erros"])} com erro')
+    return 0 if not result["erros"] else 2
+
+
+def exportar_menu(argumentos) -> int:
+    """
+    Exporta os itens do menu para um arquivo CSV, JSON ou JSON Lines
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    conn.close()
+    try:
+        result = MenuArquivoControler.exportar(argumentos.banco, argumentos.arquivo)
+    finally:
+        DatabaseControler.fechar_conexoes()
+    if isinstance(result, str):
+        print(f'Erro ao exportar o menu: {result}')
+        return 1
+    print(f'{result} item(ns) exportado(s) para {argumentos.arquivo}')
+    return 0
+
+
+def exportar_pedidos(argumentos) -> int:
+    """
+    Exporta os pedidos, com as linhas de itens, para CSV ou JSON Lines (opcionalmente com gzip)
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    conn.close()
+    filtro = {'status': argumentos.status, 'inicio': argumentos.inicio, 'fim': argumentos.fim}
+    try:
+        result = ExportacaoControler.exportar_pedidos(argumentos.banco, argumentos.arquivo, filtro, argumentos.gzip)
+    finally:
+        DatabaseControler.fechar_conexoes()
+    if result is False:
+        print('Data inválida! Utilize o formato dd/mm/aaaa.')
+        return 1
+    if isinstance(result, str):
+        print(f'Erro ao exportar os pedidos: {result}')
+        return 1
+    print(f'{result["pedidos"]} pedido(s) e {result["linhas"]} linha(s) de itens exportados para {argumentos.arquivo}')
+    return 0
+
+
+def arquivar(argumentos) -> int:
+    """
+    Move os pedidos entregues antigos, com os seus itens, para o arquivo morto (TESTE.db -> TESTE_arquivo.db)
+
+    :param argumentos: argumentos da linha de comando (argparse.Namespace)
+    :return: código de saída (int)
+    """
+    conn = preparar_banco(argumentos.banco)
+    if conn is None:
+        return 1
+    conn.close()
+    try:
+        result = ArquivoMortoControler.arquivar(argumentos.banco, argumentos.dias, argumentos.lote, argumentos.compactar)
+    finally:
+        DatabaseControler.fechar_conexoes()
+    if isinstance(result, str):
+        print(f'Erro ao arquivar os pedidos: {result}')
+        return 1
+    print(f'{result["pedidos"]} pedido(s) entregue(s) antes de {result["corte"]} movido(s) em {result["lotes"]} lote(s) '
+          f'para {ArquivoMortoControler.nome_arquivo(argumentos.banco)}')
+    return 0
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description='Comandos do Pizza Mais executados fora do menu')
+    parser.add_argument('--banco', default='TESTE.db', help='arquivo do banco de dados (padrão: TESTE.db)')
+    parser.add_argument('--instrumentar', action='store_true',
+                        help='mede os controllers e os comandos SQL e exibe o resumo ao encerrar')
+    comandos = parser.add_subparsers(dest='comando', required=True)
+    comandos.add_parser('reconstruir-resumo', help='recalcula o resumo diário de faturamento a partir dos pedidos').set_defaults(executar=reconstruir_resumo)
+    cozinha = comandos.add_parser('cozinha', help='painel da cozinha com os pedidos em preparo e prontos')
+    cozinha.add_argument('--intervalo', type=float, default=Janela4.INTERVALO, help='segundos entre verificações de alteração')
+    cozinha.set_defaults(executar=painel_cozinha)
+    servico = comandos.add_parser('servidor', help='serviço local de pedidos para vários terminais de atendimento')
+    servico.add_argument('--porta', type=int, default=Servidor.PORTA)
+    servico.set_defaults(executar=servidor)
+    atendimento = comandos.add_parser('terminal', help='terminal de atendimento conectado ao serviço de pedidos')
+    atendimento.add_argument('--host', default=Servidor.HOST)
+    atendimento.add_argument('--porta', type=int, default=Servidor.PORTA)
+    atendimento.set_defaults(executar=terminal)
+    formatos = ', '.join(MenuArquivoControler.FORMATOS)
+    importacao = comandos.add_parser('importar-menu', help=f'insere ou atualiza itens do menu a partir de um arquivo ({formatos})')
+    importacao.add_argument('arquivo', help='campos: nome, preco, tipo (Pizza, Bebida, Sobremesa ou Outro) e descricao')
+    importacao.set_defaults(executar=importar_menu)
+    exportacao = comandos.add_parser('exportar-menu', help=f'grava os itens do menu em um arquivo ({formatos})')
+    exportacao.add_argument('arquivo')
+    exportacao.set_defaults(executar=exportar_menu)
+    pedidos = comandos.add_parser('exportar-pedidos', help='exporta os pedidos com os itens para CSV ou JSON Lines (.csv, .jsonl, .csv.gz, .jsonl.gz)')
+    pedidos.add_argument('arquivo')
+    pedidos.add_argument('--inicio', help='data inicial dd/mm/aaaa')
+    pedidos.add_argument('--fim', help='data final dd/mm/aaaa')
+    pedidos.add_argument('--status', help='apenas pedidos neste estado, ex.: entregue')
+    pedidos.add_argument('--gzip', action='store_true', help='comprime com gzip mesmo sem a extensão .gz')
+    pedidos.set_defaults(executar=exportar_pedidos)
+    arquivamento = comandos.add_parser('arquivar', help='move os pedidos entregues antigos para o arquivo morto')
+    arquivamento.add_argument('--dias', type=int, default=ArquivoMortoControler.DIAS,
+                              help=f'arquiva os pedidos com mais de DIAS dias (padrão: {ArquivoMortoControler.DIAS})')
+    arquivamento.add_argument('--lote', type=int, default=ArquivoMortoControler.LOTE,
+                              help=f'pedidos movidos por transação (padrão: {ArquivoMortoControler.LOTE})')
+    arquivamento.add_argument('--compactar', action='store_true', help='reduz o arquivo do banco no final (VACUUM)')
+    arquivamento.set_defaults(executar=arquivar)
+    argumentos = parser.parse_args(argv)
+    if argumentos.instrumentar:
+        InstrumentacaoControler.ativar()
+    try:
+        return argumentos.executar(argumentos)
+    finally:
+        InstrumentacaoControler.encerrar()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+from datetime import date, timedelta
+
+#import de model
+from model.arquivoMorto import ArquivoMorto
+
+
+class ArquivoMortoControler:
+    """
+    Arquivamento dos pedidos entregues antigos (ver model/arquivoMorto.py), executado pelo
+    comando "python comandos.py arquivar". As telas, o relatório e a exportação continuam
+    vendo todos os pedidos: o arquivo morto só é lido quando a consulta chega a pedidos arquivados.
+    """
+
+    #padrões do comando
+    DIAS = ArquivoMorto.DIAS
+    LOTE = ArquivoMorto.LOTE
+
+    @staticmethod
+    def data_corte(dias: int, hoje: date = None) -> str:
+        """
+        :return: data a partir da qual os pedidos ficam no banco principal, AAAA-MM-DD (string)
+        """
+        return ((hoje or date.today()) - timedelta(days=dias)).isoformat()
+
+    @staticmethod
+    def arquivar(database_name: str, dias: int = DIAS, tamanho_lote: int = LOTE, compactar: bool = False,
+                 hoje: date = None) -> object:
+        """
+        Move para o arquivo morto os pedidos entregues há mais de dias dias
+
+        :param database_name: nome do banco de dados (string)
+        :param dias: pedidos com Data anterior a hoje - dias são arquivados (int)
+        :param tamanho_lote: pedidos movidos por transação (int)
+        :param compactar: executa VACUUM no banco principal no final (bool)
+        :param hoje: data de referência (date, padrão: hoje)
+        :return: {"pedidos": int, "lotes": int, "corte": string} ou código de erro (string)
+        """
+        if dias < 0 or tamanho_lote < 1:
+            return 'A4'
+        corte = ArquivoMortoControler.data_corte(dias, hoje)
+        result = ArquivoMorto.arquivar(database_name, corte, tamanho_lote)
+        if isinstance(result, str):
+            return result
+        if compactar and result["pedidos"]:
+            compactado = ArquivoMorto.compactar(database_name)
+            if compactado is not True:
+                return compactado
+        result["corte"] = corte
+        return result
+
+    @staticmethod
+    def nome_arquivo(database_name: str) -> object:
+        """
+        :return: nome do arquivo morto do banco (string) ou None para bancos em memória
+        """
+        return ArquivoMorto.nome(database_name)
+
+
+'''
+Códigos de Erro
+
+arquivar - A4 (dias negativo ou lote menor que 1)
+
+'''
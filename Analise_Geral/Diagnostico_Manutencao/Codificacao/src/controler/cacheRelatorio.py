@@ -0,0 +1,205 @@
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+#import de model
+from model.item import Item
+
+from controler.pedidoControler import PedidoControler
+from controler.relatorioController import RelatorioControler
+
+#report (e o reportlab): este módulo só é importado ao gerar um relatório
+from report.relatorio1 import PDF
+from report.relatorioParalelo import PDFParalelo, ExecucaoLocal, PdfReader
+
+
+class CacheRelatorio:
+    """
+    Relatório de todo o histórico com reaproveitamento das páginas já desenhadas.
+
+    O relatório é dividido em partes de PAGINAS_POR_PARTE páginas (as mesmas de PDFParalelo),
+    gravadas em uma pasta ao lado do banco com um índice (indice.json). Cada parte fechada guarda
+    a faixa de IdPedido, a posição y em que terminou, o primeiro pedido da parte seguinte e a
+    assinatura da faixa (PedidoControler.assinatura_pedidos: quantidade, soma dos valores e
+    soma das datas). Na geração seguinte as partes são conferidas em ordem e o prefixo que
+    continua válido é reaproveitado: só os pedidos depois dele são lidos e desenhados, e
+    o PDF final é a união das partes (PDFParalelo.unir). O custo do relatório de fim de dia fica
+    proporcional aos pedidos novos, e não ao histórico.
+
+    Um pedido alterado ou removido invalida a sua parte e as seguintes (as posições mudam);
+    uma mudança no menu (nome, preço, descrição dos itens) ou no layout (VERSAO) invalida todas.
+    Os itens de um pedido não mudam depois de cadastrado, por isso não entram na assinatura.
+    A última parte, com o rodapé, nunca é guardada. Sem o pypdf o relatório é gerado em série.
+    """
+
+    #aumentar quando o layout de report/relatorio1.py mudar, para descartar as partes guardadas
+    VERSAO = 1
+
+    INDICE = 'indice.json'
+
+    @staticmethod
+    def disponivel() -> bool:
+        """
+        :return: True se o pypdf estiver instalado (bool)
+        """
+        return PdfReader is not None
+
+    @staticmethod
+    def pasta(database_name: str) -> str:
+        """
+        :return: pasta do cache de um banco, ex.: TESTE.db -> TESTE_relatorios (string)
+        """
+        return f'{os.path.splitext(database_name)[0]}_relatorios'
+
+    @staticmethod
+    def gerar_pdf(database_name: str, nome_arquivo: str, leitura: str = None, acompanhar=None,
+                  processos: int = None, paginas_por_parte: int = None) -> bool:
+        """
+        Gera o relatório de todo o histórico em nome_arquivo, reaproveitando as partes válidas do cache
+
+        :param database_name: caminho do banco de dados, usado para localizar o cache (string)
+        :param nome_arquivo: PDF gerado (string)
+        :param leitura: nome usado nas consultas (padrão database_name; ex.: Database.nome_somente_leitura)
+        :param acompanhar: função (pedidos, reaproveitados) que devolve os pedidos a desenhar,
+                           usada para acompanhar o progresso (opcional)
+        :param processos: processos usados quando há muitos pedidos novos (padrão 1, em série)
+        :param paginas_por_parte: páginas por parte (padrão PDFParalelo.PAGINAS_POR_PARTE)
+        :return: True se o PDF foi gerado (bool)
+        """
+        leitura = leitura or database_name
+        acompanhar = acompanhar or (lambda pedidos, reaproveitados: pedidos)
+        faturamento = RelatorioControler.faturamento_total(leitura)
+        if not CacheRelatorio.disponivel():
+            pedidos = acompanhar(RelatorioControler.iter_dados_relatorio(leitura), 0)
+            return PDF.gerar_pdf(nome_arquivo, pedidos, faturamento)
+        paginas_por_parte = paginas_por_parte or PDFParalelo.PAGINAS_POR_PARTE
+
+        pasta = CacheRelatorio.pasta(database_name)
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            indice = CacheRelatorio._carregar(pasta)
+            menu = CacheRelatorio.assinatura_menu(leitura)
+            partes = []
+            if (indice.get("versao"), indice.get("menu"), indice.get("paginas_por_parte")) == \
+                    (CacheRelatorio.VERSAO, menu, paginas_por_parte):
+                partes = CacheRelatorio.validar(leitura, pasta, indice.get("partes", []))
+            try:
+                partes = CacheRelatorio._gerar(leitura, pasta, nome_arquivo, partes, faturamento, acompanhar,
+                                               processos, paginas_por_parte)
+            except ValueError:
+                #o primeiro pedido novo não abre uma página nova: desenha tudo de novo
+                partes = CacheRelatorio._gerar(leitura, pasta, nome_arquivo, [], faturamento, acompanhar,
+                                               processos, paginas_por_parte)
+            CacheRelatorio._salvar(pasta, {
+                "versao": CacheRelatorio.VERSAO,
+                "menu": menu,
+                "paginas_por_parte": paginas_por_parte,
+                "partes": partes,
+            })
+            return True
+        except (OSError, BrokenProcessPool) as e:
+            print(e)
+            return False
+
+    @staticmethod
+    def validar(database_name: str, pasta: str, partes: list) -> list:
+        """
+        Confere as partes guardadas, em ordem, e para na primeira que não vale mais
+
+        :return: maior prefixo de partes ainda válido (list de dict)
+        """
+        validas = []
+        for parte in partes:
+            if not os.path.exists(os.path.join(pasta, parte["arquivo"])):
+                break
+            assinatura = PedidoControler.assinatura_pedidos(database_name, parte["primeiro_id"], parte["ultimo_id"])
+            if assinatura != parte["assinatura"]:
+                break
+            if PedidoControler.proximo_pedido(database_name, parte["ultimo_id"]) != parte["proximo_id"]:
+                break
+            validas.append(parte)
+        return validas
+
+    @staticmethod
+    def assinatura_menu(database_name: str) -> str:
+        """
+        :return: hash dos itens do menu, cujos dados aparecem em todas as páginas (string)
+        """
+        #direto do model: o cache de ItemControler é por nome de banco e pode não ver outra conexão
+        itens = Item.mostrar_itens_menu(database_name)
+        if not isinstance(itens, str):
+            itens = sorted(itens)
+        return hashlib.sha256(repr(itens).encode()).hexdigest()
+
+    @staticmethod
+    def _gerar(database_name: str, pasta: str, nome_arquivo: str, partes: list, faturamento: float, acompanhar,
+               processos: int, paginas_por_parte: int) -> list:
+        """
+        Desenha os pedidos depois das partes reaproveitadas, guarda as novas partes fechadas
+        e une tudo em nome_arquivo
+
+        :return: partes do novo índice (list de dict)
+        """
+        reaproveitados = sum(parte["assinatura"][0] for parte in partes)
+        restantes = PedidoControler.faturamento_total(database_name)
+        restantes = restantes["quantidade"] - reaproveitados if isinstance(restantes, dict) else 0
+        processos = processos or 1
+        if restantes >= PDFParalelo.MINIMO_PEDIDOS and PDFParalelo.disponivel(processos):
+            executor = ProcessPoolExecutor(max_workers=processos, mp_context=get_context('spawn'))
+        else:
+            executor, processos = ExecucaoLocal(), 1
+
+        ultima = partes[-1] if partes else None
+        pedidos = RelatorioControler.iter_dados_relatorio(database_name, a_partir_de=ultima and ultima["ultimo_id"])
+        pedidos = acompanhar(pedidos, reaproveitados)
+        with tempfile.TemporaryDirectory(dir=pasta) as temporaria, executor:
+            novas = PDFParalelo.desenhar_partes(executor, temporaria, processos, pedidos, faturamento, None,
+                                                paginas_por_parte, continuacao=ultima and ultima["y_fim"],
+                                                soma_anterior=sum(parte["soma"] for parte in partes))
+            partes = list(partes)
+            arquivos = [os.path.join(pasta, parte["arquivo"]) for parte in partes]
+            arquivos += [parte["arquivo"] for parte in novas]
+            PDFParalelo.unir(arquivos, nome_arquivo)
+            #partes fechadas vão para o cache; a última (com o rodapé) é descartada
+            for parte in novas[:-1]:
+                assinatura = PedidoControler.assinatura_pedidos(database_name, parte["primeiro_id"], parte["ultimo_id"])
+                if isinstance(assinatura, str):
+                    break
+                arquivo = f'parte_{parte["primeiro_id"]}_{parte["ultimo_id"]}.pdf'
+                os.replace(parte["arquivo"], os.path.join(pasta, arquivo))
+                partes.append({
+                    "arquivo": arquivo,
+                    "primeiro_id": parte["primeiro_id"],
+                    "ultimo_id": parte["ultimo_id"],
+                    "proximo_id": parte["proximo_id"],
+                    "y_fim": parte["y_fim"],
+                    "soma": parte["soma"],
+                    "assinatura": assinatura,
+                })
+        return partes
+
+    @staticmethod
+    def _carregar(pasta: str) -> dict:
+        try:
+            with open(os.path.join(pasta, CacheRelatorio.INDICE), encoding='utf-8') as arquivo:
+                return json.load(arquivo)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _salvar(pasta: str, indice: dict) -> None:
+        """
+        Grava o índice (substituição atômica) e apaga as partes que não estão nele
+        """
+        temporario = os.path.join(pasta, CacheRelatorio.INDICE + '.tmp')
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(indice, arquivo)
+        os.replace(temporario, os.path.join(pasta, CacheRelatorio.INDICE))
+        usados = {parte["arquivo"] for parte in indice["partes"]}
+        for nome in os.listdir(pasta):
+            if nome.startswith('parte_') and nome not in usados:
+                os.remove(os.path.join(pasta, nome))
@@ -3,11 +3,6 @@ from model.database import Database
 
 import sqlite3
 from sqlite3 import Error
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
 
 
 class DatabaseControler:
@@ -60,4 +55,99 @@ class DatabaseControler:
         :return result: obj
         """
         result = Database.create_table_itens_pedidos(conn)
-        return result
\ No newline at end of file
+        return result
+
+    #criando a tabela do resumo diário, caso não exista
+    @staticmethod
+    def create_table_resumo_diario(conn: object) -> None:
+        """
+        Caso não exista, cria a tabela ResumoDiario (faturamento por dia) em um banco de dados sqlite3
+
+        :param conn: obj
+        :return result: obj
+        """
+        result = Database.create_table_resumo_diario(conn)
+        return result
+
+    #atualizando bancos criados por versões anteriores
+    @staticmethod
+    def migrar(conn: object) -> bool:
+        """
+        Aplica as migrações de esquema pendentes no banco de dados
+
+        :param conn: obj
+        :return result: obj
+        """
+        result = Database.migrar(conn)
+        return result
+
+    #criando os índices secundários, caso não existam
+    @staticmethod
+    def create_indexes(conn: object) -> bool:
+        """
+        Cria os índices secundários declarados em Database.INDICES
+
+        :param conn: obj
+        :return result: obj
+        """
+        result = Database.create_indexes(conn)
+        return result
+
+    #criando os gatilhos do resumo diário, caso não existam
+    @staticmethod
+    def create_triggers(conn: object) -> bool:
+        """
+        Cria os gatilhos declarados em Database.GATILHOS, que mantêm o ResumoDiario
+
+        :param conn: obj
+        :return result: obj
+        """
+        result = Database.create_triggers(conn)
+        return result
+
+    #recalculando o resumo diário a partir dos pedidos
+    @staticmethod
+    def reconstruir_resumo_diario(conn: object) -> bool:
+        """
+        Apaga e recalcula o ResumoDiario a partir de todos os pedidos
+
+        :param conn: obj
+        :return result: obj
+        """
+        result = Database.reconstruir_resumo_diario(conn)
+        return result
+
+    #selecionando o perfil de desempenho do SQLite
+    @staticmethod
+    def definir_perfil(nome: str, **ajustes) -> bool:
+        """
+        Seleciona o perfil de desempenho ("safe" ou "fast") aplicado às conexões
+
+        :param nome: string
+        :return result: obj
+        """
+        result = Database.definir_perfil(nome, **ajustes)
+        return result
+
+    #lendo o perfil de desempenho de um arquivo de configuração
+    @staticmethod
+    def carregar_configuracao(caminho: str) -> bool:
+        """
+        Lê o perfil de desempenho da seção [database] de um arquivo .ini
+
+        :param caminho: string
+        :return result: obj
+        """
+        result = Database.carregar_configuracao(caminho)
+        return result
+
+    #fechando as conexões mantidas no pool
+    @staticmethod
+    def fechar_conexoes(database_name: str = None) -> None:
+        """
+        Fecha as conexões ociosas mantidas pelo pool de conexões
+
+        :param database_name: string
+        :return None
+        """
+        Database.fechar_conexoes(database_name)
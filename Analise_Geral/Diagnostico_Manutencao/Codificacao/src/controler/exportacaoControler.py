@@ -0,0 +1,116 @@
+import csv
+import gzip
+import json
+import os
+from sqlite3 import Error
+
+from controler.pedidoControler import PedidoControler
+
+
+class ExportacaoControler:
+    """
+    Exportação dos pedidos, com as linhas de itens, para a contabilidade.
+
+    Os pedidos e as suas linhas são lidos em fluxo (PedidoControler.iter_pedidos_com_linhas) e
+    escritos à medida que chegam, de forma que a memória usada não cresce com o período exportado.
+    Formatos, pela extensão do arquivo:
+      .csv   - uma linha por item de pedido (pedidos sem itens ocupam uma linha com os campos do item vazios)
+      .jsonl - um objeto por pedido, com a lista "itens"
+    Com a extensão .gz a mais (ex.: pedidos.csv.gz), ou com comprimir=True, o arquivo é gravado com gzip.
+    O arquivo é escrito com outro nome e renomeado no final: uma exportação interrompida não deixa
+    um arquivo incompleto no lugar do anterior.
+    """
+
+    FORMATOS = ('.csv', '.jsonl')
+
+    CAMPOS_PEDIDO = ('id_pedido', 'data', 'status', 'delivery', 'endereco', 'valor_total')
+    CAMPOS_ITEM = ('item', 'tipo', 'preco', 'quantidade', 'descricao')
+
+    @staticmethod
+    def formato(arquivo: str) -> tuple:
+        """
+        :return: (formato, comprimido) a partir da extensão, ex.: "pedidos.csv.gz" -> (".csv", True);
+                 formato é None se não for um dos FORMATOS
+        """
+        nome, extensao = os.path.splitext(arquivo.lower())
+        comprimido = extensao == '.gz'
+        if comprimido:
+            extensao = os.path.splitext(nome)[1]
+        return (extensao if extensao in ExportacaoControler.FORMATOS else None), comprimido
+
+    @staticmethod
+    def exportar_pedidos(database_name: str, arquivo: str, filtro: dict = None, comprimir: bool = False,
+                         tamanho_lote: int = 500) -> object:
+        """
+        Exporta os pedidos selecionados pelo filtro, em ordem de IdPedido
+
+        :param database_name: nome do banco de dados (string)
+        :param arquivo: arquivo de saída .csv ou .jsonl, opcionalmente terminado em .gz (string)
+        :param filtro: dicionário com "status" (string), "inicio" e "fim" (date ou string dd/mm/AAAA), todos opcionais
+        :param comprimir: grava com gzip mesmo sem a extensão .gz (bool)
+        :param tamanho_lote: quantidade de linhas lidas por vez em cada cursor (int)
+        :return: {"pedidos": int, "linhas": int}, False se alguma data for inválida, ou código de erro (string)
+        """
+        formato, comprimido = ExportacaoControler.formato(arquivo)
+        if formato is None:
+            return 'E2'
+        pedidos = PedidoControler.iter_pedidos_com_linhas(database_name, filtro, tamanho_lote)
+        if pedidos is False or isinstance(pedidos, str):
+            return pedidos
+
+        temporario = f'{arquivo}.parcial'
+        abrir = gzip.open if comprimido or comprimir else open
+        escrever = ExportacaoControler._escrever_csv if formato == '.csv' else ExportacaoControler._escrever_jsonl
+        try:
+            with abrir(temporario, 'wt', newline='', encoding='utf-8') as saida:
+                result = escrever(saida, pedidos)
+            os.replace(temporario, arquivo)
+            return result
+        except (OSError, Error) as e:
+            print(e)
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            return 'E1'
+
+    @staticmethod
+    def _escrever_csv(saida: object, pedidos) -> dict:
+        escritor = csv.writer(saida)
+        escritor.writerow(ExportacaoControler.CAMPOS_PEDIDO + ExportacaoControler.CAMPOS_ITEM)
+        quantidade = linhas = 0
+        for pedido, itens in pedidos:
+            colunas = ExportacaoControler._pedido(pedido)
+            quantidade += 1
+            if not itens:
+                escritor.writerow(colunas + ('',) * len(ExportacaoControler.CAMPOS_ITEM))
+            for id_pedido, nome, preco, tipo, descricao, qtd in itens:
+                escritor.writerow(colunas + (nome, tipo, preco, qtd, descricao))
+            linhas += len(itens)
+        return {"pedidos": quantidade, "linhas": linhas}
+
+    @staticmethod
+    def _escrever_jsonl(saida: object, pedidos) -> dict:
+        quantidade = linhas = 0
+        for pedido, itens in pedidos:
+            registro = dict(zip(ExportacaoControler.CAMPOS_PEDIDO, ExportacaoControler._pedido(pedido)))
+            registro["itens"] = [dict(zip(ExportacaoControler.CAMPOS_ITEM, (nome, tipo, preco, qtd, descricao)))
+                                 for id_pedido, nome, preco, tipo, descricao, qtd in itens]
+            saida.write(json.dumps(registro, ensure_ascii=False) + '\n')
+            quantidade += 1
+            linhas += len(itens)
+        return {"pedidos": quantidade, "linhas": linhas}
+
+    @staticmethod
+    def _pedido(pedido: object) -> tuple:
+        """
+        Campos de CAMPOS_PEDIDO; a data fica no formato AAAA-MM-DD gravado no banco
+        """
+        return (pedido.id_pedido, pedido.date, pedido.status, pedido.delivery, pedido.endereco, pedido.valor_total)
+
+
+'''
+Códigos de Erro
+
+exportar_pedidos - E1 (falha ao gravar o arquivo ou ao ler o banco)
+exportar_pedidos - E2 (formato não suportado)
+
+'''
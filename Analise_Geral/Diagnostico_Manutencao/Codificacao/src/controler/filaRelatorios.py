@@ -0,0 +1,210 @@
+#import de model
+from model.database import Database
+
+import configparser
+import queue
+import threading
+import time
+from sqlite3 import Error
+
+from controler.pedidoControler import PedidoControler
+from controler.relatorioController import RelatorioControler
+
+
+class FilaRelatorios:
+    """
+    Gera os relatórios em PDF em uma thread de trabalho, um por vez, na ordem em que foram
+    solicitados, para que o menu continue atendendo (cadastro de pedidos, consultas) enquanto
+    o relatório é montado. A thread lê o banco por conexões somente leitura
+    (Database.nome_somente_leitura) e avisa quando cada PDF fica pronto.
+    """
+
+    NA_FILA = 'na fila'
+    GERANDO = 'gerando'
+    PRONTO = 'pronto'
+    ERRO = 'erro'
+
+    def __init__(self, database_name: str, aviso=print, processos: int = None) -> None:
+        """
+        :param database_name: nome do banco de dados (string)
+        :param aviso: função chamada com a mensagem de relatório pronto ou com erro (padrão print)
+        :param processos: processos usados nos relatórios grandes (padrão 1, em série; ver carregar_configuracao)
+        """
+        self.database_name = database_name
+        self.processos = processos
+        self.leitura = Database.nome_somente_leitura(database_name)
+        self.aviso = aviso
+        self.fila = queue.Queue()
+        self._trabalhos = []
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(target=self._trabalhar, name='relatorios', daemon=True)
+        self.thread.start()
+
+    @staticmethod
+    def carregar_configuracao(caminho: str) -> int:
+        """
+        Lê a opção "processos" da seção [relatorio] de um arquivo .ini: com mais de um processo,
+        os relatórios a partir de PDFParalelo.MINIMO_PEDIDOS pedidos são desenhados em paralelo.
+        Sem a seção, ou com um valor inválido, os relatórios são desenhados em série.
+
+        :param caminho: string
+        :return processos: int
+        """
+        configuracao = configparser.ConfigParser()
+        if not configuracao.read(caminho, encoding='utf-8') or not configuracao.has_section('relatorio'):
+            return 1
+        secao = configuracao['relatorio']
+        try:
+            processos = secao.getint('processos', fallback=1)
+        except ValueError:
+            processos = 0
+        if processos < 1:
+            print(f'Valor inválido para processos: {secao.get("processos")}')
+            return 1
+        return processos
+
+    def solicitar(self, inicio: str = None, fim: str = None) -> object:
+        """
+        Coloca um relatório na fila: todo o histórico ou o período de inicio a fim
+
+        :param inicio: data inicial dd/mm/aaaa (string), None para todo o histórico
+        :param fim: data final dd/mm/aaaa (string)
+        :return: número do relatório (int), False se as datas forem inválidas ou código de erro
+        """
+        if inicio:
+            resumo = PedidoControler.faturamento_periodo(self.database_name, inicio, fim)
+            if not isinstance(resumo, dict):
+                return resumo
+        with self._lock:
+            trabalho = {
+                "numero": len(self._trabalhos) + 1,
+                "arquivo": f'Relatorio{time.time()}.pdf',
+                "inicio": inicio or None,
+                "fim": fim if inicio else None,
+                "estado": FilaRelatorios.NA_FILA,
+                "feitos": 0,
+                "total": None,
+                "duracao": None,
+                "erro": None,
+            }
+            self._trabalhos.append(trabalho)
+        self.fila.put(trabalho)
+        return trabalho["numero"]
+
+    def trabalhos(self) -> list:
+        """
+        :return: cópia dos relatórios solicitados, com estado e progresso (list de dict)
+        """
+        with self._lock:
+            return [dict(trabalho) for trabalho in self._trabalhos]
+
+    def pendentes(self) -> int:
+        """
+        :return: quantidade de relatórios na fila ou em geração (int)
+        """
+        with self._lock:
+            return sum(trabalho["estado"] in (FilaRelatorios.NA_FILA, FilaRelatorios.GERANDO) for trabalho in self._trabalhos)
+
+    def encerrar(self, esperar: bool = True) -> None:
+        """
+        Encerra a thread de trabalho e fecha as conexões somente leitura
+
+        :param esperar: gera os relatórios que ainda estão na fila antes de encerrar (bool);
+                        com False eles são cancelados, mas o relatório em geração é concluído
+        """
+        if not esperar:
+            with self._lock:
+                for trabalho in self._trabalhos:
+                    if trabalho["estado"] == FilaRelatorios.NA_FILA:
+                        trabalho["estado"] = FilaRelatorios.ERRO
+                        trabalho["erro"] = 'cancelado'
+        self.fila.put(None)
+        self.thread.join()
+        Database.fechar_conexoes(self.leitura)
+
+    def _trabalhar(self) -> None:
+        while True:
+            trabalho = self.fila.get()
+            if trabalho is None:
+                break
+            if trabalho["estado"] == FilaRelatorios.NA_FILA:
+                self._gerar(trabalho)
+
+    def _gerar(self, trabalho: dict) -> None:
+        """
+        Gera um relatório, atualizando o progresso a cada pedido desenhado.
+        Qualquer erro (inclusive a falta do reportlab) marca só este relatório com ERRO:
+        a thread continua atendendo a fila.
+        """
+        trabalho["estado"] = FilaRelatorios.GERANDO
+        comeco = time.perf_counter()
+        inicio, fim = trabalho["inicio"], trabalho["fim"]
+        try:
+            #importados na primeira geração, fora da inicialização do software
+            from report.relatorio1 import PDF
+            from report.relatorioParalelo import PDFParalelo
+            from controler.cacheRelatorio import CacheRelatorio
+
+            if inicio:
+                resumo = PedidoControler.faturamento_periodo(self.leitura, inicio, fim)
+                pedidos = RelatorioControler.iter_dados_relatorio(self.leitura, inicio=inicio, fim=fim)
+                periodo = f'{inicio} a {fim}'
+            else:
+                resumo = PedidoControler.faturamento_total(self.leitura)
+                pedidos = None
+                periodo = None
+            if isinstance(resumo, dict):
+                trabalho["total"] = resumo["quantidade"]
+                faturamento = resumo["faturamento"]
+            else:
+                faturamento = None #o PDF soma durante o desenho
+            if pedidos is None:
+                #todo o histórico: as páginas dos pedidos antigos vêm do cache, só os novos são desenhados
+                gerado = CacheRelatorio.gerar_pdf(self.database_name, trabalho["arquivo"], self.leitura,
+                                                  lambda pedidos, reaproveitados: self._progresso(trabalho, pedidos, reaproveitados),
+                                                  self.processos)
+            #relatórios grandes são desenhados em vários processos quando habilitado em config.ini e o pypdf está instalado
+            elif (trabalho["total"] or 0) >= PDFParalelo.MINIMO_PEDIDOS and PDFParalelo.disponivel(self.processos):
+                gerado = PDFParalelo.gerar_pdf(trabalho["arquivo"], self._progresso(trabalho, pedidos), faturamento,
+                                               periodo, self.processos)
+            else:
+                gerado = PDF.gerar_pdf(trabalho["arquivo"], self._progresso(trabalho, pedidos), faturamento, periodo)
+        except (Error, OSError, ValueError) as e:
+            gerado = False
+            trabalho["erro"] = str(e)
+        except Exception as e:
+            #dados inesperados, BrokenProcessPool, ImportError...: a thread não pode parar
+            gerado = False
+            trabalho["erro"] = f'{type(e).__name__}: {e}'
+        trabalho["duracao"] = time.perf_counter() - comeco
+        if gerado:
+            trabalho["estado"] = FilaRelatorios.PRONTO
+            self.aviso(f'\n[Relatório {trabalho["numero"]} pronto: {trabalho["arquivo"]} '
+                       f'({trabalho["feitos"]} pedidos em {trabalho["duracao"]:.1f} s)]')
+        else:
+            trabalho["estado"] = FilaRelatorios.ERRO
+            self.aviso(f'\n[Erro ao gerar o relatório {trabalho["numero"]}: {trabalho["erro"] or "falha ao salvar o PDF"}]')
+
+    @staticmethod
+    def _progresso(trabalho: dict, pedidos, reaproveitados: int = 0):
+        trabalho["feitos"] = reaproveitados
+        for pedido in pedidos:
+            trabalho["feitos"] += 1
+            yield pedido
+
+    @staticmethod
+    def descrever(trabalho: dict) -> str:
+        """
+        Linha de acompanhamento de um relatório, ex.: "2 - gerando 45% (4500/10000) - Relatorio...pdf"
+        """
+        periodo = f'{trabalho["inicio"]} a {trabalho["fim"]}' if trabalho["inicio"] else 'todo o histórico'
+        estado = trabalho["estado"]
+        if estado == FilaRelatorios.GERANDO and trabalho["total"]:
+            estado = f'{estado} {min(100, trabalho["feitos"] * 100 // trabalho["total"])}% ({trabalho["feitos"]}/{trabalho["total"]})'
+        elif estado == FilaRelatorios.GERANDO:
+            estado = f'{estado} ({trabalho["feitos"]} pedidos)'
+        elif estado == FilaRelatorios.PRONTO:
+            estado = f'{estado} em {trabalho["duracao"]:.1f} s'
+        elif estado == FilaRelatorios.ERRO:
+            estado = f'{estado}: {trabalho["erro"] or "falha ao salvar o PDF"}'
+        return f'{trabalho["numero"]} - {periodo} - {estado} - {trabalho["arquivo"]}'
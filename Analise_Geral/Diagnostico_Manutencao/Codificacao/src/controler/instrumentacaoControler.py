@@ -0,0 +1,74 @@
+#import de model
+from model.database import Database
+from model.instrumentacao import Instrumentacao
+
+import configparser
+
+from controler.pedidoControler import PedidoControler
+from controler.itemControler import ItemControler
+from controler.relatorioController import RelatorioControler
+
+
+class InstrumentacaoControler:
+    """
+    Liga a instrumentação de desempenho (model/instrumentacao.py) nos controllers de pedidos,
+    itens e relatório e nas conexões com o banco, e exibe ou grava o resumo coletado.
+    """
+
+    #arquivo JSON gravado ao encerrar, alterado pela seção [instrumentacao] do config.ini
+    arquivo = 'instrumentacao.json'
+
+    @staticmethod
+    def ativar() -> None:
+        """
+        Mede os métodos de PedidoControler, ItemControler e RelatorioControler e passa a contar
+        os comandos SQL. As conexões ociosas do pool são fechadas para que as próximas já
+        recebam o callback de trace.
+        """
+        if Instrumentacao.ativo:
+            return
+        Instrumentacao.ativar((PedidoControler, ItemControler, RelatorioControler))
+        Database.fechar_conexoes()
+
+    @staticmethod
+    def carregar_configuracao(caminho: str) -> bool:
+        """
+        Lê a seção [instrumentacao] de um arquivo .ini: "ativo" liga a instrumentação e
+        "arquivo" define o JSON gravado ao encerrar. Sem a seção, fica desativada.
+
+        :param caminho: string
+        :return bool (True se a instrumentação foi ativada)
+        """
+        configuracao = configparser.ConfigParser()
+        if not configuracao.read(caminho, encoding='utf-8') or not configuracao.has_section('instrumentacao'):
+            return False
+        secao = configuracao['instrumentacao']
+        InstrumentacaoControler.arquivo = secao.get('arquivo', InstrumentacaoControler.arquivo)
+        try:
+            ativo = secao.getboolean('ativo', fallback=False)
+        except ValueError:
+            print(f'Valor inválido para ativo: {secao.get("ativo")}')
+            return False
+        if ativo:
+            InstrumentacaoControler.ativar()
+        return ativo
+
+    @staticmethod
+    def mostrar_resumo() -> None:
+        """
+        Exibe o resumo coletado até o momento e grava o JSON
+        """
+        if not Instrumentacao.ativo:
+            print('Instrumentação desativada (ative em config.ini, seção [instrumentacao]).')
+            return
+        print(Instrumentacao.texto())
+        if Instrumentacao.gravar(InstrumentacaoControler.arquivo):
+            print(f'\nResumo gravado em {InstrumentacaoControler.arquivo}')
+
+    @staticmethod
+    def encerrar() -> None:
+        """
+        Exibe e grava o resumo ao encerrar o software, se a instrumentação estiver ativa
+        """
+        if Instrumentacao.ativo:
+            InstrumentacaoControler.mostrar_resumo()
@@ -1,22 +1,81 @@
+import math
+
 from model.item import Item
 
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
 class ItemControler:
-    
+
+    #categorias aceitas no cadastro de itens (Janela3 e importação do menu)
+    CATEGORIAS = ('Pizza', 'Bebida', 'Sobremesa', 'Outro')
+
+    #cache do menu em memória: nome do banco -> (versão do menu, {IdItens: (IdItens, Nome, Preco, Tipo, Descricao)})
+    _cache_menu = {}
+    _cache_acertos = 0
+    _cache_faltas = 0
+
+    #carrega o menu no cache, lendo a tabela Itens apenas quando necessário
+    @staticmethod
+    def _menu(database_name: str) -> object:
+        """
+        Retorna o menu em cache do banco informado, carregando-o de Item.mostrar_itens_menu
+        na primeira consulta, após uma invalidação ou quando a versão do menu no banco
+        (Item.versao_menu) mudou: alterações feitas por outro processo, como a importação
+        do menu ou a Janela3 de outro terminal, também descartam o cache.
+
+        :param database_name: Nome do banco de dados (string).
+        :return: Dicionário IdItens -> linha do item (dict) ou código de erro (string).
+        """
+        #a versão é lida antes do menu: uma alteração entre as duas leituras só causa uma nova carga
+        versao = Item.versao_menu(database_name)
+        guardado = ItemControler._cache_menu.get(database_name)
+        if guardado is not None and not isinstance(versao, str) and guardado[0] == versao:
+            ItemControler._cache_acertos += 1
+            return guardado[1]
+        ItemControler._cache_faltas += 1
+        rows = Item.mostrar_itens_menu(database_name)
+        if isinstance(rows, str):
+            return rows
+        menu = {row[0]: row for row in rows}
+        ItemControler._cache_menu[database_name] = (versao, menu)
+        return menu
+
+    @staticmethod
+    def invalidar_cache(database_name: str = None) -> None:
+        """
+        Descarta o menu em cache, forçando uma nova leitura da tabela Itens na próxima consulta.
+
+        :param database_name: Nome do banco de dados (string), None descarta todos.
+        """
+        if database_name is None:
+            ItemControler._cache_menu.clear()
+        else:
+            ItemControler._cache_menu.pop(database_name, None)
+
+    @staticmethod
+    def estatisticas_cache() -> dict:
+        """
+        Contadores do cache do menu. Cada falta corresponde a uma leitura da tabela Itens.
+
+        :return: Dicionário com "acertos" e "faltas" (dict).
+        """
+        return {
+            "acertos": ItemControler._cache_acertos,
+            "faltas": ItemControler._cache_faltas
+        }
+
     #exibir todos os itens do menu
     @staticmethod
     def mostrar_itens_menu(database_name: str)-> object:
         """
         Chama a função que exibe todos os itens do menu no banco de dados.
+        A lista é servida pelo cache do menu.
 
         :param database_name: Nome do banco de dados a ser consultado (string).
         :return: Lista de itens (list) ou código de erro (string).
         """
-        result  = Item.mostrar_itens_menu(database_name)
+        menu = ItemControler._menu(database_name)
+        if isinstance(menu, str):
+            return menu
+        result = list(menu.values())
         return result
     
     
@@ -31,6 +90,8 @@ class ItemControler:
         :return: True se a inserção for bem-sucedida, ou código de erro (string).
         """
         result = Item.insert_into_item(database_name,data)
+        if result is True:
+            ItemControler.invalidar_cache(database_name)
         return result
     
     
@@ -41,7 +102,7 @@ class ItemControler:
         Insere a relação entre os itens e os pedidos na tabela ItensPedidos.
 
         :param database_name: Nome do banco de dados (string).
-        :param data: Lista com o `IdPedido` e `IdItem` a serem inseridos (list).
+        :param data: Lista com o `IdPedido`, o `IdItem` e, opcionalmente, a `Quantidade` a serem inseridos (list).
         :return: True se a inserção for bem-sucedida, ou código de erro (string).
         """
         result = Item.insert_into_itens_pedidos(database_name,data)
@@ -55,36 +116,157 @@ class ItemControler:
 
         :param database_name: Nome do banco de dados (string).
         :param indice: ID do pedido para o qual os itens serão consultados (int).
-        :return: Lista de itens relacionados ao pedido (list) ou código de erro (string).
+        :return: Lista de itens (Nome, Preco, Tipo, Descricao, Quantidade) relacionados ao pedido (list) ou código de erro (string).
         """
         result = Item.search_into_itens_pedidos_id(database_name,indice)
         return result
         
+    #percorre as linhas de ItensPedidos em fluxo
+    @staticmethod
+    def iter_itens_pedido(database_name: str, indice: int = None, tamanho_lote: int = 500,
+                          primeiro: int = None, ultimo: int = None):
+        """
+        Percorre as linhas de itens de um pedido (ou de todos, em ordem de `IdPedido`),
+        lendo o cursor em lotes (fetchmany).
+
+        :param database_name: Nome do banco de dados (string).
+        :param indice: ID do pedido (int), None percorre todos os pedidos.
+        :param tamanho_lote: Quantidade de linhas lidas por vez (int).
+        :param primeiro: Sem indice, menor `IdPedido` percorrido (int, opcional).
+        :param ultimo: Sem indice, maior `IdPedido` percorrido (int, opcional).
+        :return: Gerador de linhas (IdPedido, Nome, Preco, Tipo, Descricao, Quantidade).
+        """
+        result = Item.iter_itens_pedido(database_name, indice, tamanho_lote, primeiro, ultimo)
+        return result
+
+    #menu inteiro indexado pelo id, para consultar vários itens com uma única conferência da versão
+    @staticmethod
+    def menu_por_id(database_name: str) -> object:
+        """
+        Retorna o menu em cache indexado pelo `IdItens`. Cada chamada confere a versão do menu
+        uma única vez, por isso é usado quando vários itens são consultados de uma vez
+        (ex.: PedidoControler.calcular_valor_total). O dicionário não deve ser alterado.
+
+        :param database_name: Nome do banco de dados (string).
+        :return: Dicionário IdItens -> (IdItens, Nome, Preco, Tipo, Descricao) (dict) ou código de erro (string).
+        """
+        return ItemControler._menu(database_name)
+
     #valor de um item informado pelo seu indice
     @staticmethod
     def valor_item(database_name: str, indice: int)-> object:
         """
-        Retorna o valor (preço) de um item a partir do seu `IdItens`.
+        Retorna o valor (preço) de um item a partir do seu `IdItens`, consultando o cache do menu.
 
         :param database_name: Nome do banco de dados (string).
         :param indice: ID do item para o qual o preço será consultado (int).
-        :return: Lista com o valor do item pesquisado ou código de erro (string).
+        :return: Lista com o valor do item pesquisado (vazia se não existir) ou código de erro (string).
         """
-        result = Item.valor_item(database_name,indice)
+        menu = ItemControler._menu(database_name)
+        if isinstance(menu, str):
+            return menu
+        item = menu.get(indice)
+        if item is None:
+            return []
+        result = [(item[2],)]
         return result
     
     @staticmethod
     def search_item_id(database_name: str, indice:int) -> list:
         """
-        Pesquisa as informações de um item (Nome, Tipo, Descrição, Preço) pelo seu `IdItens`.
+        Pesquisa as informações de um item (Nome, Tipo, Descrição, Preço) pelo seu `IdItens`,
+        consultando o cache do menu.
 
         :param database_name: Nome do banco de dados (string).
         :param indice: ID do item para o qual as informações serão consultadas (int).
         :return: Informações do item (tuple) ou código de erro (string).
         """
-        result = Item.search_item_id(database_name,indice)
+        menu = ItemControler._menu(database_name)
+        if isinstance(menu, str):
+            return menu
+        item = menu.get(indice)
+        if item is None:
+            return []
+        result = [(item[1], item[3], item[4], item[2])]
         return result
     
+    #regras de cadastro de um item, as mesmas na Janela3 e na importação do menu
+    @staticmethod
+    def validar_nome(nome) -> tuple:
+        """
+        :return: (nome sem espaços nas pontas, None) ou (None, mensagem de erro)
+        """
+        nome = str(nome if nome is not None else '').strip()
+        if not nome:
+            return None, 'O nome do item é obrigatório!'
+        return nome, None
+
+    @staticmethod
+    def validar_descricao(descricao) -> tuple:
+        """
+        :return: (descrição sem espaços nas pontas, None) ou (None, mensagem de erro)
+        """
+        descricao = str(descricao if descricao is not None else '').strip()
+        if not descricao:
+            return None, 'A descrição é obrigatória!'
+        return descricao, None
+
+    @staticmethod
+    def validar_preco(preco) -> tuple:
+        """
+        :return: (preço (float), None) ou (None, mensagem de erro)
+        """
+        try:
+            preco = float(preco)
+        except (TypeError, ValueError):
+            return None, 'Digite um valor numérico válido!'
+        if not math.isfinite(preco):
+            return None, 'Digite um valor numérico válido!'
+        if preco <= 0:
+            return None, 'O preço deve ser maior que zero!'
+        return preco, None
+
+    @staticmethod
+    def validar_tipo(tipo) -> tuple:
+        """
+        :return: (categoria de CATEGORIAS, None) ou (None, mensagem de erro); maiúsculas e minúsculas são iguais
+        """
+        categorias = {categoria.lower(): categoria for categoria in ItemControler.CATEGORIAS}
+        categoria = categorias.get(str(tipo if tipo is not None else '').strip().lower())
+        if categoria is None:
+            return None, f'Categoria inválida! Utilize {", ".join(ItemControler.CATEGORIAS)}.'
+        return categoria, None
+
+    @staticmethod
+    def validar_item(nome, preco, tipo, descricao) -> tuple:
+        """
+        Aplica todas as regras de cadastro a um item
+
+        :return: ([nome, preco, tipo, descricao] normalizados, None) ou (None, primeira mensagem de erro)
+        """
+        dados = []
+        for validar, valor in ((ItemControler.validar_nome, nome), (ItemControler.validar_preco, preco),
+                               (ItemControler.validar_tipo, tipo), (ItemControler.validar_descricao, descricao)):
+            valor, erro = validar(valor)
+            if erro:
+                return None, erro
+            dados.append(valor)
+        return dados, None
+
+    #grava vários itens do menu em uma transação
+    @staticmethod
+    def importar_itens(database_name: str, lotes) -> object:
+        """
+        Insere ou atualiza (pelo Nome) os itens já validados e descarta o menu em cache.
+
+        :param database_name: Nome do banco de dados (string).
+        :param lotes: Iterável de listas de (linha, [nome, preco, tipo, descricao]).
+        :return: Lista de (linha, mensagem) das linhas recusadas pelo banco (list) ou código de erro (string).
+        """
+        result = Item.importar_itens(database_name, lotes)
+        ItemControler.invalidar_cache(database_name)
+        return result
+
     @staticmethod
     def create_item(data: list):
         """
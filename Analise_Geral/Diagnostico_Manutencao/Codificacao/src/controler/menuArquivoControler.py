@@ -0,0 +1,186 @@
+import csv
+import json
+import os
+import unicodedata
+from itertools import islice
+
+#import de model
+from model.item import Item
+
+from controler.itemControler import ItemControler
+
+
+class MenuArquivoControler:
+    """
+    Importação e exportação do menu (tabela Itens) em CSV, JSON ou JSON Lines (.jsonl).
+
+    Cada registro tem os campos nome, preco, tipo e descricao. A importação lê o arquivo em fluxo,
+    valida cada registro com as mesmas regras da Janela3 (ItemControler.validar_item) e grava os
+    válidos em lotes de LOTE com executemany, todos em uma transação: um item com Nome já
+    cadastrado é atualizado (restrição Produto_Unique). Registros inválidos são informados com o
+    número da linha (no JSON, a posição na lista) e não interrompem a importação.
+    """
+
+    CAMPOS = ('nome', 'preco', 'tipo', 'descricao')
+    FORMATOS = ('.csv', '.json', '.jsonl')
+
+    #itens gravados por executemany
+    LOTE = 500
+
+    @staticmethod
+    def formato(arquivo: str) -> object:
+        """
+        :return: extensão do arquivo se for um dos FORMATOS (string), None caso contrário
+        """
+        extensao = os.path.splitext(arquivo)[1].lower()
+        return extensao if extensao in MenuArquivoControler.FORMATOS else None
+
+    @staticmethod
+    def importar(database_name: str, arquivo: str) -> object:
+        """
+        Importa os itens do arquivo para o menu
+
+        :param database_name: nome do banco de dados (string)
+        :param arquivo: caminho do arquivo .csv, .json ou .jsonl (string)
+        :return: {"registros": int, "novos": int, "atualizados": int, "erros": [(linha, mensagem)]}
+                 ou código de erro (string)
+        """
+        formato = MenuArquivoControler.formato(arquivo)
+        if formato is None:
+            return 'M2'
+        if not os.path.isfile(arquivo):
+            print(f'Arquivo não encontrado: {arquivo}')
+            return 'M1'
+        antes = Item.mostrar_itens_menu(database_name)
+        if isinstance(antes, str):
+            return antes
+        erros = []
+        contagem = {"registros": 0, "validos": 0}
+
+        def validos():
+            for linha, registro in MenuArquivoControler._ler(arquivo, formato):
+                contagem["registros"] += 1
+                if isinstance(registro, str):
+                    erros.append((linha, registro))
+                    continue
+                dados, erro = ItemControler.validar_item(*(registro.get(campo) for campo in MenuArquivoControler.CAMPOS))
+                if erro:
+                    erros.append((linha, erro))
+                    continue
+                contagem["validos"] += 1
+                yield linha, dados
+
+        try:
+            registros = validos()
+            lotes = iter(lambda: list(islice(registros, MenuArquivoControler.LOTE)), [])
+            recusados = ItemControler.importar_itens(database_name, lotes)
+        except (OSError, ValueError, csv.Error) as e:
+            #arquivo ilegível ou JSON inválido: nada é gravado (a transação é desfeita)
+            print(e)
+            return 'M1'
+        if isinstance(recusados, str):
+            return recusados
+        depois = Item.mostrar_itens_menu(database_name)
+        novos = len(depois) - len(antes) if not isinstance(depois, str) else 0
+        erros.extend(recusados)
+        erros.sort()
+        return {
+            "registros": contagem["registros"],
+            "novos": novos,
+            "atualizados": contagem["validos"] - len(recusados) - novos,
+            "erros": erros,
+        }
+
+    @staticmethod
+    def exportar(database_name: str, arquivo: str) -> object:
+        """
+        Grava todos os itens do menu, em ordem de IdItens, no formato da extensão do arquivo
+
+        :param database_name: nome do banco de dados (string)
+        :param arquivo: caminho do arquivo .csv, .json ou .jsonl (string)
+        :return: quantidade de itens exportados (int) ou código de erro (string)
+        """
+        formato = MenuArquivoControler.formato(arquivo)
+        if formato is None:
+            return 'M2'
+        #direto do model, para exportar o que está no banco e não o menu em cache
+        itens = Item.mostrar_itens_menu(database_name)
+        if isinstance(itens, str):
+            return itens
+        registros = [dict(zip(MenuArquivoControler.CAMPOS, (nome, preco, tipo, descricao)))
+                     for id_item, nome, preco, tipo, descricao in sorted(itens)]
+        try:
+            with open(arquivo, 'w', newline='', encoding='utf-8') as saida:
+                if formato == '.csv':
+                    escritor = csv.DictWriter(saida, fieldnames=MenuArquivoControler.CAMPOS)
+                    escritor.writeheader()
+                    escritor.writerows(registros)
+                elif formato == '.json':
+                    json.dump(registros, saida, ensure_ascii=False, indent=2)
+                    saida.write('\n')
+                else:
+                    for registro in registros:
+                        saida.write(json.dumps(registro, ensure_ascii=False) + '\n')
+            return len(registros)
+        except OSError as e:
+            print(e)
+            return 'M3'
+
+    @staticmethod
+    def _ler(arquivo: str, formato: str):
+        """
+        Gerador de (linha, registro) do arquivo; registro é um dict com os nomes de campo
+        normalizados, ou a mensagem de erro (string) de um registro que não pôde ser lido
+        """
+        with open(arquivo, newline='', encoding='utf-8-sig') as entrada:
+            if formato == '.csv':
+                #aceita vírgula ou ponto e vírgula (padrão do Excel em português) como separador
+                primeira = entrada.readline()
+                entrada.seek(0)
+                separador = ';' if primeira.count(';') > primeira.count(',') else ','
+                leitor = csv.DictReader(entrada, delimiter=separador)
+                leitor.fieldnames = [MenuArquivoControler._campo(campo) for campo in leitor.fieldnames or []]
+                for registro in leitor:
+                    #no Excel em português o separador decimal também é a vírgula: 35,50
+                    if separador == ';' and isinstance(registro.get('preco'), str):
+                        registro['preco'] = registro['preco'].replace(',', '.')
+                    yield leitor.line_num, registro
+            elif formato == '.json':
+                #uma lista de objetos: o arquivo é lido inteiro (menus têm centenas de itens)
+                registros = json.load(entrada)
+                if not isinstance(registros, list):
+                    raise ValueError('O arquivo JSON deve conter uma lista de itens')
+                for posicao, registro in enumerate(registros, start=1):
+                    yield posicao, MenuArquivoControler._normalizar(registro)
+            else:
+                for linha, texto in enumerate(entrada, start=1):
+                    if not texto.strip():
+                        continue
+                    try:
+                        yield linha, MenuArquivoControler._normalizar(json.loads(texto))
+                    except ValueError:
+                        yield linha, 'JSON inválido!'
+
+    @staticmethod
+    def _normalizar(registro: object) -> object:
+        if not isinstance(registro, dict):
+            return 'O registro deve ser um objeto com nome, preco, tipo e descricao!'
+        return {MenuArquivoControler._campo(campo): valor for campo, valor in registro.items()}
+
+    @staticmethod
+    def _campo(nome: str) -> str:
+        """
+        Nome de campo sem acentos, espaços nas pontas e maiúsculas, ex.: " Preço" -> "preco"
+        """
+        nome = unicodedata.normalize('NFKD', str(nome)).encode('ascii', 'ignore').decode()
+        return nome.strip().lower()
+
+
+'''
+Códigos de Erro
+
+importar - M1 (arquivo inexistente, ilegível ou JSON inválido)
+importar, exportar - M2 (formato não suportado)
+exportar - M3
+
+'''
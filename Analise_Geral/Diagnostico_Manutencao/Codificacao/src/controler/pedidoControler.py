@@ -1,16 +1,24 @@
-#Necessário para realizar import em python
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
+from datetime import date, datetime
+from itertools import groupby
+from operator import itemgetter
 
 #importando a classe Pedido
 from model.pedido import Pedido
+from model.database import Database
+from controler.itemControler import ItemControler
 
 
 #definindo a classe PedidoControler, nela estão os métodos
 class PedidoControler:
+
+    #quantidade padrão de pedidos por página na listagem
+    TAMANHO_PAGINA = 20
+
+    #opções de estado exibidas nas telas
+    ESTADOS = {1: 'preparo', 2: 'pronto', 3: 'entregue'}
+
+    #estados exibidos no painel da cozinha
+    ESTADOS_ABERTOS = ('preparo', 'pronto')
     
     #adiciona um pedido ao banco de dados
     @staticmethod
@@ -25,6 +33,42 @@ class PedidoControler:
        result  = Pedido.insert_into_pedidos(database_name,data)
        return result
         
+    #adiciona um pedido e seus itens ao banco de dados em uma única transação
+    @staticmethod
+    def criar_pedido_completo(database_name: str, pedido: object, itens: list) -> object:
+        """
+        Adiciona um novo pedido e todos os seus itens em uma única transação.
+
+        :param database_name: Nome do banco de dados (string)
+        :param pedido: Objeto contendo os dados do pedido (Pedido)
+        :param itens: Lista de tuplas (IdItem, Quantidade), uma por item do pedido (list)
+        :return: IdPedido gerado (int), código de erro caso contrário
+        """
+        result = Pedido.criar_pedido_completo(database_name, pedido, itens)
+        return result
+
+    #calcula o valor total de um pedido com os preços do menu
+    @staticmethod
+    def calcular_valor_total(database_name: str, itens: list) -> object:
+        """
+        Soma preço x quantidade de cada item do pedido, consultando o cache do menu
+        (a versão do menu é conferida uma única vez por pedido).
+
+        :param database_name: Nome do banco de dados (string)
+        :param itens: Lista de tuplas (IdItem, Quantidade) (list)
+        :return: Valor total (float), ou False se algum item não existir ou a quantidade não for positiva
+        """
+        menu = ItemControler.menu_por_id(database_name)
+        if isinstance(menu, str):
+            return False
+        valor_total = 0
+        for item, quantidade in itens:
+            linha = menu.get(item)
+            if linha is None or quantidade <= 0:
+                return False
+            valor_total += linha[2] * quantidade
+        return round(valor_total, 2)
+
     #busca todos os pedidos existentes    
     @staticmethod
     def search_in_pedidos_all(database_name: str) -> list:
@@ -32,17 +76,11 @@ class PedidoControler:
         Recupera todos os pedidos do banco de dados.
         
         :param database_name: Nome do banco de dados (string)
-        :return: Lista de todos os pedidos, ou código de erro em caso de falha
+        :return: Lista de todos os pedidos (Pedido, com id_pedido), ou lista vazia em caso de falha
         """
-        search = Pedido.search_in_pedidos_all(database_name)
-        result=[]
-        new_item = ''
-        if len(search)>0:            
-            for elem in search:
-
-                new_item = Pedido(elem[1],elem[2],elem[3],elem[4],elem[5])
-                result.append(new_item)
-
+        result = Pedido.search_in_pedidos_all(database_name)
+        if isinstance(result, str):
+            return []
         return result
         
         
@@ -69,17 +107,289 @@ class PedidoControler:
         :param status: Novo estado do pedido a ser atualizado (int)
         :return: Dados do pedido (list) ou código de erro (string).
         """
-        if status==1:
-            status = 'preparo'
-        elif status==2:
-            status = 'pronto'
-        elif status==3:
-            status = 'entregue'
-        else:
+        status = PedidoControler.ESTADOS.get(status)
+        if status is None:
             return False
         result = Pedido.update_pedido_status(database_name, indice, status)
         return result
     
+    #busca todos os pedidos com seus itens em uma única consulta
+    @staticmethod
+    def search_pedidos_com_itens(database_name: str) -> list:
+        """
+        Recupera todos os pedidos com os seus itens, ordenados pelo ID do pedido.
+
+        :param database_name: Nome do banco de dados (string)
+        :return: Lista de linhas (IdPedido, Data, ValorTotal, Nome, Preco, Tipo, Descricao, Quantidade),
+                 ou código de erro em caso de falha
+        """
+        result = Pedido.search_pedidos_com_itens(database_name)
+        return result
+
+    #percorre todos os pedidos com seus itens em fluxo
+    @staticmethod
+    def iter_pedidos_com_itens(database_name: str, tamanho_lote: int = 500, inicio=None, fim=None, a_partir_de: int = None):
+        """
+        Percorre todos os pedidos com os seus itens, lendo o cursor em lotes (fetchmany).
+        Se inicio e fim forem informados, apenas os pedidos do período são percorridos.
+
+        :param database_name: Nome do banco de dados (string)
+        :param tamanho_lote: Quantidade de linhas lidas por vez (int)
+        :param inicio: Data inicial (date ou string dd/mm/AAAA, opcional)
+        :param fim: Data final (date ou string dd/mm/AAAA, opcional)
+        :param a_partir_de: Apenas pedidos com IdPedido maior que este (int, opcional)
+        :return: Gerador de linhas (IdPedido, Data, ValorTotal, Nome, Preco, Tipo, Descricao, Quantidade)
+        """
+        if inicio is not None and fim is not None:
+            inicio = PedidoControler.converter_data(inicio)
+            fim = PedidoControler.converter_data(fim)
+        return Pedido.iter_pedidos_com_itens(database_name, tamanho_lote, inicio, fim, a_partir_de)
+
+    #assinatura de uma faixa de pedidos, usada para validar partes do relatório em cache
+    @staticmethod
+    def assinatura_pedidos(database_name: str, primeiro: int, ultimo: int) -> object:
+        """
+        :param database_name: Nome do banco de dados (string)
+        :param primeiro: Primeiro IdPedido da faixa (int)
+        :param ultimo: Último IdPedido da faixa (int)
+        :return: Lista [pedidos, soma dos valores, soma das datas, menor id, maior id] ou código de erro
+        """
+        result = Pedido.assinatura_pedidos(database_name, primeiro, ultimo)
+        if isinstance(result, str):
+            return result
+        return list(result)
+
+    @staticmethod
+    def proximo_pedido(database_name: str, referencia: int) -> object:
+        """
+        :param database_name: Nome do banco de dados (string)
+        :param referencia: IdPedido de referência (int)
+        :return: Menor IdPedido maior que referencia (int), None se não houver, ou código de erro
+        """
+        return Pedido.proximo_pedido(database_name, referencia)
+
+    #percorre os pedidos em fluxo, com filtro opcional
+    @staticmethod
+    def iter_pedidos(database_name: str, filtro: dict = None, tamanho_lote: int = 500):
+        """
+        Percorre os pedidos em ordem de IdPedido, lendo o cursor em lotes (fetchmany).
+        Pode ser encadeado com outros geradores sem carregar todos os pedidos em memória.
+
+        :param database_name: Nome do banco de dados (string)
+        :param filtro: Dicionário com "status" (string), "inicio" e "fim" (date ou string dd/mm/AAAA), todos opcionais
+        :param tamanho_lote: Quantidade de pedidos lidos por vez (int)
+        :return: Gerador de Pedido (com id_pedido), ou False se alguma data for inválida
+        """
+        filtro = dict(filtro or {})
+        for chave in ('inicio', 'fim'):
+            if filtro.get(chave) is not None:
+                filtro[chave] = PedidoControler.converter_data(filtro[chave])
+                if filtro[chave] is None:
+                    return False
+        return Pedido.iter_pedidos(database_name, filtro.get('status'), filtro.get('inicio'),
+                                   filtro.get('fim'), tamanho_lote)
+
+    #percorre os pedidos filtrados junto com as linhas de itens de cada um
+    @staticmethod
+    def iter_pedidos_com_linhas(database_name: str, filtro: dict = None, tamanho_lote: int = 500):
+        """
+        Une, em uma passada, o fluxo de iter_pedidos com o fluxo de linhas de ItensPedidos
+        (ItemControler.iter_itens_pedido), ambos em ordem de IdPedido. As linhas de itens são
+        lidas só na faixa de IdPedido dos pedidos filtrados; a memória usada não depende da
+        quantidade de pedidos.
+
+        :param database_name: Nome do banco de dados (string)
+        :param filtro: Dicionário com "status" (string), "inicio" e "fim" (date ou string dd/mm/AAAA), todos opcionais
+        :param tamanho_lote: Quantidade de linhas lidas por vez em cada cursor (int)
+        :return: Gerador de (Pedido, lista de linhas (IdPedido, Nome, Preco, Tipo, Descricao, Quantidade)),
+                 False se alguma data for inválida ou código de erro
+        """
+        pedidos = PedidoControler.iter_pedidos(database_name, filtro, tamanho_lote)
+        if pedidos is False:
+            return False
+        filtro = filtro or {}
+        inicio = PedidoControler.converter_data(filtro['inicio']) if filtro.get('inicio') is not None else None
+        fim = PedidoControler.converter_data(filtro['fim']) if filtro.get('fim') is not None else None
+        faixa = Pedido.faixa_pedidos(database_name, filtro.get('status'), inicio, fim)
+        if isinstance(faixa, str):
+            return faixa
+        if faixa[0] is None:
+            return iter(())
+        linhas = ItemControler.iter_itens_pedido(database_name, tamanho_lote=tamanho_lote,
+                                                 primeiro=faixa[0], ultimo=faixa[1])
+        return PedidoControler._unir_linhas(pedidos, linhas)
+
+    @staticmethod
+    def _unir_linhas(pedidos, linhas):
+        linha = next(linhas, None)
+        for pedido in pedidos:
+            while linha is not None and linha[0] < pedido.id_pedido:
+                linha = next(linhas, None)
+            itens = []
+            while linha is not None and linha[0] == pedido.id_pedido:
+                itens.append(linha)
+                linha = next(linhas, None)
+            yield pedido, itens
+
+    #lista uma página de pedidos (paginação por chave sobre IdPedido)
+    @staticmethod
+    def listar_pedidos_pagina(database_name: str, referencia: int = 0, tamanho: int = None, anterior: bool = False) -> list:
+        """
+        Recupera uma página de pedidos. Para a próxima página informe como referência o último
+        IdPedido exibido; para a anterior, o primeiro IdPedido exibido com anterior=True.
+
+        :param database_name: Nome do banco de dados (string)
+        :param referencia: IdPedido de referência (int), 0 para a primeira página
+        :param tamanho: Quantidade de pedidos por página (int), padrão TAMANHO_PAGINA
+        :param anterior: Busca a página anterior à referência (bool)
+        :return: Lista de pedidos (IdPedido, Status, Delivery, Endereco, Data, ValorTotal), ou código de erro
+        """
+        if tamanho is None or tamanho <= 0:
+            tamanho = PedidoControler.TAMANHO_PAGINA
+        result = Pedido.search_pedidos_pagina(database_name, referencia, tamanho, anterior)
+        return result
+
+    #faturamento de todos os pedidos
+    @staticmethod
+    def faturamento_total(database_name: str) -> object:
+        """
+        Calcula o faturamento e a quantidade de todos os pedidos com uma consulta agregada.
+
+        :param database_name: Nome do banco de dados (string)
+        :return: Dicionário {"faturamento": float, "quantidade": int, "delivery": int, "retirada": int}
+                 ou código de erro em caso de falha
+        """
+        result = Pedido.faturamento_total(database_name)
+        if isinstance(result, str):
+            return result
+        return PedidoControler._resumo(result)
+
+    #faturamento da loja em um período definido pelo usuário
+    @staticmethod
+    def faturamento_periodo(database_name: str, inicio, fim) -> object:
+        """
+        Calcula o faturamento e a quantidade de pedidos entre duas datas (inclusive).
+
+        :param database_name: Nome do banco de dados (string)
+        :param inicio: Data inicial (date ou string dd/mm/AAAA)
+        :param fim: Data final (date ou string dd/mm/AAAA)
+        :return: Dicionário {"faturamento": float, "quantidade": int, "delivery": int, "retirada": int},
+                 False se alguma data for inválida ou código de erro em caso de falha
+        """
+        inicio = PedidoControler.converter_data(inicio)
+        fim = PedidoControler.converter_data(fim)
+        if inicio is None or fim is None:
+            return False
+        result = Pedido.faturamento_periodo(database_name, inicio, fim)
+        if isinstance(result, str):
+            return result
+        return PedidoControler._resumo(result)
+
+    #resumo de cada dia de um período
+    @staticmethod
+    def resumo_diario(database_name: str, inicio, fim) -> object:
+        """
+        Recupera o resumo de cada dia com pedidos entre duas datas (inclusive).
+
+        :param database_name: Nome do banco de dados (string)
+        :param inicio: Data inicial (date ou string dd/mm/AAAA)
+        :param fim: Data final (date ou string dd/mm/AAAA)
+        :return: Lista de dicionários {"data" (dd/mm/AAAA), "faturamento", "quantidade", "delivery", "retirada"},
+                 False se alguma data for inválida ou código de erro em caso de falha
+        """
+        inicio = PedidoControler.converter_data(inicio)
+        fim = PedidoControler.converter_data(fim)
+        if inicio is None or fim is None:
+            return False
+        result = Pedido.search_resumo_diario(database_name, inicio, fim)
+        if isinstance(result, str):
+            return result
+        lista = []
+        for linha in result:
+            dia = PedidoControler._resumo((linha[2], linha[1], linha[3], linha[4]))
+            dia["data"] = PedidoControler.formatar_data(linha[0])
+            lista.append(dia)
+        return lista
+
+    @staticmethod
+    def _resumo(linha: tuple) -> dict:
+        """
+        Converte uma linha (faturamento, pedidos, delivery, retirada) do resumo em dicionário.
+        """
+        return {"faturamento": linha[0], "quantidade": linha[1], "delivery": linha[2], "retirada": linha[3]}
+
+    #pedidos em aberto agrupados por estado, para o painel da cozinha
+    @staticmethod
+    def fila_cozinha(database_name: str) -> object:
+        """
+        Recupera os pedidos em preparo e prontos com os seus itens, em uma única consulta.
+
+        :param database_name: Nome do banco de dados (string)
+        :return: Dicionário estado -> lista de {"id": int, "delivery": str, "itens": [(Nome, Quantidade)]},
+                 ou código de erro em caso de falha
+        """
+        result = Pedido.search_fila_cozinha(database_name, PedidoControler.ESTADOS_ABERTOS)
+        if isinstance(result, str):
+            return result
+        fila = {estado: [] for estado in PedidoControler.ESTADOS_ABERTOS}
+        for (estado, id_pedido, delivery), linhas in groupby(result, key=itemgetter(0, 1, 2)):
+            itens = [(linha[3], linha[4]) for linha in linhas if linha[3] is not None]
+            fila[estado].append({"id": id_pedido, "delivery": delivery, "itens": itens})
+        return fila
+
+    #conexão dedicada usada apenas para detectar alterações no banco
+    @staticmethod
+    def abrir_monitor(database_name: str) -> object:
+        """
+        Abre uma conexão fora do pool, usada só para ler PRAGMA data_version (ver versao_dados).
+
+        :param database_name: Nome do banco de dados (string)
+        :return: Conexão (object) ou código de erro
+        """
+        result = Database.conect_database(database_name)
+        return result
+
+    @staticmethod
+    def versao_dados(conn: object) -> object:
+        """
+        Contador de alterações do banco: muda quando qualquer outra conexão confirma uma alteração.
+
+        :param conn: Conexão aberta por abrir_monitor (object)
+        :return: Versão (int) ou código de erro
+        """
+        result = Database.versao_dados(conn)
+        return result
+
+    #converte uma data informada pelo usuário para o formato gravado no banco
+    @staticmethod
+    def converter_data(data) -> str:
+        """
+        Converte uma data (date ou string dd/mm/AAAA) para o formato AAAA-MM-DD usado no banco.
+
+        :param data: Data a ser convertida (date ou string)
+        :return: Data no formato AAAA-MM-DD (string) ou None se for inválida
+        """
+        if isinstance(data, date):
+            return data.isoformat()
+        try:
+            return datetime.strptime(str(data).strip(), '%d/%m/%Y').date().isoformat()
+        except ValueError:
+            return None
+
+    #converte uma data gravada no banco para exibição
+    @staticmethod
+    def formatar_data(data: str) -> str:
+        """
+        Converte uma data no formato AAAA-MM-DD para dd/mm/AAAA.
+
+        :param data: Data gravada no banco (string)
+        :return: Data no formato dd/mm/AAAA (string), ou o valor recebido se não estiver em AAAA-MM-DD
+        """
+        try:
+            return datetime.strptime(data, '%Y-%m-%d').strftime('%d/%m/%Y')
+        except (TypeError, ValueError):
+            return data
+
     @staticmethod
     def get_id_all(database_name):
         lista = []
@@ -92,7 +402,7 @@ class PedidoControler:
         
 #---------------MANUTENÇÕES---------------#
 #pefectiva - atualizar estado do pedido - fazendo
-#perfectiva - saber quanto está sendo o faturamento da loja em um período definido pelo usuário
+#perfectiva - saber quanto está sendo o faturamento da loja em um período definido pelo usuário - feita
     
 #adaptiva - mostrar todos os pedidos - feita
 #adaptativa - migrar de txt para um banco de dados sqlite3 - não se aplica
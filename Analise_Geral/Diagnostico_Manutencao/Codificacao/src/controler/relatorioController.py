@@ -1,17 +1,8 @@
-#necessário para importar arquivos de outras pastas
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
-
-#responsável por gerar o pdf
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
+from itertools import groupby
+from operator import itemgetter
 
 #import dos controladores
 from controler.pedidoControler import PedidoControler
-from controler.itemControler import ItemControler
 
 class RelatorioControler:
     """
@@ -35,32 +26,86 @@ class RelatorioControler:
                     "id": int,
                     "data": str,
                     "valor": float,
-                    "itens": list  # Lista de tuplas ou listas com detalhes do item
+                    "itens": list  # Lista de tuplas (Nome, Preco, Tipo, Descricao, Quantidade)
                 },
                 ...
             ],
             "faturamento_total": float
         }
         """
-        id_pedidos = PedidoControler.get_id_all(database_name) #criado para evitar modificar o model pedido.py
-        pedidos = PedidoControler.search_in_pedidos_all(database_name)
-        dados_relatorio = []
-        faturamento_total = 0
-        for id_pedido, pedido in zip(id_pedidos, pedidos):
-            itens_pedido = ItemControler.search_into_itens_pedidos_id(database_name, id_pedido)
-            itens_detalhados = []
-            for item in itens_pedido:
-                itens_detalhados.append(item)
-            dados_relatorio.append({
-                "id": id_pedido,
-                "data": pedido.date,
-                "valor": pedido.valor_total,
-                "itens": itens_detalhados
-            })
-            faturamento_total += pedido.valor_total
-        # print(dados_relatorio)
-        # print(faturamento_total)
+        # uma única consulta (JOIN ordenado por pedido) agrupada em uma passada
+        linhas = PedidoControler.search_pedidos_com_itens(database_name)
+        if isinstance(linhas, str):
+            linhas = []
+        dados_relatorio = list(RelatorioControler._agrupar_pedidos(linhas))
+        faturamento_total = RelatorioControler.faturamento_total(database_name)
+        if faturamento_total is None:
+            faturamento_total = sum(pedido["valor"] for pedido in dados_relatorio)
         return {
             "pedidos": dados_relatorio,
             "faturamento_total": faturamento_total
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def iter_dados_relatorio(database_name: str, tamanho_lote: int = 500, inicio=None, fim=None, a_partir_de: int = None):
+        """
+        Versão em fluxo de preparar_dados_relatorio: entrega um pedido por vez, lido do
+        cursor em lotes, de forma que a memória não cresce com o histórico de pedidos.
+        O faturamento total fica a cargo de quem consome (PDF.gerar_pdf soma durante o desenho).
+
+        :param database_name: Nome do banco de dados a ser utilizado.
+        :type database_name: str
+        :param tamanho_lote: Quantidade de linhas lidas do cursor por vez.
+        :type tamanho_lote: int
+        :param inicio: Data inicial do período (date ou dd/mm/AAAA), opcional.
+        :param fim: Data final do período (date ou dd/mm/AAAA), opcional.
+        :param a_partir_de: Apenas pedidos com IdPedido maior que este (int), opcional.
+        :return: Gerador de dicionários no formato de cada elemento de "pedidos".
+        """
+        linhas = PedidoControler.iter_pedidos_com_itens(database_name, tamanho_lote, inicio, fim, a_partir_de)
+        return RelatorioControler._agrupar_pedidos(linhas)
+
+    @staticmethod
+    def faturamento_total(database_name: str) -> object:
+        """
+        Faturamento de todo o histórico para o rodapé do relatório, lido do resumo diário.
+
+        :param database_name: Nome do banco de dados a ser utilizado.
+        :return: Faturamento (float), ou None em caso de falha (o PDF soma durante o desenho).
+        """
+        result = PedidoControler.faturamento_total(database_name)
+        if isinstance(result, dict):
+            return result["faturamento"]
+        return None
+
+    @staticmethod
+    def faturamento_periodo(database_name: str, inicio, fim) -> object:
+        """
+        Faturamento do período para o rodapé do relatório, lido do resumo diário.
+
+        :param database_name: Nome do banco de dados a ser utilizado.
+        :param inicio: Data inicial do período (date ou dd/mm/AAAA).
+        :param fim: Data final do período (date ou dd/mm/AAAA).
+        :return: Faturamento (float), ou False / código de erro em caso de falha.
+        """
+        result = PedidoControler.faturamento_periodo(database_name, inicio, fim)
+        if isinstance(result, dict):
+            return result["faturamento"]
+        return result
+
+    @staticmethod
+    def _agrupar_pedidos(linhas):
+        """
+        Agrupa, em uma passada, as linhas do JOIN ordenado por IdPedido em um dicionário por pedido.
+
+        :param linhas: Iterável de linhas (IdPedido, Data, ValorTotal, Nome, Preco, Tipo, Descricao, Quantidade).
+        :return: Gerador de dicionários {"id", "data", "valor", "itens"}.
+        """
+        for id_pedido, linhas_pedido in groupby(linhas, key=itemgetter(0)):
+            linhas_pedido = list(linhas_pedido)
+            yield {
+                "id": id_pedido,
+                "data": PedidoControler.formatar_data(linhas_pedido[0][1]),
+                "valor": linhas_pedido[0][2],
+                "itens": [linha[3:] for linha in linhas_pedido]
+            }
@@ -0,0 +1,451 @@
+import os
+from operator import itemgetter
+from sqlite3 import Error
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from model.database import Database
+from model.consultas import Consultas
+
+
+class ArquivoMorto:
+    """
+    Arquivo morto: pedidos entregues há mais de alguns dias, com as suas linhas de ItensPedidos,
+    são movidos para outro arquivo SQLite ao lado do banco (TESTE.db -> TESTE_arquivo.db).
+    O banco principal fica só com o movimento recente e as consultas do dia a dia continuam
+    pequenas; os índices, o cache de páginas e os backups deixam de crescer com o histórico.
+
+    O arquivo tem as tabelas Pedidos, ItensPedidos e ResumoDiario (com o resumo dos pedidos
+    arquivados), sem gatilhos. As consultas que podem chegar a pedidos arquivados anexam o
+    arquivo à conexão (ATTACH ... AS arquivo) e leem as duas partes: a decisão é feita pelos
+    limites do arquivo (maior data e maior IdPedido arquivados), guardados em memória
+    enquanto o arquivo não muda. Uma consulta de período posterior à última data arquivada,
+    ou de um pedido mais novo que o último arquivado, não abre o arquivo.
+
+    Como Pedidos usa AUTOINCREMENT, um IdPedido arquivado nunca volta a ser usado no banco principal.
+    """
+
+    #TESTE.db -> TESTE_arquivo.db
+    SUFIXO = '_arquivo'
+
+    #nome do banco anexado, usado nas consultas (Consultas.no_arquivo)
+    ESQUEMA = 'arquivo'
+
+    #apenas pedidos neste estado são arquivados
+    STATUS = 'entregue'
+
+    #padrões do comando "python comandos.py arquivar"
+    DIAS = 90
+    LOTE = 5000
+
+    #mesmas colunas (e na mesma ordem) das tabelas do banco principal, sem chaves estrangeiras:
+    #Itens não é copiada, as linhas arquivadas continuam apontando para o menu do banco principal
+    TABELAS = (
+        '''CREATE TABLE IF NOT EXISTS Pedidos (
+            IdPedido INTEGER PRIMARY KEY,
+            Status VARCHAR(30) NOT NULL,
+            Delivery BOLL,
+            Endereco VARCHAR(100),
+            Data DATE,
+            ValorTotal REAL NOT NULL
+        );''',
+        '''CREATE TABLE IF NOT EXISTS ItensPedidos (
+            Id INTEGER PRIMARY KEY,
+            IdPedido INTEGER NOT NULL,
+            IdItem INTEGER NOT NULL,
+            Quantidade INTEGER NOT NULL DEFAULT 1
+        );''',
+        '''CREATE TABLE IF NOT EXISTS ResumoDiario (
+            Data DATE NOT NULL PRIMARY KEY,
+            Pedidos INTEGER NOT NULL DEFAULT 0,
+            Faturamento REAL NOT NULL DEFAULT 0,
+            Delivery INTEGER NOT NULL DEFAULT 0,
+            Retirada INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID;''',
+        'CREATE INDEX IF NOT EXISTS idx_pedidos_data ON Pedidos (Data, ValorTotal);',
+        'CREATE INDEX IF NOT EXISTS idx_itens_pedidos_pedido ON ItensPedidos (IdPedido);',
+    )
+
+    #pedidos do lote atual do arquivamento
+    LOTE_TEMPORARIO = 'CREATE TEMP TABLE IF NOT EXISTS LoteArquivo (IdPedido INTEGER PRIMARY KEY);'
+
+    #a busca usa idx_pedidos_fila (Status, IdPedido, ...): os pedidos mais antigos vêm primeiro
+    SELECIONAR_LOTE = '''
+        INSERT INTO temp.LoteArquivo (IdPedido)
+        SELECT IdPedido FROM main.Pedidos
+        WHERE Status = ? AND Data < ?
+        ORDER BY IdPedido ASC LIMIT ?;
+    '''
+
+    #pedidos do lote que ainda não estão no arquivo (um lote interrompido entre as duas transações
+    #é selecionado de novo e só é apagado do banco principal)
+    _NOVOS = 'p.IdPedido IN temp.LoteArquivo AND p.IdPedido NOT IN (SELECT IdPedido FROM arquivo.Pedidos)'
+
+    COPIAR_RESUMO = f'''
+        INSERT INTO arquivo.ResumoDiario (Data, Pedidos, Faturamento, Delivery, Retirada)
+        SELECT p.Data, COUNT(*), ROUND(SUM(p.ValorTotal), 2),
+               SUM({Database._DELIVERY.format('p')}), SUM(1 - {Database._DELIVERY.format('p')})
+        FROM main.Pedidos p
+        WHERE {_NOVOS}
+        GROUP BY p.Data
+        ON CONFLICT(Data) DO UPDATE SET
+            Pedidos = Pedidos + excluded.Pedidos,
+            Faturamento = ROUND(Faturamento + excluded.Faturamento, 2),
+            Delivery = Delivery + excluded.Delivery,
+            Retirada = Retirada + excluded.Retirada;
+    '''
+
+    COPIAR_ITENS = f'''
+        INSERT INTO arquivo.ItensPedidos (Id, IdPedido, IdItem, Quantidade)
+        SELECT ip.Id, ip.IdPedido, ip.IdItem, ip.Quantidade
+        FROM main.ItensPedidos ip
+        JOIN main.Pedidos p ON p.IdPedido = ip.IdPedido
+        WHERE {_NOVOS};
+    '''
+
+    COPIAR_PEDIDOS = f'''
+        INSERT INTO arquivo.Pedidos (IdPedido, Status, Delivery, Endereco, Data, ValorTotal)
+        SELECT p.IdPedido, p.Status, p.Delivery, p.Endereco, p.Data, p.ValorTotal
+        FROM main.Pedidos p
+        WHERE {_NOVOS};
+    '''
+
+    #só o que já está confirmado no arquivo sai do banco principal; os gatilhos atualizam o ResumoDiario dele
+    APAGAR_ITENS = '''
+        DELETE FROM main.ItensPedidos
+        WHERE IdPedido IN temp.LoteArquivo AND IdPedido IN (SELECT IdPedido FROM arquivo.Pedidos);
+    '''
+
+    APAGAR_PEDIDOS = '''
+        DELETE FROM main.Pedidos
+        WHERE IdPedido IN temp.LoteArquivo AND IdPedido IN (SELECT IdPedido FROM arquivo.Pedidos);
+    '''
+
+    #caminho do arquivo -> (mtime e tamanho do arquivo e do -wal, limites)
+    _limites = {}
+
+    @staticmethod
+    def nome(database_name: str) -> object:
+        """
+        Nome do arquivo morto de um banco, no mesmo formato do nome recebido: "TESTE.db" ->
+        "TESTE_arquivo.db" e "file:///.../TESTE.db?mode=ro" -> "file:///.../TESTE_arquivo.db?mode=ro"
+
+        :param database_name: string
+        :return string || None para bancos em memória
+        """
+        if database_name == ':memory:' or database_name.startswith('file::memory:') or 'mode=memory' in database_name:
+            return None
+        caminho, separador, parametros = database_name, '', ''
+        if database_name.startswith('file:'):
+            caminho, separador, parametros = database_name.partition('?')
+        raiz, extensao = os.path.splitext(caminho)
+        return f'{raiz}{ArquivoMorto.SUFIXO}{extensao}{separador}{parametros}'
+
+    @staticmethod
+    def _caminho(nome: str) -> str:
+        """
+        Caminho no sistema de arquivos de um nome de banco (comum ou URI "file:")
+        """
+        if nome.startswith('file:'):
+            return url2pathname(urlparse(nome).path)
+        return nome
+
+    @staticmethod
+    def limites(database_name: str) -> object:
+        """
+        Maior Data e maior IdPedido do arquivo morto. Ficam em memória e só são lidos de novo
+        quando o arquivo (ou o seu -wal) muda de data de modificação ou de tamanho.
+
+        :param database_name: nome do banco principal (string)
+        :return tuple (data, id_pedido) || None se não houver arquivo ou ele estiver vazio
+        """
+        nome = ArquivoMorto.nome(database_name)
+        if nome is None:
+            return None
+        caminho = ArquivoMorto._caminho(nome)
+        try:
+            estado = os.stat(caminho)
+        except OSError:
+            return None
+        try:
+            wal = os.stat(f'{caminho}-wal')
+            wal = (wal.st_mtime_ns, wal.st_size)
+        except OSError:
+            wal = None
+        versao = (estado.st_mtime_ns, estado.st_size, wal)
+        guardado = ArquivoMorto._limites.get(caminho)
+        if guardado is not None and guardado[0] == versao:
+            return guardado[1]
+        try:
+            with Database.conexao(nome) as conn:
+                row = conn.execute(Consultas.LIMITES_ARQUIVO).fetchone()
+        except (OSError, Error) as e:
+            print(e)
+            return None
+        limites = tuple(row) if row[1] is not None else None
+        ArquivoMorto._limites[caminho] = (versao, limites)
+        return limites
+
+    @staticmethod
+    def necessario(database_name: str, data: str = None, id_pedido: int = None, status: str = None) -> bool:
+        """
+        Indica se uma consulta precisa ler também o arquivo morto
+
+        :param database_name: nome do banco principal (string)
+        :param data: a consulta começa nesta data, AAAA-MM-DD (string, opcional)
+        :param id_pedido: a consulta começa neste IdPedido (int, opcional)
+        :param status: a consulta só lê pedidos neste estado (string, opcional)
+        :return bool
+        """
+        if status is not None and status != ArquivoMorto.STATUS:
+            return False
+        limites = ArquivoMorto.limites(database_name)
+        if limites is None:
+            return False
+        if data is not None and data > limites[0]:
+            return False
+        if id_pedido is not None and id_pedido > limites[1]:
+            return False
+        return True
+
+    @staticmethod
+    def anexar(conn: object, database_name: str) -> bool:
+        """
+        Anexa o arquivo morto à conexão como "arquivo", se ainda não estiver anexado.
+        Não pode ser chamado com uma transação aberta na conexão.
+
+        :param conn: conexão com o banco principal (object)
+        :param database_name: nome do banco principal (string)
+        :return bool
+        """
+        nome = ArquivoMorto.nome(database_name)
+        if nome is None:
+            return False
+        if any(linha[1] == ArquivoMorto.ESQUEMA for linha in conn.execute('PRAGMA database_list;')):
+            return True
+        conn.execute(f'ATTACH DATABASE ? AS {ArquivoMorto.ESQUEMA};', (nome,))
+        return True
+
+    @staticmethod
+    def consultar(conn: object, database_name: str, consulta: str, parametros: tuple = ()) -> list:
+        """
+        Executa no arquivo morto uma consulta escrita para o banco principal (ver Consultas.no_arquivo)
+
+        :param conn: conexão com o banco principal, sem transação aberta (object)
+        :param database_name: nome do banco principal (string)
+        :param consulta: consulta SQL (string)
+        :param parametros: tuple
+        :return lista de linhas
+        """
+        ArquivoMorto.anexar(conn, database_name)
+        return conn.execute(Consultas.no_arquivo(consulta), parametros).fetchall()
+
+    @staticmethod
+    def iterar(database_name: str, consulta: str, parametros: tuple = (), tamanho_lote: int = 500, fabrica=None,
+               chave=itemgetter(0)):
+        """
+        Versão de Database.iterar que também lê o arquivo morto: a consulta (ordenada por
+        IdPedido) é executada nos dois bancos, na mesma transação de leitura, e os dois
+        resultados são intercalados em ordem.
+
+        :param database_name: string
+        :param consulta: consulta SQL ordenada pela chave (string)
+        :param parametros: tuple
+        :param tamanho_lote: quantidade de linhas lidas por fetchmany (int)
+        :param fabrica: row_factory dos cursores, ex.: Pedido.da_linha (opcional)
+        :param chave: função que extrai o IdPedido de uma linha (padrão: primeira coluna)
+        :return gerador de linhas
+        """
+        with Database.conexao(database_name) as conn:
+            ArquivoMorto.anexar(conn, database_name)
+            quente = conn.cursor()
+            arquivo = conn.cursor()
+            if fabrica is not None:
+                quente.row_factory = arquivo.row_factory = fabrica
+            quente.execute('BEGIN;')
+            quente.execute(consulta, parametros)
+            arquivo.execute(Consultas.no_arquivo(consulta), parametros)
+            yield from ArquivoMorto._intercalar(Database.lotes(quente, tamanho_lote),
+                                                Database.lotes(arquivo, tamanho_lote), chave)
+
+    @staticmethod
+    def _intercalar(quentes, arquivados, chave):
+        """
+        Intercala duas sequências em ordem crescente de chave. Um pedido que está nas duas
+        (copiado para o arquivo e ainda não apagado do banco principal) sai só com as linhas
+        do banco principal.
+        """
+        fim = object()
+        arquivado = next(arquivados, fim)
+        for linha in quentes:
+            atual = chave(linha)
+            while arquivado is not fim and chave(arquivado) < atual:
+                yield arquivado
+                arquivado = next(arquivados, fim)
+            while arquivado is not fim and chave(arquivado) == atual:
+                arquivado = next(arquivados, fim)
+            yield linha
+        if arquivado is not fim:
+            yield arquivado
+            yield from arquivados
+
+    @staticmethod
+    def unir(quentes: list, arquivados: list, decrescente: bool = False) -> list:
+        """
+        Une duas listas de linhas com o IdPedido na primeira coluna, sem repetir pedidos
+
+        :return lista ordenada por IdPedido
+        """
+        linhas = {linha[0]: linha for linha in arquivados}
+        linhas.update((linha[0], linha) for linha in quentes)
+        return [linhas[chave] for chave in sorted(linhas, reverse=decrescente)]
+
+    @staticmethod
+    def somar_resumo(quente: tuple, arquivado: tuple) -> tuple:
+        """
+        Soma duas linhas (faturamento, pedidos, pedidos delivery, pedidos retirada)
+        """
+        return (round(quente[0] + arquivado[0], 2),) + tuple(a + b for a, b in zip(quente[1:], arquivado[1:]))
+
+    @staticmethod
+    def unir_resumos(quentes: list, arquivados: list) -> list:
+        """
+        Une linhas (Data, Pedidos, Faturamento, Delivery, Retirada) dos dois bancos; um dia
+        com pedidos nos dois (parte ainda não entregue) tem as quantidades somadas
+
+        :return lista ordenada por Data
+        """
+        dias = {linha[0]: linha for linha in arquivados}
+        for data, pedidos, faturamento, delivery, retirada in quentes:
+            outro = dias.get(data)
+            if outro is not None:
+                pedidos, faturamento = pedidos + outro[1], round(faturamento + outro[2], 2)
+                delivery, retirada = delivery + outro[3], retirada + outro[4]
+            dias[data] = (data, pedidos, faturamento, delivery, retirada)
+        return [dias[data] for data in sorted(dias)]
+
+    @staticmethod
+    def criar(database_name: str) -> object:
+        """
+        Cria o arquivo morto vazio, caso não exista. O esquema é criado em um arquivo
+        temporário e renomeado, para que nenhuma conexão anexe um arquivo incompleto.
+
+        :param database_name: nome do banco principal (string)
+        :return bool || código erro = A1
+        """
+        nome = ArquivoMorto.nome(database_name)
+        if nome is None:
+            print('Bancos em memória não têm arquivo morto')
+            return 'A1'
+        caminho = ArquivoMorto._caminho(nome)
+        if os.path.exists(caminho):
+            return True
+        novo = f'{caminho}.novo'
+        try:
+            for sobra in (novo, f'{novo}-wal', f'{novo}-shm'):
+                if os.path.exists(sobra):
+                    os.remove(sobra)
+            conn = Database.conect_database(novo)
+            if isinstance(conn, str):
+                return 'A1'
+            try:
+                with conn:
+                    for comando in ArquivoMorto.TABELAS:
+                        conn.execute(comando)
+                #journal_mode = WAL fica gravado no arquivo: leituras não bloqueiam o arquivamento
+                conn.execute('PRAGMA journal_mode = WAL;')
+            finally:
+                conn.close()
+            os.replace(novo, caminho)
+            return True
+        except (OSError, Error) as e:
+            print(e)
+            print('Erro ao criar o arquivo morto')
+            return 'A1'
+
+    @staticmethod
+    def arquivar(database_name: str, corte: str, tamanho_lote: int = LOTE) -> object:
+        """
+        Move para o arquivo morto os pedidos com Status STATUS e Data anterior a corte, com as
+        suas linhas de ItensPedidos, em lotes de tamanho_lote pedidos. Cada lote usa duas
+        transações curtas: a primeira copia os pedidos, as linhas e o resumo para o arquivo;
+        a segunda apaga do banco principal os pedidos já confirmados no arquivo. Entre os
+        lotes o banco fica livre para os demais processos (servidor, terminais).
+
+        Os dois arquivos não são confirmados juntos (com WAL o commit entre bancos anexados
+        não é atômico), por isso a ordem: nenhum pedido sai do banco principal antes de estar
+        no arquivo. Se o processo parar entre as duas transações, o lote fica nos dois bancos:
+        as listagens usam a cópia do banco principal, mas os totais lidos de ResumoDiario contam
+        o lote duas vezes até a próxima execução, que só o apaga do banco principal.
+
+        :param database_name: nome do banco principal (string)
+        :param corte: data no formato AAAA-MM-DD; pedidos desta data em diante ficam (string)
+        :param tamanho_lote: pedidos por lote (int)
+        :return dict {"pedidos": int, "lotes": int} || código erro = A1, A2
+        """
+        criado = ArquivoMorto.criar(database_name)
+        if criado is not True:
+            return criado
+        conn = Database.conect_database(database_name)
+        if isinstance(conn, str):
+            return 'A2'
+        pedidos = lotes = 0
+        try:
+            conn.execute(f'ATTACH DATABASE ? AS {ArquivoMorto.ESQUEMA};', (ArquivoMorto.nome(database_name),))
+            conn.execute(ArquivoMorto.LOTE_TEMPORARIO)
+            while True:
+                with conn:
+                    conn.execute('DELETE FROM temp.LoteArquivo;')
+                    quantidade = conn.execute(ArquivoMorto.SELECIONAR_LOTE,
+                                              (ArquivoMorto.STATUS, corte, tamanho_lote)).rowcount
+                    if quantidade:
+                        conn.execute(ArquivoMorto.COPIAR_RESUMO)
+                        conn.execute(ArquivoMorto.COPIAR_ITENS)
+                        conn.execute(ArquivoMorto.COPIAR_PEDIDOS)
+                if not quantidade:
+                    break
+                with conn:
+                    conn.execute(ArquivoMorto.APAGAR_ITENS)
+                    conn.execute(ArquivoMorto.APAGAR_PEDIDOS)
+                pedidos += quantidade
+                lotes += 1
+            return {"pedidos": pedidos, "lotes": lotes}
+        except Error as e:
+            print(e)
+            print('Erro ao arquivar os pedidos')
+            return 'A2'
+        finally:
+            conn.close()
+
+    @staticmethod
+    def compactar(database_name: str) -> object:
+        """
+        Devolve ao sistema as páginas liberadas pelo arquivamento (VACUUM do banco principal).
+        Sem isso o espaço é reaproveitado pelos pedidos novos, mas o arquivo não diminui.
+        Precisa de acesso exclusivo por alguns instantes: deve rodar fora do horário de atendimento.
+
+        :param database_name: nome do banco principal (string)
+        :return bool || código erro = A3
+        """
+        conn = Database.conect_database(database_name)
+        if isinstance(conn, str):
+            return 'A3'
+        try:
+            conn.execute('VACUUM;')
+            return True
+        except Error as e:
+            print(e)
+            print('Erro ao compactar o banco')
+            return 'A3'
+        finally:
+            conn.close()
+
+
+'''
+Códigos de Erro
+
+criar, arquivar - A1 (não foi possível criar o arquivo morto)
+arquivar - A2
+compactar - A3
+
+'''
@@ -0,0 +1,234 @@
+import re
+
+
+class Consultas:
+    """
+    Consultas SQL usadas pelos models, todas com parâmetros vinculados (?).
+    Como o texto de cada consulta é sempre o mesmo, o SQLite só prepara o comando uma vez
+    por conexão: as conexões do pool mantêm os comandos preparados no cache de statements
+    do sqlite3 (Database.conect_database usa cached_statements=TAMANHO_CACHE).
+    Nenhuma consulta deve ser montada com f-string a partir de valores informados pelo usuário.
+    """
+
+    #quantidade de comandos preparados mantidos por conexão
+    TAMANHO_CACHE = 256
+
+    #------------------------------ Itens ------------------------------#
+    ITENS_MENU = '''
+        SELECT * FROM Itens;
+    '''
+
+    INSERIR_ITEM = '''
+        INSERT INTO Itens (Nome, Preco, Tipo, Descricao) VALUES (?,?,?,?);
+    '''
+
+    #insere o item ou, se o Nome já existir (Produto_Unique), atualiza preço, tipo e descrição
+    GRAVAR_ITEM_MENU = '''
+        INSERT INTO Itens (Nome, Preco, Tipo, Descricao) VALUES (?,?,?,?)
+        ON CONFLICT(Nome) DO UPDATE SET Preco = excluded.Preco, Tipo = excluded.Tipo, Descricao = excluded.Descricao;
+    '''
+
+    #contador de alterações do menu, mantido pelos gatilhos de Itens (0 se o menu nunca foi alterado)
+    VERSAO_MENU = '''
+        SELECT COALESCE(MAX(Versao), 0) FROM VersaoMenu;
+    '''
+
+    VALOR_ITEM = '''
+        SELECT Preco FROM Itens WHERE IdItens = ?;
+    '''
+
+    ITEM_POR_ID = '''
+        SELECT Nome,Tipo,Descricao,Preco FROM Itens WHERE IdItens = ?;
+    '''
+
+    #--------------------------- ItensPedidos ---------------------------#
+    INSERIR_ITEM_PEDIDO = '''
+        INSERT INTO ItensPedidos (IdPedido, IdItem, Quantidade) VALUES (?,?,?);
+    '''
+
+    ITENS_DO_PEDIDO = '''
+        SELECT REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM Pedidos p
+        LEFT JOIN ItensPedidos ip ON ip.IdPedido = p.IdPedido
+        LEFT JOIN Itens i on ip.IdItem = i.IdItens
+        WHERE p.IdPedido = ?;
+    '''
+
+    LINHAS_ITENS_PEDIDOS = '''
+        SELECT ip.IdPedido, REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM ItensPedidos ip
+        JOIN Itens i ON ip.IdItem = i.IdItens
+        ORDER BY ip.IdPedido ASC, ip.Id ASC;
+    '''
+
+    LINHAS_ITENS_PEDIDOS_FAIXA = '''
+        SELECT ip.IdPedido, REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM ItensPedidos ip
+        JOIN Itens i ON ip.IdItem = i.IdItens
+        WHERE ip.IdPedido BETWEEN ? AND ?
+        ORDER BY ip.IdPedido ASC, ip.Id ASC;
+    '''
+
+    LINHAS_ITENS_DO_PEDIDO = '''
+        SELECT ip.IdPedido, REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM ItensPedidos ip
+        JOIN Itens i ON ip.IdItem = i.IdItens
+        WHERE ip.IdPedido = ?
+        ORDER BY ip.Id ASC;
+    '''
+
+    #----------------------------- Pedidos -----------------------------#
+    INSERIR_PEDIDO = '''
+        INSERT INTO Pedidos (Status, Delivery, Endereco, Data, ValorTotal) VALUES (?,?,?,?,?);
+    '''
+
+    PEDIDOS_TODOS = '''
+        SELECT * FROM Pedidos order by IdPedido asc;
+    '''
+
+    PEDIDO_POR_ID = '''
+        SELECT * FROM Pedidos WHERE IdPedido = ?;
+    '''
+
+    ATUALIZAR_STATUS_PEDIDO = '''
+        UPDATE Pedidos SET Status = ? WHERE IdPedido = ?;
+    '''
+
+    IDS_PEDIDOS = '''
+        SELECT IdPedido FROM Pedidos order by IdPedido asc;
+    '''
+
+    PAGINA_PEDIDOS_PROXIMA = '''
+        SELECT * FROM Pedidos WHERE IdPedido > ? ORDER BY IdPedido ASC LIMIT ?;
+    '''
+
+    PAGINA_PEDIDOS_ANTERIOR = '''
+        SELECT * FROM Pedidos WHERE IdPedido < ? ORDER BY IdPedido DESC LIMIT ?;
+    '''
+
+    #--------------------------- ResumoDiario ---------------------------#
+    #faturamento lido do resumo mantido pelos gatilhos: uma linha por dia, não por pedido
+    FATURAMENTO_TOTAL = '''
+        SELECT ROUND(COALESCE(SUM(Faturamento), 0), 2), COALESCE(SUM(Pedidos), 0),
+               COALESCE(SUM(Delivery), 0), COALESCE(SUM(Retirada), 0)
+        FROM ResumoDiario;
+    '''
+
+    FATURAMENTO_PERIODO = '''
+        SELECT ROUND(COALESCE(SUM(Faturamento), 0), 2), COALESCE(SUM(Pedidos), 0),
+               COALESCE(SUM(Delivery), 0), COALESCE(SUM(Retirada), 0)
+        FROM ResumoDiario WHERE Data BETWEEN ? AND ?;
+    '''
+
+    RESUMO_DIARIO_PERIODO = '''
+        SELECT Data, Pedidos, Faturamento, Delivery, Retirada
+        FROM ResumoDiario WHERE Data BETWEEN ? AND ? ORDER BY Data ASC;
+    '''
+
+    #pedidos em aberto com os seus itens, por estado e número; a busca em Pedidos usa só idx_pedidos_fila
+    FILA_COZINHA = '''
+        SELECT p.Status, p.IdPedido, p.Delivery, REPLACE(i.Nome, '-', ' ') AS Nome, ip.Quantidade
+        FROM Pedidos p
+        LEFT JOIN ItensPedidos ip ON ip.IdPedido = p.IdPedido
+        LEFT JOIN Itens i ON ip.IdItem = i.IdItens
+        WHERE p.Status IN (?, ?)
+        ORDER BY p.Status ASC, p.IdPedido ASC, ip.Id ASC;
+    '''
+
+    #condições aceitas por pedidos_filtrados
+    FILTROS_PEDIDOS = {
+        'status': 'Status = ?',
+        'inicio': 'Data >= ?',
+        'fim': 'Data <= ?',
+    }
+
+    @staticmethod
+    def pedidos_filtrados(filtro: dict) -> str:
+        """
+        Monta a consulta de pedidos com as condições de FILTROS_PEDIDOS presentes em filtro.
+        Apenas o texto das condições entra na consulta; os valores são vinculados (?) na
+        ordem das chaves de filtro. Há no máximo 8 textos distintos, todos mantidos no cache.
+
+        :param filtro: dicionário com as chaves usadas (dict)
+        :return: consulta SQL (string)
+        """
+        return f'SELECT * FROM Pedidos{Consultas._where_pedidos(filtro)} ORDER BY IdPedido ASC;'
+
+    @staticmethod
+    def faixa_pedidos_filtrados(filtro: dict) -> str:
+        """
+        Menor e maior IdPedido dos pedidos selecionados pelas mesmas condições de pedidos_filtrados
+
+        :param filtro: dicionário com as chaves usadas (dict)
+        :return: consulta SQL (string)
+        """
+        return f'SELECT MIN(IdPedido), MAX(IdPedido) FROM Pedidos{Consultas._where_pedidos(filtro)};'
+
+    @staticmethod
+    def _where_pedidos(filtro: dict) -> str:
+        condicoes = [Consultas.FILTROS_PEDIDOS[chave] for chave in filtro]
+        return f' WHERE {" AND ".join(condicoes)}' if condicoes else ''
+
+    #----------------------------- Relatório -----------------------------#
+    PEDIDOS_COM_ITENS = '''
+        SELECT p.IdPedido, p.Data, p.ValorTotal,
+               REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM Pedidos p
+        LEFT JOIN ItensPedidos ip ON ip.IdPedido = p.IdPedido
+        LEFT JOIN Itens i ON ip.IdItem = i.IdItens
+        ORDER BY p.IdPedido ASC, ip.Id ASC;
+    '''
+
+    PEDIDOS_COM_ITENS_PERIODO = '''
+        SELECT p.IdPedido, p.Data, p.ValorTotal,
+               REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM Pedidos p
+        LEFT JOIN ItensPedidos ip ON ip.IdPedido = p.IdPedido
+        LEFT JOIN Itens i ON ip.IdItem = i.IdItens
+        WHERE p.Data BETWEEN ? AND ?
+        ORDER BY p.IdPedido ASC, ip.Id ASC;
+    '''
+
+    #pedidos posteriores a um IdPedido (cauda do relatório incremental)
+    PEDIDOS_COM_ITENS_APOS = '''
+        SELECT p.IdPedido, p.Data, p.ValorTotal,
+               REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao, ip.Quantidade
+        FROM Pedidos p
+        LEFT JOIN ItensPedidos ip ON ip.IdPedido = p.IdPedido
+        LEFT JOIN Itens i ON ip.IdItem = i.IdItens
+        WHERE p.IdPedido > ?
+        ORDER BY p.IdPedido ASC, ip.Id ASC;
+    '''
+
+    #assinatura de uma faixa de IdPedido: muda se um pedido da faixa for incluído, removido ou alterado
+    #(a soma dos valores é arredondada para não depender da ordem da soma, ex.: parte da faixa no arquivo morto)
+    ASSINATURA_PEDIDOS = '''
+        SELECT COUNT(*), ROUND(TOTAL(ValorTotal), 2), TOTAL(julianday(Data)), MIN(IdPedido), MAX(IdPedido)
+        FROM Pedidos
+        WHERE IdPedido BETWEEN ? AND ?;
+    '''
+
+    PROXIMO_PEDIDO = '''
+        SELECT MIN(IdPedido) FROM Pedidos WHERE IdPedido > ?;
+    '''
+
+    #----------------------------- Arquivo morto -----------------------------#
+    #maior data e maior IdPedido do arquivo: indicam se uma consulta precisa dele (ver ArquivoMorto.necessario)
+    LIMITES_ARQUIVO = '''
+        SELECT MAX(Data), MAX(IdPedido) FROM Pedidos;
+    '''
+
+    #tabelas que também existem no arquivo morto; Itens fica só no banco principal
+    _TABELAS_ARQUIVO = re.compile(r'\b(FROM|JOIN)\s+(Pedidos|ItensPedidos|ResumoDiario)\b', re.IGNORECASE)
+
+    @staticmethod
+    def no_arquivo(consulta: str) -> str:
+        """
+        Mesma consulta lida do arquivo morto anexado (ATTACH ... AS arquivo): Pedidos, ItensPedidos
+        e ResumoDiario passam a ser arquivo.Pedidos, arquivo.ItensPedidos e arquivo.ResumoDiario.
+        O texto gerado é sempre o mesmo para cada consulta, então também fica no cache de statements.
+
+        :param consulta: consulta SQL sobre o banco principal (string)
+        :return: consulta SQL (string)
+        """
+        return Consultas._TABELAS_ARQUIVO.sub(r'\1 arquivo.\2', consulta)
@@ -1,13 +1,127 @@
 import sqlite3
 from sqlite3 import Error
-import sys
+import configparser
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
+
+from model.consultas import Consultas
+from model.instrumentacao import Instrumentacao
 
 class Database:
 
+    #quantidade máxima de conexões ociosas mantidas por banco
+    TAMANHO_POOL = 4
+
+    #PRAGMAs aplicados uma única vez em cada conexão criada
+    PRAGMAS = (
+        'PRAGMA foreign_keys = ON;',
+    )
+
+    #perfis de desempenho do SQLite, também aplicados em cada conexão criada
+    #cache_size negativo é em KiB, mmap_size em bytes e busy_timeout em milissegundos
+    PERFIS = {
+        'safe': {
+            'journal_mode': 'WAL',
+            'synchronous': 'FULL',
+            'cache_size': -8000,
+            'mmap_size': 0,
+            'temp_store': 'DEFAULT',
+            'busy_timeout': 5000,
+        },
+        'fast': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'cache_size': -64000,
+            'mmap_size': 268435456,
+            'temp_store': 'MEMORY',
+            'busy_timeout': 5000,
+        },
+    }
+
+    #valores aceitos para cada PRAGMA do perfil: lista de opções ou int (com o menor valor permitido,
+    #None se qualquer inteiro servir); o valor é interpolado no comando, por isso nada fora disso é aceito
+    VALORES_PRAGMAS = {
+        'journal_mode': ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'),
+        'synchronous': ('OFF', 'NORMAL', 'FULL', 'EXTRA', '0', '1', '2', '3'),
+        'cache_size': None,
+        'mmap_size': 0,
+        'temp_store': ('DEFAULT', 'FILE', 'MEMORY', '0', '1', '2'),
+        'busy_timeout': 0,
+    }
+
+    #perfil em uso (alterado por definir_perfil / carregar_configuracao)
+    nome_perfil = 'safe'
+    perfil = dict(PERFIS['safe'])
+
+    #índices secundários: (nome, tabela, colunas), criados de forma idempotente por create_indexes
+    INDICES = (
+        ('idx_itens_pedidos_pedido', 'ItensPedidos', 'IdPedido'),
+        ('idx_itens_pedidos_item', 'ItensPedidos', 'IdItem'),
+        #fila da cozinha: cobre a busca por estado em ordem de pedido sem acessar a tabela
+        ('idx_pedidos_fila', 'Pedidos', 'Status, IdPedido, Delivery'),
+        ('idx_pedidos_data', 'Pedidos', 'Data, ValorTotal'),
+    )
+
+    #1 quando o pedido é delivery, 0 quando é retirada (Delivery é gravado como 'True'/'False')
+    _DELIVERY = "(CASE WHEN {0}.Delivery IN ('True', 'true', '1', 1) THEN 1 ELSE 0 END)"
+
+    #incrementa a versão do menu (a linha de VersaoMenu é criada na primeira alteração)
+    _VERSAO_MENU = 'INSERT INTO VersaoMenu (Id, Versao) VALUES (1, 1) ON CONFLICT(Id) DO UPDATE SET Versao = Versao + 1;'
+
+    #gatilhos criados por create_triggers: os de Pedidos mantêm ResumoDiario igual à agregação de Pedidos
+    #por Data (pedidos sem data ficam na linha de Data ''; alterações só de Status não disparam nenhum
+    #gatilho) e os de Itens contam as alterações do menu em VersaoMenu (ver ItemControler._menu)
+    GATILHOS = (
+        ('trg_resumo_pedidos_insert', f'''
+            AFTER INSERT ON Pedidos BEGIN
+                INSERT INTO ResumoDiario (Data, Pedidos, Faturamento, Delivery, Retirada)
+                VALUES (COALESCE(NEW.Data, ''), 1, NEW.ValorTotal, {_DELIVERY.format('NEW')}, 1 - {_DELIVERY.format('NEW')})
+                ON CONFLICT(Data) DO UPDATE SET
+                    Pedidos = Pedidos + 1,
+                    Faturamento = ROUND(Faturamento + excluded.Faturamento, 2),
+                    Delivery = Delivery + excluded.Delivery,
+                    Retirada = Retirada + excluded.Retirada;
+            END;
+        '''),
+        ('trg_resumo_pedidos_delete', f'''
+            AFTER DELETE ON Pedidos BEGIN
+                UPDATE ResumoDiario SET
+                    Pedidos = Pedidos - 1,
+                    Faturamento = ROUND(Faturamento - OLD.ValorTotal, 2),
+                    Delivery = Delivery - {_DELIVERY.format('OLD')},
+                    Retirada = Retirada - (1 - {_DELIVERY.format('OLD')})
+                WHERE Data = COALESCE(OLD.Data, '');
+                DELETE FROM ResumoDiario WHERE Data = COALESCE(OLD.Data, '') AND Pedidos <= 0;
+            END;
+        '''),
+        ('trg_resumo_pedidos_update', f'''
+            AFTER UPDATE OF Data, ValorTotal, Delivery ON Pedidos BEGIN
+                UPDATE ResumoDiario SET
+                    Pedidos = Pedidos - 1,
+                    Faturamento = ROUND(Faturamento - OLD.ValorTotal, 2),
+                    Delivery = Delivery - {_DELIVERY.format('OLD')},
+                    Retirada = Retirada - (1 - {_DELIVERY.format('OLD')})
+                WHERE Data = COALESCE(OLD.Data, '');
+                DELETE FROM ResumoDiario WHERE Data = COALESCE(OLD.Data, '') AND Pedidos <= 0;
+                INSERT INTO ResumoDiario (Data, Pedidos, Faturamento, Delivery, Retirada)
+                VALUES (COALESCE(NEW.Data, ''), 1, NEW.ValorTotal, {_DELIVERY.format('NEW')}, 1 - {_DELIVERY.format('NEW')})
+                ON CONFLICT(Data) DO UPDATE SET
+                    Pedidos = Pedidos + 1,
+                    Faturamento = ROUND(Faturamento + excluded.Faturamento, 2),
+                    Delivery = Delivery + excluded.Delivery,
+                    Retirada = Retirada + excluded.Retirada;
+            END;
+        '''),
+        ('trg_versao_menu_insert', f'AFTER INSERT ON Itens BEGIN {_VERSAO_MENU} END;'),
+        ('trg_versao_menu_update', f'AFTER UPDATE ON Itens BEGIN {_VERSAO_MENU} END;'),
+        ('trg_versao_menu_delete', f'AFTER DELETE ON Itens BEGIN {_VERSAO_MENU} END;'),
+    )
+
+    #pool de conexões ociosas, indexado pelo nome do banco
+    _pool = {}
+    _pool_lock = threading.Lock()
+
     #cria o banco de dados
     def __init__(self, name: str) -> None:
         """
@@ -22,10 +136,11 @@ class Database:
         """
         self.name = name
         try:
-            conn = sqlite3.connect(self.name)
-            conn.execute('''
-            PRAGMA foreign_keys = ON;
-            ''')
+            #a primeira conexão já recebe os PRAGMAs e fica no pool para ser reutilizada
+            conn = Database.obter_conexao(self.name)
+            if isinstance(conn, str):
+                raise OSError(f'Erro na conexão ({conn})')
+            Database.devolver_conexao(self.name, conn)
             
         except OSError as e:
             print(e)
@@ -45,18 +160,241 @@ class Database:
 
         """
         try:
-            conn = sqlite3.connect(database_name)
+            #uri=True aceita também nomes "file:...?mode=ro" (ver nome_somente_leitura); caminhos comuns não mudam
+            conn = sqlite3.connect(database_name, check_same_thread=False, cached_statements=Consultas.TAMANHO_CACHE, uri=True)
+            for pragma in Database.PRAGMAS:
+                conn.execute(pragma)
+            for nome, valor in Database.perfil.items():
+                conn.execute(f'PRAGMA {nome} = {valor};')
+            if Instrumentacao.ativo:
+                Instrumentacao.instrumentar_conexao(conn)
             return conn
-        except OSError as e:
+        except (OSError, Error) as e:
             print(e)
             print('Erro na conexão')
             return 'D1'
 
+    #nome do banco para conexões somente leitura
+    @staticmethod
+    def nome_somente_leitura(database_name: str) -> str:
+        """
+        URI do banco em modo somente leitura ("file:///caminho?mode=ro"). Pode ser usada
+        no lugar do nome em qualquer método que recebe database_name: as conexões abertas
+        com ela ficam em um pool próprio e qualquer gravação falha com "readonly database".
+
+        :param database_name: string
+        :return string
+        """
+        return f'{Path(database_name).resolve().as_uri()}?mode=ro'
+
+    #seleciona o perfil de desempenho usado pelas novas conexões
+    @staticmethod
+    def definir_perfil(nome: str, **ajustes) -> bool:
+        """
+        Seleciona um dos perfis de Database.PERFIS ("safe" ou "fast"), opcionalmente
+        sobrescrevendo PRAGMAs individuais (ex.: synchronous='OFF').
+        As conexões ociosas do pool são fechadas para que as próximas já usem o novo perfil.
+
+        :param nome: string
+        :param ajustes: PRAGMAs do perfil a sobrescrever
+        :return bool || código erro = D7
+        """
+        if nome not in Database.PERFIS:
+            print(f'Perfil desconhecido: {nome}')
+            return 'D7'
+        perfil = dict(Database.PERFIS[nome])
+        for pragma, valor in ajustes.items():
+            if pragma not in perfil:
+                print(f'PRAGMA não suportado no perfil: {pragma}')
+                return 'D7'
+            valor = Database.validar_pragma(pragma, valor)
+            if valor is None:
+                print(f'Valor inválido para o PRAGMA {pragma}: {ajustes[pragma]}')
+                return 'D7'
+            perfil[pragma] = valor
+        Database.nome_perfil = nome
+        Database.perfil = perfil
+        Database.fechar_conexoes()
+        return True
+
+    #confere o valor de um PRAGMA do perfil
+    @staticmethod
+    def validar_pragma(pragma: str, valor) -> object:
+        """
+        Confere o valor contra Database.VALORES_PRAGMAS, ex.: ('synchronous', 'normal') -> 'NORMAL'
+        e ('busy_timeout', '10000') -> 10000.
+
+        :param pragma: string
+        :param valor: string ou int
+        :return valor normalizado (string ou int) || None se for inválido
+        """
+        aceitos = Database.VALORES_PRAGMAS.get(pragma, ())
+        texto = str(valor).strip()
+        if isinstance(aceitos, tuple):
+            return texto.upper() if texto.upper() in aceitos else None
+        try:
+            numero = int(texto)
+        except ValueError:
+            return None
+        return numero if aceitos is None or numero >= aceitos else None
+
+    #lê o perfil de desempenho de um arquivo de configuração
+    @staticmethod
+    def carregar_configuracao(caminho: str) -> bool:
+        """
+        Lê a seção [database] de um arquivo .ini: a chave "perfil" escolhe o perfil e as
+        demais chaves (journal_mode, synchronous, ...) sobrescrevem PRAGMAs do perfil.
+        Se o arquivo não existir, o perfil atual é mantido.
+
+        :param caminho: string
+        :return bool || código erro = D7
+        """
+        configuracao = configparser.ConfigParser()
+        if not configuracao.read(caminho, encoding='utf-8') or not configuracao.has_section('database'):
+            return False
+        secao = dict(configuracao['database'])
+        nome = secao.pop('perfil', Database.nome_perfil)
+        return Database.definir_perfil(nome, **secao)
+
+    #retira uma conexão do pool, criando uma nova caso não exista nenhuma ociosa
+    @staticmethod
+    def obter_conexao(database_name: str) -> object:
+        """
+        Entrega uma conexão de longa duração do pool do banco informado.
+        Caso não exista conexão ociosa, uma nova é criada por conect_database
+        (e recebe os PRAGMAs uma única vez).
+
+        :param database_name: string
+        :return conn: object || código erro = D1
+        """
+        with Database._pool_lock:
+            ociosas = Database._pool.get(database_name)
+            if ociosas:
+                return ociosas.pop()
+        return Database.conect_database(database_name)
+
+    #devolve a conexão ao pool, fechando-a se o pool estiver cheio
+    @staticmethod
+    def devolver_conexao(database_name: str, conn: object) -> None:
+        """
+        Devolve ao pool uma conexão obtida por obter_conexao.
+        Conexões com transação pendente são desfeitas antes de voltar ao pool.
+
+        :param database_name: string
+        :param conn: object
+        :return None
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        with Database._pool_lock:
+            ociosas = Database._pool.setdefault(database_name, [])
+            if len(ociosas) < Database.TAMANHO_POOL:
+                ociosas.append(conn)
+                return
+        conn.close()
+
+    #uso: with Database.conexao(nome) as conn
+    @staticmethod
+    @contextmanager
+    def conexao(database_name: str):
+        """
+        Gerenciador de contexto que empresta uma conexão do pool.
+        Ao sair do bloco a transação é confirmada (ou desfeita em caso de erro)
+        e a conexão volta para o pool, sem ser fechada.
+
+        :param database_name: string
+        :return conn: object
+        """
+        conn = Database.obter_conexao(database_name)
+        if isinstance(conn, str):
+            raise OSError(f'Erro na conexão ({conn})')
+        try:
+            with conn:
+                yield conn
+        finally:
+            Database.devolver_conexao(database_name, conn)
+
+    #percorre o resultado de uma consulta em lotes, sem carregá-lo inteiro em memória
+    @staticmethod
+    def iterar(database_name: str, consulta: str, parametros: tuple = (), tamanho_lote: int = 500, fabrica=None):
+        """
+        Gerador que executa a consulta em uma transação de leitura e entrega as linhas
+        lidas do cursor com fetchmany. A conexão fica emprestada do pool até o fim da
+        iteração (ou até o gerador ser descartado).
+
+        :param database_name: string
+        :param consulta: consulta SQL com parâmetros vinculados (string)
+        :param parametros: tuple
+        :param tamanho_lote: quantidade de linhas lidas por fetchmany (int)
+        :param fabrica: row_factory do cursor, ex.: Pedido.da_linha (opcional)
+        :return gerador de linhas
+        """
+        with Database.conexao(database_name) as conn:
+            cursor = conn.cursor()
+            if fabrica is not None:
+                cursor.row_factory = fabrica
+            cursor.execute('BEGIN;')
+            cursor.execute(consulta, parametros)
+            yield from Database.lotes(cursor, tamanho_lote)
+
+    #linhas de um cursor já executado, lidas com fetchmany
+    @staticmethod
+    def lotes(cursor: object, tamanho_lote: int = 500):
+        """
+        :param cursor: cursor com a consulta executada (object)
+        :param tamanho_lote: quantidade de linhas lidas por fetchmany (int)
+        :return gerador de linhas
+        """
+        rows = cursor.fetchmany(tamanho_lote)
+        while rows:
+            yield from rows
+            rows = cursor.fetchmany(tamanho_lote)
+
+    #contador de alterações do banco feitas por outras conexões
+    @staticmethod
+    def versao_dados(conn: object) -> int:
+        """
+        Retorna PRAGMA data_version da conexão: o valor muda sempre que outra conexão
+        (deste ou de outro processo) confirma uma alteração no banco. Alterações feitas
+        pela própria conexão não mudam o valor, por isso deve ser usada uma conexão
+        dedicada, que só lê.
+
+        :param conn: object
+        :return int || código erro = D11
+        """
+        try:
+            return conn.execute('PRAGMA data_version;').fetchone()[0]
+        except Error as e:
+            print(e)
+            return 'D11'
+
+    #fecha as conexões ociosas (de um banco ou de todos)
+    @staticmethod
+    def fechar_conexoes(database_name: str = None) -> None:
+        """
+        Fecha as conexões ociosas do pool. Deve ser chamado ao encerrar o software.
+
+        :param database_name: string (opcional, None fecha todos os bancos)
+        :return None
+        """
+        with Database._pool_lock:
+            if database_name is None:
+                nomes = list(Database._pool)
+            else:
+                nomes = [database_name]
+            conexoes = []
+            for nome in nomes:
+                conexoes.extend(Database._pool.pop(nome, []))
+        for conn in conexoes:
+            conn.close()
+
     #criando a tabela dos produtos, caso não exista
     @staticmethod
     def create_table_itens(cursor: object) -> bool:
         """
         Caso não exista, cria uma tabela de chamados em um banco de dados sqlite3
+        Cria também VersaoMenu, com uma única linha (criada na primeira alteração do menu)
+        com o contador de alterações do menu, incrementado pelos gatilhos de Itens (Database.GATILHOS)
         try -> query para criar a tabela Chamados, caso não exista no banco em questão
         except -> informa o erro em caso de erro na operação anterior
 
@@ -74,6 +412,12 @@ class Database:
                 CONSTRAINT Produto_Unique UNIQUE (Nome)
                 );
             ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS VersaoMenu (
+                Id INTEGER PRIMARY KEY CHECK (Id = 1),
+                Versao INTEGER NOT NULL
+                );
+            ''')
             return True
         except OSError as e:
             print(e)
@@ -98,6 +442,7 @@ class Database:
                 Status VARCHAR(30) NOT NULL,
                 Delivery BOLL,
 				Endereco VARCHAR(100),
+                Data DATE,
                 ValorTotal REAL NOT NULL
                 );
             ''')
@@ -124,8 +469,9 @@ class Database:
                 Id INTEGER PRIMARY KEY AUTOINCREMENT,
                 IdPedido INTEGER NOT NULL,
                 IdItem INTEGER NOT NULL,
+                Quantidade INTEGER NOT NULL DEFAULT 1,
                 FOREIGN KEY(IdPedido) REFERENCES Pedidos(IdPedido),
-                FOREIGN KEY(IdItem) REFERENCES Produtos(IdItem)
+                FOREIGN KEY(IdItem) REFERENCES Itens(IdItens)
                 );
             ''')
             return True
@@ -134,6 +480,254 @@ class Database:
             print('Erro ao criar a tabela')
             return 'D4'
 
+    #criando a tabela do resumo diário de faturamento, caso não exista
+    @staticmethod
+    def create_table_resumo_diario(cursor: object) -> bool:
+        """
+        Caso não exista, cria a tabela ResumoDiario: uma linha por dia com a quantidade de
+        pedidos, o faturamento e a quantidade de pedidos delivery e retirada.
+        O conteúdo é mantido pelos gatilhos de Database.GATILHOS.
+        try -> query para criar a tabela ResumoDiario, caso não exista no banco em questão
+        except -> informa o erro em caso de erro na operação anterior
+
+        :param cursor: obj
+        :return bool || código erro = D8
+        """
+        try:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS ResumoDiario (
+                Data DATE NOT NULL PRIMARY KEY,
+                Pedidos INTEGER NOT NULL DEFAULT 0,
+                Faturamento REAL NOT NULL DEFAULT 0,
+                Delivery INTEGER NOT NULL DEFAULT 0,
+                Retirada INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID;
+            ''')
+            return True
+        except Error as e:
+            print(e)
+            print('Erro ao criar a tabela')
+            return 'D8'
+
+    #criando os gatilhos que mantêm o resumo diário, caso não existam
+    @staticmethod
+    def create_triggers(cursor: object) -> bool:
+        """
+        Cria os gatilhos declarados em Database.GATILHOS que ainda não existem no banco.
+        Pode ser chamado a cada inicialização.
+        try -> cria os gatilhos
+        except -> informa o erro em caso de erro na operação anterior
+
+        :param cursor: object
+        :return bool || código erro = D9
+        """
+        try:
+            for nome, corpo in Database.GATILHOS:
+                cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {nome} {corpo}')
+            return True
+        except Error as e:
+            print(e)
+            print('Erro ao criar os gatilhos')
+            return 'D9'
+
+    #recalcula o resumo diário a partir de todos os pedidos
+    @staticmethod
+    def reconstruir_resumo_diario(conn: object) -> bool:
+        """
+        Apaga e recalcula ResumoDiario agregando a tabela Pedidos, em uma única transação.
+        Usado uma vez em bancos anteriores ao resumo (migração 5) e pelo comando
+        "python comandos.py reconstruir-resumo", caso o resumo precise ser refeito.
+        try -> recalcula o resumo
+        except -> informa o erro em caso de erro na operação anterior
+
+        :param conn: object
+        :return bool || código erro = D10
+        """
+        try:
+            with conn:
+                Database._preencher_resumo_diario(conn)
+            return True
+        except Error as e:
+            print(e)
+            print('Erro ao reconstruir o resumo diário')
+            return 'D10'
+
+    @staticmethod
+    def _preencher_resumo_diario(conn: object) -> None:
+        conn.execute('DELETE FROM ResumoDiario;')
+        conn.execute(f'''
+            INSERT INTO ResumoDiario (Data, Pedidos, Faturamento, Delivery, Retirada)
+            SELECT COALESCE(Data, ''), COUNT(*), ROUND(SUM(ValorTotal), 2),
+                   SUM({Database._DELIVERY.format('Pedidos')}), SUM(1 - {Database._DELIVERY.format('Pedidos')})
+            FROM Pedidos
+            GROUP BY COALESCE(Data, '');
+        ''')
+
+    #criando os índices secundários, caso não existam
+    @staticmethod
+    def create_indexes(cursor: object) -> bool:
+        """
+        Cria os índices declarados em Database.INDICES que ainda não existem no banco.
+        Pode ser chamado a cada inicialização.
+        try -> cria os índices
+        except -> informa o erro em caso de erro na operação anterior
+
+        :param cursor: object
+        :return bool || código erro = D6
+        """
+        try:
+            for nome, tabela, colunas in Database.INDICES:
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS {nome} ON {tabela} ({colunas});')
+            return True
+        except Error as e:
+            print(e)
+            print('Erro ao criar os índices')
+            return 'D6'
+
+    #atualiza bancos criados por versões anteriores do software
+    @staticmethod
+    def migrar(conn: object) -> bool:
+        """
+        Aplica, em ordem, as migrações ainda não executadas no banco.
+        A versão do esquema fica registrada em PRAGMA user_version e cada
+        migração roda na sua própria transação.
+        try -> executa as migrações pendentes
+        except -> informa o erro em caso de erro na operação anterior
+
+        :param conn: object
+        :return bool || código erro = D5
+        """
+        try:
+            versao = conn.execute('PRAGMA user_version;').fetchone()[0]
+            migracoes = Database._migracoes()
+            for numero in range(versao + 1, len(migracoes) + 1):
+                #legacy_alter_table impede que RENAME reescreva as chaves estrangeiras das outras tabelas
+                conn.execute('PRAGMA foreign_keys = OFF;')
+                conn.execute('PRAGMA legacy_alter_table = ON;')
+                conn.execute('BEGIN;')
+                try:
+                    migracoes[numero - 1](conn)
+                    conn.execute(f'PRAGMA user_version = {numero};')
+                    conn.commit()
+                except Error:
+                    conn.rollback()
+                    raise
+                finally:
+                    conn.execute('PRAGMA legacy_alter_table = OFF;')
+                    conn.execute('PRAGMA foreign_keys = ON;')
+            return True
+        except Error as e:
+            print(e)
+            print('Erro ao migrar o banco')
+            return 'D5'
+
+    @staticmethod
+    def _migracoes() -> list:
+        """
+        Lista ordenada das migrações; a posição (a partir de 1) é a versão do esquema.
+        Toda migração deve ser idempotente, pois bancos novos já nascem com o esquema atual.
+        """
+        return [
+            Database._migracao_fk_itens_pedidos,
+            Database._migracao_coluna_data,
+            Database._migracao_quantidade_itens_pedidos,
+            Database._migracao_data_iso,
+            Database._migracao_resumo_diario,
+        ]
+
+    #versão 1: a chave estrangeira de ItensPedidos apontava para a tabela inexistente Produtos
+    @staticmethod
+    def _migracao_fk_itens_pedidos(conn: object) -> None:
+        referencias = [fk[2] for fk in conn.execute('PRAGMA foreign_key_list(ItensPedidos);')]
+        if 'Produtos' not in referencias:
+            return
+        conn.execute('ALTER TABLE ItensPedidos RENAME TO ItensPedidos_antiga;')
+        #esquema da versão 1, ainda sem Quantidade: create_table_itens_pedidos já cria a coluna
+        #e faria a versão 3 pular a compactação das linhas repetidas
+        conn.execute('''
+            CREATE TABLE ItensPedidos (
+            Id INTEGER PRIMARY KEY AUTOINCREMENT,
+            IdPedido INTEGER NOT NULL,
+            IdItem INTEGER NOT NULL,
+            FOREIGN KEY(IdPedido) REFERENCES Pedidos(IdPedido),
+            FOREIGN KEY(IdItem) REFERENCES Itens(IdItens)
+            );
+        ''')
+        conn.execute('''
+            INSERT INTO ItensPedidos (Id, IdPedido, IdItem)
+            SELECT Id, IdPedido, IdItem FROM ItensPedidos_antiga;
+        ''')
+        conn.execute('DROP TABLE ItensPedidos_antiga;')
+
+    #versão 2: a coluna Data era gravada pelos pedidos mas não constava na criação da tabela
+    @staticmethod
+    def _migracao_coluna_data(conn: object) -> None:
+        colunas = [coluna[1] for coluna in conn.execute('PRAGMA table_info(Pedidos);')]
+        if 'Data' in colunas:
+            return
+        #recria a tabela para manter a ordem das colunas lida por SELECT *
+        conn.execute('ALTER TABLE Pedidos RENAME TO Pedidos_antiga;')
+        Database.create_table_pedidos(conn)
+        conn.execute('''
+            INSERT INTO Pedidos (IdPedido, Status, Delivery, Endereco, ValorTotal)
+            SELECT IdPedido, Status, Delivery, Endereco, ValorTotal FROM Pedidos_antiga;
+        ''')
+        conn.execute('DROP TABLE Pedidos_antiga;')
+
+    #versão 3: uma linha por item do pedido com a sua quantidade, em vez de uma linha por unidade
+    @staticmethod
+    def _migracao_quantidade_itens_pedidos(conn: object) -> None:
+        colunas = [coluna[1] for coluna in conn.execute('PRAGMA table_info(ItensPedidos);')]
+        if 'Quantidade' in colunas:
+            Database._compactar_itens_pedidos(conn)
+            return
+        #compacta as linhas repetidas de um mesmo item no pedido em uma única linha
+        conn.execute('ALTER TABLE ItensPedidos RENAME TO ItensPedidos_antiga;')
+        Database.create_table_itens_pedidos(conn)
+        conn.execute('''
+            INSERT INTO ItensPedidos (Id, IdPedido, IdItem, Quantidade)
+            SELECT MIN(Id), IdPedido, IdItem, COUNT(*) FROM ItensPedidos_antiga
+            GROUP BY IdPedido, IdItem;
+        ''')
+        conn.execute('DROP TABLE ItensPedidos_antiga;')
+
+    #junta as linhas repetidas de um mesmo item no pedido (tabela já com Quantidade) na de menor Id
+    @staticmethod
+    def _compactar_itens_pedidos(conn: object) -> None:
+        repetidos = conn.execute('''
+            SELECT 1 FROM ItensPedidos GROUP BY IdPedido, IdItem HAVING COUNT(*) > 1 LIMIT 1;
+        ''').fetchone()
+        if repetidos is None:
+            return
+        conn.execute('''
+            UPDATE ItensPedidos SET Quantidade = (
+                SELECT SUM(r.Quantidade) FROM ItensPedidos r
+                WHERE r.IdPedido = ItensPedidos.IdPedido AND r.IdItem = ItensPedidos.IdItem
+            )
+            WHERE Id IN (SELECT MIN(Id) FROM ItensPedidos GROUP BY IdPedido, IdItem HAVING COUNT(*) > 1);
+        ''')
+        conn.execute('''
+            DELETE FROM ItensPedidos WHERE Id NOT IN (SELECT MIN(Id) FROM ItensPedidos GROUP BY IdPedido, IdItem);
+        ''')
+
+    #versão 4: datas no formato ISO (AAAA-MM-DD), ordenáveis, com índice para consultas por período
+    @staticmethod
+    def _migracao_data_iso(conn: object) -> None:
+        conn.execute('''
+            UPDATE Pedidos
+            SET Data = substr(Data, 7, 4) || '-' || substr(Data, 4, 2) || '-' || substr(Data, 1, 2)
+            WHERE Data LIKE '__/__/____';
+        ''')
+        #(Data, ValorTotal) cobre as somas de faturamento sem acessar a tabela
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_pedidos_data ON Pedidos (Data, ValorTotal);')
+
+    #versão 5: resumo diário de faturamento mantido por gatilhos, preenchido com os pedidos existentes
+    @staticmethod
+    def _migracao_resumo_diario(conn: object) -> None:
+        Database.create_table_resumo_diario(conn)
+        Database.create_triggers(conn)
+        Database._preencher_resumo_diario(conn)
+
 
 '''
 Códigos de Erro
@@ -142,5 +736,12 @@ conect_database - D1
 create_table_itens - D2
 create_table_pedidos - D3
 create_table_itens_pedido - D4
+migrar - D5
+create_indexes - D6
+definir_perfil, carregar_configuracao - D7 (perfil, PRAGMA ou valor de PRAGMA inválido)
+create_table_resumo_diario - D8
+create_triggers - D9
+reconstruir_resumo_diario - D10
+versao_dados - D11
 
 '''
\ No newline at end of file
@@ -0,0 +1,184 @@
+import json
+import re
+import threading
+import time
+import types
+from functools import wraps
+
+
+class Instrumentacao:
+    """
+    Instrumentação opcional de desempenho: quantidade de chamadas, linhas retornadas e
+    histograma de latência de cada operação instrumentada, e quantidade de execuções de
+    cada comando SQL (callback de trace do sqlite3, instalado por Database.conect_database).
+
+    Desativada, não há custo nas operações: os métodos só são substituídos por versões
+    medidas em ativar, e as conexões só recebem o callback enquanto estiver ativa.
+    """
+
+    #limites superiores (ms) das faixas do histograma de latência; a última faixa é "acima de 1000"
+    FAIXAS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+    #literais substituídos por ? para agrupar execuções do mesmo comando com valores diferentes
+    _LITERAIS = re.compile(r"x'[0-9a-fA-F]*'|'(?:[^']|'')*'|(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+
+    ativo = False
+    _operacoes = {}
+    _comandos = {}
+    _originais = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def ativar(classes: tuple = ()) -> None:
+        """
+        Passa a registrar os comandos SQL das novas conexões e substitui os métodos
+        estáticos públicos das classes informadas por versões medidas.
+
+        :param classes: classes cujos métodos estáticos públicos serão medidos (tuple)
+        """
+        Instrumentacao.ativo = True
+        for classe in classes:
+            for nome, atributo in list(vars(classe).items()):
+                if nome.startswith('_') or not isinstance(atributo, staticmethod):
+                    continue
+                Instrumentacao._originais.append((classe, nome, atributo))
+                funcao = Instrumentacao.medir(f'{classe.__name__}.{nome}', atributo.__func__)
+                setattr(classe, nome, staticmethod(funcao))
+
+    @staticmethod
+    def desativar() -> None:
+        """
+        Restaura os métodos originais e para de registrar comandos nas novas conexões.
+        Os dados coletados são mantidos até limpar().
+        """
+        Instrumentacao.ativo = False
+        for classe, nome, atributo in reversed(Instrumentacao._originais):
+            setattr(classe, nome, atributo)
+        Instrumentacao._originais.clear()
+
+    @staticmethod
+    def limpar() -> None:
+        with Instrumentacao._lock:
+            Instrumentacao._operacoes.clear()
+            Instrumentacao._comandos.clear()
+
+    @staticmethod
+    def medir(nome: str, funcao):
+        """
+        Envolve a função registrando latência e linhas (tamanho de listas e tuplas retornadas).
+        Se a função devolver um gerador, a medida vai até o fim da iteração e as linhas são os
+        elementos entregues.
+
+        :param nome: nome da operação (string)
+        :param funcao: função a ser medida
+        :return: função medida
+        """
+        @wraps(funcao)
+        def medida(*args, **kwargs):
+            inicio = time.perf_counter()
+            resultado = funcao(*args, **kwargs)
+            if isinstance(resultado, types.GeneratorType):
+                return Instrumentacao._medir_gerador(nome, resultado, inicio)
+            linhas = len(resultado) if isinstance(resultado, (list, tuple)) else None
+            Instrumentacao.registrar(nome, time.perf_counter() - inicio, linhas)
+            return resultado
+        return medida
+
+    @staticmethod
+    def _medir_gerador(nome: str, gerador, inicio: float):
+        linhas = 0
+        try:
+            for linha in gerador:
+                linhas += 1
+                yield linha
+        finally:
+            Instrumentacao.registrar(nome, time.perf_counter() - inicio, linhas)
+
+    @staticmethod
+    def registrar(nome: str, segundos: float, linhas: int = None) -> None:
+        """
+        Registra uma chamada da operação
+
+        :param nome: nome da operação (string)
+        :param segundos: duração da chamada (float)
+        :param linhas: linhas retornadas, None se não se aplica (int)
+        """
+        milissegundos = segundos * 1000
+        faixa = len(Instrumentacao.FAIXAS_MS)
+        for posicao, limite in enumerate(Instrumentacao.FAIXAS_MS):
+            if milissegundos <= limite:
+                faixa = posicao
+                break
+        with Instrumentacao._lock:
+            operacao = Instrumentacao._operacoes.get(nome)
+            if operacao is None:
+                operacao = Instrumentacao._operacoes[nome] = {
+                    "chamadas": 0, "linhas": 0, "total_ms": 0.0, "maximo_ms": 0.0,
+                    "histograma": [0] * (len(Instrumentacao.FAIXAS_MS) + 1),
+                }
+            operacao["chamadas"] += 1
+            operacao["linhas"] += linhas or 0
+            operacao["total_ms"] += milissegundos
+            operacao["maximo_ms"] = max(operacao["maximo_ms"], milissegundos)
+            operacao["histograma"][faixa] += 1
+
+    @staticmethod
+    def instrumentar_conexao(conn: object) -> None:
+        """
+        Instala o callback de trace que conta as execuções de cada comando SQL da conexão
+        (inclusive os comandos executados pelos gatilhos)
+        """
+        conn.set_trace_callback(Instrumentacao._trace)
+
+    @staticmethod
+    def _trace(sql: str) -> None:
+        comando = Instrumentacao._LITERAIS.sub('?', ' '.join(sql.split()))
+        with Instrumentacao._lock:
+            Instrumentacao._comandos[comando] = Instrumentacao._comandos.get(comando, 0) + 1
+
+    @staticmethod
+    def resumo() -> dict:
+        """
+        :return: {"faixas_ms": limites do histograma, "operacoes": {nome: medidas}, "comandos": {sql: execuções}}
+        """
+        with Instrumentacao._lock:
+            operacoes = {}
+            for nome, operacao in sorted(Instrumentacao._operacoes.items()):
+                operacoes[nome] = dict(operacao, histograma=list(operacao["histograma"]),
+                                       media_ms=operacao["total_ms"] / operacao["chamadas"])
+            comandos = dict(sorted(Instrumentacao._comandos.items(), key=lambda comando: -comando[1]))
+        return {"faixas_ms": list(Instrumentacao.FAIXAS_MS), "operacoes": operacoes, "comandos": comandos}
+
+    @staticmethod
+    def texto(limite_comandos: int = 15) -> str:
+        """
+        Resumo em texto: operações ordenadas pelo tempo total e os comandos SQL mais executados
+        """
+        resumo = Instrumentacao.resumo()
+        faixas = [f'<={limite:g}' for limite in Instrumentacao.FAIXAS_MS] + [f'>{Instrumentacao.FAIXAS_MS[-1]:g}']
+        linhas = [f'{"Operação":<42}| {"Chamadas":>8} | {"Linhas":>8} | {"Média ms":>9} | {"Máx ms":>9} | {"Total ms":>10}']
+        for nome, operacao in sorted(resumo["operacoes"].items(), key=lambda item: -item[1]["total_ms"]):
+            linhas.append(f'{nome:<42}| {operacao["chamadas"]:>8} | {operacao["linhas"]:>8} | {operacao["media_ms"]:>9.3f} | '
+                          f'{operacao["maximo_ms"]:>9.3f} | {operacao["total_ms"]:>10.1f}')
+            histograma = '  '.join(f'{faixa}: {quantidade}' for faixa, quantidade in zip(faixas, operacao["histograma"]) if quantidade)
+            linhas.append(f'    ms {histograma}')
+        linhas.append(f'\n{"Execuções":>9} | Comando SQL')
+        for comando, execucoes in list(resumo["comandos"].items())[:limite_comandos]:
+            linhas.append(f'{execucoes:>9} | {comando[:110]}')
+        return '\n'.join(linhas)
+
+    @staticmethod
+    def gravar(caminho: str) -> bool:
+        """
+        Grava o resumo em JSON
+
+        :param caminho: arquivo de destino (string)
+        :return bool
+        """
+        try:
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                json.dump(Instrumentacao.resumo(), arquivo, indent=2, ensure_ascii=False)
+            return True
+        except OSError as e:
+            print(e)
+            return False
@@ -1,17 +1,15 @@
 #import de model
 from model.database import Database
-
-#Necessário para realizar import em python
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
+from model.consultas import Consultas
+from model.arquivoMorto import ArquivoMorto
+from sqlite3 import Error
 
 
 class Item:
+    #sem __dict__ por instância
+    __slots__ = ('id_item', 'nome', 'preco', 'tipo', 'descricao')
 
-    def __init__(self, nome: str, preco: float, tipo: str, descricao: str) -> None:
+    def __init__(self, nome: str, preco: float, tipo: str, descricao: str, id_item: int = None) -> None:
         """
         Construtor da classe Item.
 
@@ -19,7 +17,9 @@ class Item:
         :param preco: Preço do item (float).
         :param tipo: Tipo do item (string).
         :param descricao: Descrição do item (string).
+        :param id_item: IdItens no banco, None enquanto o item não foi gravado (int).
         """
+        self.id_item = id_item
         self.nome = nome
         self.preco = preco
         self.tipo = tipo
@@ -35,11 +35,9 @@ class Item:
         :return: Lista de tuplas contendo os itens, ou código de erro caso ocorra um erro
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                SELECT * FROM Itens;
-                ''')
+                cursor.execute(Consultas.ITENS_MENU)
                 rows = cursor.fetchall()
                 return(rows)
 
@@ -48,6 +46,23 @@ class Item:
             print(e)
             return 'I1'    
         
+    #versão do menu, alterada a cada gravação na tabela Itens (por qualquer processo)
+    @staticmethod
+    def versao_menu(database_name: str) -> object:
+        """
+        Lê o contador de alterações do menu, incrementado pelos gatilhos de Itens em toda
+        inserção, atualização ou remoção, feita por qualquer conexão ou processo.
+
+        :param database_name: Nome do banco de dados a ser consultado (string).
+        :return: Versão do menu (int) ou código de erro.
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                return conn.execute(Consultas.VERSAO_MENU).fetchone()[0]
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'I8'
     
     
     #inserindo um item no banco de dados
@@ -61,18 +76,63 @@ class Item:
         :return: True se tudo acontecer como esperado, código de erro em caso de erro
         """
         try:
-            with Database.conect_database(database_name) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO Itens (Nome, Preco, Tipo, Descricao) VALUES (?,?,?,?);
-                    ''', (data.nome,data.preco,data.tipo,data.descricao))
+            with Database.conexao(database_name) as conn:
+                Item.gravar_item(conn, data)
                 conn.commit()
                 return True
         except OSError as e:
             print(e)
             return 'I2'
+
+    #grava um item na transação aberta da conexão informada
+    @staticmethod
+    def gravar_item(conn: object, data: object) -> int:
+        """
+        Insere um item sem confirmar a transação: o commit fica a cargo de quem chama.
+        Erros do sqlite3 são propagados.
+
+        :param conn: conexão com o banco (object)
+        :param data: objeto Item (Item)
+        :return: IdItens gerado pelo banco, também gravado em data.id_item (int)
+        """
+        cursor = conn.cursor()
+        cursor.execute(Consultas.INSERIR_ITEM, (data.nome,data.preco,data.tipo,data.descricao))
+        data.id_item = cursor.lastrowid
+        return data.id_item
     
     
+    #grava vários itens do menu em uma transação (importação)
+    @staticmethod
+    def importar_itens(database_name: str, lotes) -> object:
+        """
+        Insere cada item ou, se o Nome já existir (restrição Produto_Unique), atualiza o preço,
+        o tipo e a descrição. Cada lote é gravado com executemany e todos os lotes ficam em uma
+        única transação. Se o banco recusar uma linha, o lote é gravado de novo linha a linha
+        (a gravação é idempotente) e só as linhas recusadas ficam de fora.
+
+        :param database_name: nome do banco de dados (string)
+        :param lotes: iterável de listas de (linha, [nome, preco, tipo, descricao])
+        :return: lista de (linha, mensagem) das linhas recusadas pelo banco, código de erro em caso de erro
+        """
+        erros = []
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                for lote in lotes:
+                    try:
+                        cursor.executemany(Consultas.GRAVAR_ITEM_MENU, [dados for linha, dados in lote])
+                    except Error:
+                        for linha, dados in lote:
+                            try:
+                                cursor.execute(Consultas.GRAVAR_ITEM_MENU, dados)
+                            except Error as e:
+                                erros.append((linha, str(e)))
+                return erros
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'I7'
+
     #tabela que liga cada pedido ao menu
     @staticmethod
     def insert_into_itens_pedidos(database_name: str, data: list) -> bool:
@@ -80,15 +140,13 @@ class Item:
         Insere na tabela ItensPedidos a relação entre os [0-N] itens por pedido
 
         :param database_name: nome do banco de dados (string)
-        :param data: lista com IdPedido e IdItem a serem inseridos (list)
+        :param data: lista com IdPedido, IdItem e, opcionalmente, a Quantidade (padrão 1) a serem inseridos (list)
         :return: True se tudo acontecer como esperado, código de erro em caso de erro
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO ItensPedidos (IdPedido, IdItem) VALUES (?,?);
-                    ''', (data[0],data[1]))
+                cursor.execute(Consultas.INSERIR_ITEM_PEDIDO, (data[0],data[1],data[2] if len(data) > 2 else 1))
                 conn.commit()
                 return True
             
@@ -104,25 +162,48 @@ class Item:
 
         :param database_name: nome do banco de dados (string)
         :param indice: Id do pedido que será utilizado para consulta dos itens (int)
-        :return: Lista de itens relacionados à pesquisa ou o código de erro (object||string)
+        :return: Lista de itens (Nome, Preco, Tipo, Descricao, Quantidade) relacionados à pesquisa ou o código de erro (object||string)
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'''
-                    SELECT REPLACE(i.Nome, '-', ' ') AS Nome, i.Preco, i.Tipo, i.Descricao
-                    FROM Pedidos p
-                    LEFT JOIN ItensPedidos ip ON ip.IdPedido = p.IdPedido
-                    LEFT JOIN Itens i on ip.IdItem = i.IdItens
-                    WHERE p.IdPedido = {indice};
-                    ''')
+                cursor.execute(Consultas.ITENS_DO_PEDIDO, (indice,))
                 rows = cursor.fetchall()
+                #pedido inexistente no banco principal (a consulta parte de Pedidos): procura no arquivo morto
+                if not rows and ArquivoMorto.necessario(database_name, id_pedido=indice):
+                    rows = ArquivoMorto.consultar(conn, database_name, Consultas.ITENS_DO_PEDIDO, (indice,))
                 return(rows)
     
-        except OSError as e:
+        except (OSError, Error) as e:
             print(e)
             return 'I4'
         
+    #percorre as linhas de ItensPedidos sem carregar o resultado inteiro em memória
+    @staticmethod
+    def iter_itens_pedido(database_name: str, indice: int = None, tamanho_lote: int = 500,
+                          primeiro: int = None, ultimo: int = None):
+        """
+        Versão em fluxo de search_into_itens_pedidos_id: as linhas são lidas do cursor em lotes
+        com fetchmany. Sem indice, percorre as linhas de todos os pedidos (ou dos pedidos de
+        primeiro a ultimo), em ordem de IdPedido.
+
+        :param database_name: nome do banco de dados (string)
+        :param indice: Id do pedido (int, opcional)
+        :param tamanho_lote: quantidade de linhas lidas por fetchmany (int)
+        :param primeiro: menor IdPedido percorrido sem indice (int, opcional)
+        :param ultimo: maior IdPedido percorrido sem indice (int, opcional)
+        :return: Gerador de linhas (IdPedido, Nome, Preco, Tipo, Descricao, Quantidade)
+        """
+        if indice is None and primeiro is not None and ultimo is not None:
+            consulta, parametros, menor = Consultas.LINHAS_ITENS_PEDIDOS_FAIXA, (primeiro, ultimo), primeiro
+        elif indice is None:
+            consulta, parametros, menor = Consultas.LINHAS_ITENS_PEDIDOS, (), None
+        else:
+            consulta, parametros, menor = Consultas.LINHAS_ITENS_DO_PEDIDO, (indice,), indice
+        if ArquivoMorto.necessario(database_name, id_pedido=menor):
+            return ArquivoMorto.iterar(database_name, consulta, parametros, tamanho_lote)
+        return Database.iterar(database_name, consulta, parametros, tamanho_lote)
+
     #valor de um item informado pelo seu indice
     @staticmethod
     def valor_item(database_name: str, indice: int)-> object:
@@ -134,11 +215,9 @@ class Item:
         :return: Lista de itens relacionados à pesquisa ou o código de erro (object||string)
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'''
-                SELECT Preco FROM Itens WHERE IdItens = {indice};
-                ''')
+                cursor.execute(Consultas.VALOR_ITEM, (indice,))
                 rows = cursor.fetchall()
                 return(rows)
 
@@ -156,11 +235,9 @@ class Item:
         :return: Lista de itens relacionados à pesquisa ou o código de erro (object||string)
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'''
-                SELECT Nome,Tipo,Descricao,Preco FROM Itens WHERE IdItens = {indice};
-                ''')
+                cursor.execute(Consultas.ITEM_POR_ID, (indice,))
                 rows = cursor.fetchall()
                 return(rows)
 
@@ -177,5 +254,7 @@ insert_into_itens_pedido - I3
 search_into_itens_pedidos_id - I4
 valor_item - I5
 search_item_id - I6
+importar_itens - I7
+versao_menu - I8
 
 '''
\ No newline at end of file
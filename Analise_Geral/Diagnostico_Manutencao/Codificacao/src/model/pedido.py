@@ -1,12 +1,23 @@
 from model.database import Database
+from model.consultas import Consultas
+from model.arquivoMorto import ArquivoMorto
+from operator import attrgetter
+from sqlite3 import Error
 #classe pedido
 class Pedido:
+    #sem __dict__ por instância: listagens e relatórios criam um objeto por pedido
+    __slots__ = ('id_pedido', 'status', 'delivery', 'endereco', 'date', 'valor_total')
+
+    #chave de ordenação dos objetos criados por da_linha (ArquivoMorto.iterar)
+    chave = attrgetter('id_pedido')
+
     def __init__(self,
                 status: str,
                 delivery: bool,
                 endereco: str,
                 date: str,
-                valor_total: float
+                valor_total: float,
+                id_pedido: int = None
                 ) -> None:
         """
         Modelo de objeto Pedido
@@ -14,14 +25,30 @@ class Pedido:
         :param status: string
         :param delivery: bool
         :param endereco: string
+        :param date: data no formato AAAA-MM-DD (string)
+        :param valor_total: float
+        :param id_pedido: IdPedido no banco, None enquanto o pedido não foi gravado (int)
         
         :return None
         """
+        self.id_pedido = id_pedido
         self.status = status
         self.delivery = delivery
-        self.endereco = endereco,
+        self.endereco = endereco
         self.date = date
         self.valor_total = valor_total
+
+    #fábrica de linhas para cursor.row_factory: cada linha de SELECT * FROM Pedidos vira um Pedido
+    @staticmethod
+    def da_linha(cursor: object, linha: tuple) -> object:
+        """
+        Converte uma linha (IdPedido, Status, Delivery, Endereco, Data, ValorTotal) em Pedido
+
+        :param cursor: cursor que produziu a linha (exigido pelo sqlite3, não utilizado)
+        :param linha: linha da tabela Pedidos (tuple)
+        :return: Pedido com o id_pedido preenchido (Pedido)
+        """
+        return Pedido(linha[1], linha[2], linha[3], linha[4], linha[5], linha[0])
     
 
     #adiciona um pedido ao banco de dados
@@ -35,17 +62,57 @@ class Pedido:
         :return: True se a inserção for bem-sucedida, ou código de erro (string).
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO Pedidos (Status, Delivery, Endereco, Data, ValorTotal) VALUES (?,?,?,?,?);
-                    ''', (data.status, data.delivery, data.endereco[0], data.date, data.valor_total))# (manutenção) - bug(corretiva) -> sem endereco[0] quando endereço vazio ele quebra
+                cursor.execute(Consultas.INSERIR_PEDIDO,
+                               (data.status, data.delivery, data.endereco, data.date, data.valor_total))
                 conn.commit()
                 return True
         except OSError as e:
             print(e)
             return 'P1'
         
+    #adiciona um pedido e todos os seus itens em uma única transação
+    @staticmethod
+    def criar_pedido_completo(database_name: str, data: object, itens: list) -> object:
+        """
+        Insere o pedido e as suas linhas em ItensPedidos em uma única transação,
+        com um único commit para o pedido inteiro.
+
+        :param database_name: Nome do banco de dados (string).
+        :param data: Objeto Pedido contendo as informações do pedido (Pedido).
+        :param itens: Lista de tuplas (IdItem, Quantidade), uma por item do pedido (list).
+        :return: IdPedido gerado pelo banco, também gravado em data.id_pedido (int) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                return Pedido.gravar_pedido(conn, data, itens)
+        except (OSError, Error) as e:
+            print(e)
+            return 'P5'
+
+    #grava um pedido e seus itens na transação aberta da conexão informada
+    @staticmethod
+    def gravar_pedido(conn: object, data: object, itens: list) -> int:
+        """
+        Insere o pedido e as suas linhas em ItensPedidos sem confirmar a transação:
+        o commit fica a cargo de quem chama (criar_pedido_completo ou o escritor do servidor,
+        que grava vários pedidos em um único commit). Erros do sqlite3 são propagados.
+
+        :param conn: Conexão com o banco (object).
+        :param data: Objeto Pedido contendo as informações do pedido (Pedido).
+        :param itens: Lista de tuplas (IdItem, Quantidade), uma por item do pedido (list).
+        :return: IdPedido gerado pelo banco, também gravado em data.id_pedido (int).
+        """
+        cursor = conn.cursor()
+        cursor.execute(Consultas.INSERIR_PEDIDO,
+                       (data.status, data.delivery, data.endereco, data.date, data.valor_total))
+        id_pedido = cursor.lastrowid
+        cursor.executemany(Consultas.INSERIR_ITEM_PEDIDO,
+                           [(id_pedido, item, quantidade) for item, quantidade in itens])
+        data.id_pedido = id_pedido
+        return id_pedido
+
     #busca todos os pedidos existentes    
     @staticmethod
     def search_in_pedidos_all(database_name: str) -> list:
@@ -53,18 +120,20 @@ class Pedido:
         Busca todos os pedidos existentes no banco de dados.
 
         :param database_name: Nome do banco de dados (string).
-        :return: Lista de todos os pedidos (list) ou código de erro (string).
+        :return: Lista de todos os pedidos (list de Pedido, com id_pedido) ou código de erro (string).
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            if ArquivoMorto.necessario(database_name):
+                return list(ArquivoMorto.iterar(database_name, Consultas.PEDIDOS_TODOS,
+                                                fabrica=Pedido.da_linha, chave=Pedido.chave))
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                SELECT * FROM Pedidos order by IdPedido asc;
-                ''')
+                cursor.row_factory = Pedido.da_linha
+                cursor.execute(Consultas.PEDIDOS_TODOS)
                 rows = cursor.fetchall()               
                 return(rows)
 
-        except OSError as e:
+        except (OSError, Error) as e:
             print(e)
             return 'P2'
         
@@ -73,22 +142,23 @@ class Pedido:
     @staticmethod
     def search_in_pedidos_id(database_name: str, indice: int) -> list:
         """
-        Busca um pedido específico pelo seu ID.
+        Busca um pedido específico pelo seu ID. Um pedido que não está no banco principal
+        é procurado no arquivo morto.
 
         :param database_name: Nome do banco de dados (string).
         :param indice: ID do pedido a ser buscado (int).
         :return: Dados do pedido (list) ou código de erro (string).
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute(f'''
-                SELECT * FROM Pedidos WHERE IdPedido = {indice};
-                ''')
+                cursor.execute(Consultas.PEDIDO_POR_ID, (indice,))
                 rows = cursor.fetchall()               
+                if not rows and ArquivoMorto.necessario(database_name, id_pedido=indice):
+                    rows = ArquivoMorto.consultar(conn, database_name, Consultas.PEDIDO_POR_ID, (indice,))
                 return(rows)
 
-        except OSError as e:
+        except (OSError, Error) as e:
             print(e)
             return 'P3'
     
@@ -102,24 +172,320 @@ class Pedido:
         :return: Dados do pedido (list) ou código de erro (string).
         """
         try:
-            with Database.conect_database(database_name) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'''
-                SELECT * FROM Pedidos WHERE IdPedido = {indice};
-                ''')
-                rows = cursor.fetchall()
-                if len(rows)>0:
-                    cursor.execute(f'''
-                        UPDATE Pedidos SET status='{status}' WHERE IdPedido={indice};
-                    ''')
-                    return True
-                else:
-                    return False
+            with Database.conexao(database_name) as conn:
+                return Pedido.gravar_status(conn, indice, status)
 
         except OSError as e:
             print(e)
             return False
+
+    #atualiza o status na transação aberta da conexão informada
+    @staticmethod
+    def gravar_status(conn: object, indice: int, status: str) -> bool:
+        """
+        Atualiza o status de um pedido sem confirmar a transação (ver gravar_pedido).
+
+        :param conn: Conexão com o banco (object).
+        :param indice: ID do pedido (int).
+        :param status: Novo estado do pedido (string).
+        :return: True se o pedido existir, False caso contrário.
+        """
+        cursor = conn.cursor()
+        cursor.execute(Consultas.ATUALIZAR_STATUS_PEDIDO, (status, indice))
+        return cursor.rowcount > 0
         
+    #busca todos os pedidos com os seus itens em uma única consulta
+    @staticmethod
+    def search_pedidos_com_itens(database_name: str) -> list:
+        """
+        Busca todos os pedidos junto com os seus itens em uma única consulta, ordenada
+        por pedido, dentro de uma única transação de leitura.
+
+        :param database_name: Nome do banco de dados (string).
+        :return: Lista de linhas (IdPedido, Data, ValorTotal, Nome, Preco, Tipo, Descricao, Quantidade)
+                 ou código de erro (string).
+        """
+        try:
+            if ArquivoMorto.necessario(database_name):
+                return list(ArquivoMorto.iterar(database_name, Consultas.PEDIDOS_COM_ITENS))
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute('BEGIN;')
+                cursor.execute(Consultas.PEDIDOS_COM_ITENS)
+                rows = cursor.fetchall()
+                return(rows)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P6'
+
+    #percorre todos os pedidos com seus itens sem carregar o resultado inteiro em memória
+    @staticmethod
+    def iter_pedidos_com_itens(database_name: str, tamanho_lote: int = 500, inicio: str = None, fim: str = None,
+                               a_partir_de: int = None):
+        """
+        Versão em fluxo de search_pedidos_com_itens: as linhas são lidas do cursor em lotes
+        com fetchmany e entregues uma a uma. A conexão fica emprestada do pool até o fim
+        da iteração (ou até o gerador ser descartado).
+
+        :param database_name: Nome do banco de dados (string).
+        :param tamanho_lote: Quantidade de linhas lidas por fetchmany (int).
+        :param inicio: Data inicial no formato AAAA-MM-DD, inclusiva (string, opcional).
+        :param fim: Data final no formato AAAA-MM-DD, inclusiva (string, opcional).
+        :param a_partir_de: Apenas pedidos com IdPedido maior que este (int, opcional; ignorado com período).
+        :return: Gerador de linhas (IdPedido, Data, ValorTotal, Nome, Preco, Tipo, Descricao, Quantidade).
+        """
+        consulta = Consultas.PEDIDOS_COM_ITENS
+        parametros = ()
+        limite = {}
+        if inicio is not None and fim is not None:
+            consulta = Consultas.PEDIDOS_COM_ITENS_PERIODO
+            parametros = (inicio, fim)
+            limite = {'data': inicio}
+        elif a_partir_de is not None:
+            consulta = Consultas.PEDIDOS_COM_ITENS_APOS
+            parametros = (a_partir_de,)
+            limite = {'id_pedido': a_partir_de + 1}
+        if ArquivoMorto.necessario(database_name, **limite):
+            return ArquivoMorto.iterar(database_name, consulta, parametros, tamanho_lote)
+        return Database.iterar(database_name, consulta, parametros, tamanho_lote)
+
+    #percorre os pedidos, com filtro opcional, sem carregar o resultado inteiro em memória
+    @staticmethod
+    def iter_pedidos(database_name: str, status: str = None, inicio: str = None, fim: str = None,
+                     tamanho_lote: int = 500):
+        """
+        Versão em fluxo de search_in_pedidos_all: os pedidos são lidos do cursor em lotes
+        com fetchmany e entregues um a um, já como objetos Pedido, em ordem de IdPedido.
+
+        :param database_name: Nome do banco de dados (string).
+        :param status: Apenas pedidos neste estado (string, opcional).
+        :param inicio: Data inicial no formato AAAA-MM-DD, inclusiva (string, opcional).
+        :param fim: Data final no formato AAAA-MM-DD, inclusiva (string, opcional).
+        :param tamanho_lote: Quantidade de linhas lidas por fetchmany (int).
+        :return: Gerador de Pedido (com id_pedido).
+        """
+        filtro = {'status': status, 'inicio': inicio, 'fim': fim}
+        filtro = {chave: valor for chave, valor in filtro.items() if valor is not None}
+        consulta = Consultas.pedidos_filtrados(filtro)
+        if ArquivoMorto.necessario(database_name, data=inicio, status=status):
+            return ArquivoMorto.iterar(database_name, consulta, tuple(filtro.values()), tamanho_lote,
+                                       Pedido.da_linha, Pedido.chave)
+        return Database.iterar(database_name, consulta, tuple(filtro.values()), tamanho_lote, Pedido.da_linha)
+
+    #faixa de IdPedido dos pedidos filtrados
+    @staticmethod
+    def faixa_pedidos(database_name: str, status: str = None, inicio: str = None, fim: str = None) -> object:
+        """
+        Menor e maior IdPedido dos pedidos que iter_pedidos percorreria com o mesmo filtro.
+
+        :param database_name: Nome do banco de dados (string).
+        :param status: Apenas pedidos neste estado (string, opcional).
+        :param inicio: Data inicial no formato AAAA-MM-DD, inclusiva (string, opcional).
+        :param fim: Data final no formato AAAA-MM-DD, inclusiva (string, opcional).
+        :return: Tupla (menor, maior), (None, None) se nenhum pedido for selecionado, ou código de erro (string).
+        """
+        filtro = {'status': status, 'inicio': inicio, 'fim': fim}
+        filtro = {chave: valor for chave, valor in filtro.items() if valor is not None}
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.faixa_pedidos_filtrados(filtro), tuple(filtro.values()))
+                row = cursor.fetchone()
+                if ArquivoMorto.necessario(database_name, data=inicio, status=status):
+                    arquivado = ArquivoMorto.consultar(conn, database_name, Consultas.faixa_pedidos_filtrados(filtro),
+                                                       tuple(filtro.values()))[0]
+                    menores = [valor for valor in (row[0], arquivado[0]) if valor is not None]
+                    maiores = [valor for valor in (row[1], arquivado[1]) if valor is not None]
+                    row = (min(menores), max(maiores)) if menores else (None, None)
+                return(row)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P14'
+
+    #busca uma página de pedidos a partir de um IdPedido de referência (paginação por chave)
+    @staticmethod
+    def search_pedidos_pagina(database_name: str, referencia: int, tamanho: int, anterior: bool = False) -> list:
+        """
+        Busca uma página de pedidos usando paginação por chave (keyset) sobre IdPedido:
+        a consulta parte direto da chave de referência, sem OFFSET e sem percorrer as páginas anteriores.
+
+        :param database_name: Nome do banco de dados (string).
+        :param referencia: IdPedido de referência; a página começa depois dele, ou termina antes dele se anterior=True (int).
+        :param tamanho: Quantidade de pedidos por página (int).
+        :param anterior: Busca a página anterior à referência (bool).
+        :return: Lista de pedidos em ordem crescente de IdPedido (list) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                consulta = Consultas.PAGINA_PEDIDOS_ANTERIOR if anterior else Consultas.PAGINA_PEDIDOS_PROXIMA
+                cursor.execute(consulta, (referencia, tamanho))
+                rows = cursor.fetchall()
+                if ArquivoMorto.necessario(database_name, id_pedido=None if anterior else referencia + 1):
+                    arquivados = ArquivoMorto.consultar(conn, database_name, consulta, (referencia, tamanho))
+                    rows = ArquivoMorto.unir(rows, arquivados, decrescente=anterior)[:tamanho]
+                if anterior:
+                    rows.reverse()
+                return(rows)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P8'
+
+    #faturamento e quantidade de todos os pedidos, lidos do resumo diário
+    @staticmethod
+    def faturamento_total(database_name: str) -> object:
+        """
+        Soma as linhas de ResumoDiario (uma por dia), mantidas pelos gatilhos de Pedidos.
+
+        :param database_name: Nome do banco de dados (string).
+        :return: Tupla (faturamento, pedidos, pedidos delivery, pedidos retirada) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.FATURAMENTO_TOTAL)
+                row = cursor.fetchone()
+                if ArquivoMorto.necessario(database_name):
+                    row = ArquivoMorto.somar_resumo(row, ArquivoMorto.consultar(conn, database_name,
+                                                                                Consultas.FATURAMENTO_TOTAL)[0])
+                return(row)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P9'
+
+    #faturamento de um período, lido do resumo diário
+    @staticmethod
+    def faturamento_periodo(database_name: str, inicio: str, fim: str) -> object:
+        """
+        Soma as linhas de ResumoDiario com Data entre inicio e fim (inclusive):
+        o custo depende da quantidade de dias do período, não da quantidade de pedidos.
+
+        :param database_name: Nome do banco de dados (string).
+        :param inicio: Data inicial no formato AAAA-MM-DD (string).
+        :param fim: Data final no formato AAAA-MM-DD (string).
+        :return: Tupla (faturamento, pedidos, pedidos delivery, pedidos retirada) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.FATURAMENTO_PERIODO, (inicio, fim))
+                row = cursor.fetchone()
+                if ArquivoMorto.necessario(database_name, data=inicio):
+                    row = ArquivoMorto.somar_resumo(row, ArquivoMorto.consultar(conn, database_name,
+                                                                                Consultas.FATURAMENTO_PERIODO,
+                                                                                (inicio, fim))[0])
+                return(row)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P7'
+
+    #resumo de cada dia de um período
+    @staticmethod
+    def search_resumo_diario(database_name: str, inicio: str, fim: str) -> list:
+        """
+        Busca as linhas de ResumoDiario com Data entre inicio e fim (inclusive), em ordem de data.
+
+        :param database_name: Nome do banco de dados (string).
+        :param inicio: Data inicial no formato AAAA-MM-DD (string).
+        :param fim: Data final no formato AAAA-MM-DD (string).
+        :return: Lista de linhas (Data, Pedidos, Faturamento, Delivery, Retirada) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.RESUMO_DIARIO_PERIODO, (inicio, fim))
+                rows = cursor.fetchall()
+                if ArquivoMorto.necessario(database_name, data=inicio):
+                    rows = ArquivoMorto.unir_resumos(rows, ArquivoMorto.consultar(conn, database_name,
+                                                                                  Consultas.RESUMO_DIARIO_PERIODO,
+                                                                                  (inicio, fim)))
+                return(rows)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P10'
+
+    #pedidos em aberto (fila da cozinha) com os seus itens
+    @staticmethod
+    def search_fila_cozinha(database_name: str, estados: tuple) -> list:
+        """
+        Busca os pedidos nos estados informados, com os seus itens, ordenados por estado e IdPedido.
+        A busca em Pedidos é feita só pelo índice idx_pedidos_fila (Status, IdPedido, Delivery).
+
+        :param database_name: Nome do banco de dados (string).
+        :param estados: Dois estados, ex.: ('preparo', 'pronto') (tuple).
+        :return: Lista de linhas (Status, IdPedido, Delivery, Nome, Quantidade) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.FILA_COZINHA, estados)
+                rows = cursor.fetchall()
+                return(rows)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P11'
+
+    #assinatura de uma faixa de pedidos (cache do relatório)
+    @staticmethod
+    def assinatura_pedidos(database_name: str, primeiro: int, ultimo: int) -> object:
+        """
+        Agrega a faixa de IdPedido de primeiro a ultimo (inclusive) em uma tupla que muda quando
+        um pedido da faixa é incluído, removido ou tem data ou valor alterados. A busca usa só
+        a chave primária, sem ler os itens.
+
+        :param database_name: Nome do banco de dados (string).
+        :param primeiro: Primeiro IdPedido da faixa (int).
+        :param ultimo: Último IdPedido da faixa (int).
+        :return: Tupla (pedidos, soma dos valores, soma das datas, menor id, maior id) ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.ASSINATURA_PEDIDOS, (primeiro, ultimo))
+                row = cursor.fetchone()
+                if ArquivoMorto.necessario(database_name, id_pedido=primeiro):
+                    arquivado = ArquivoMorto.consultar(conn, database_name, Consultas.ASSINATURA_PEDIDOS,
+                                                       (primeiro, ultimo))[0]
+                    if arquivado[0]:
+                        menores = [valor for valor in (row[3], arquivado[3]) if valor is not None]
+                        maiores = [valor for valor in (row[4], arquivado[4]) if valor is not None]
+                        row = (row[0] + arquivado[0], round(row[1] + arquivado[1], 2), row[2] + arquivado[2],
+                               min(menores), max(maiores))
+                return(row)
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P12'
+
+    #primeiro pedido depois de um IdPedido
+    @staticmethod
+    def proximo_pedido(database_name: str, referencia: int) -> object:
+        """
+        :param database_name: Nome do banco de dados (string).
+        :param referencia: IdPedido de referência (int).
+        :return: Menor IdPedido maior que referencia (int), None se não houver, ou código de erro (string).
+        """
+        try:
+            with Database.conexao(database_name) as conn:
+                cursor = conn.cursor()
+                cursor.execute(Consultas.PROXIMO_PEDIDO, (referencia,))
+                row = cursor.fetchone()
+                if ArquivoMorto.necessario(database_name, id_pedido=referencia + 1):
+                    arquivado = ArquivoMorto.consultar(conn, database_name, Consultas.PROXIMO_PEDIDO, (referencia,))[0]
+                    return min((valor for valor in (row[0], arquivado[0]) if valor is not None), default=None)
+                return(row[0])
+
+        except (OSError, Error) as e:
+            print(e)
+            return 'P13'
+
     @staticmethod
     def get_id_all(database_name):
         """
@@ -128,15 +494,15 @@ class Pedido:
         :return: lista com os id || código de erro
         """
         try:
-            with Database.conect_database(database_name) as conn:
+            with Database.conexao(database_name) as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                SELECT IdPedido FROM Pedidos order by IdPedido asc;
-                ''')
+                cursor.execute(Consultas.IDS_PEDIDOS)
                 rows = cursor.fetchall()               
+                if ArquivoMorto.necessario(database_name):
+                    rows = ArquivoMorto.unir(rows, ArquivoMorto.consultar(conn, database_name, Consultas.IDS_PEDIDOS))
                 return(rows)
 
-        except OSError as e:
+        except (OSError, Error) as e:
             print(e)
             return 'P4'
 '''
@@ -146,5 +512,15 @@ insert_into_pedidos - P1
 search_in_pedidos_all - P2
 search_in_pedidos_id - P3
 get_id_all - P4
+criar_pedido_completo - P5
+search_pedidos_com_itens - P6
+faturamento_periodo - P7
+search_pedidos_pagina - P8
+faturamento_total - P9
+search_resumo_diario - P10
+search_fila_cozinha - P11
+assinatura_pedidos - P12
+proximo_pedido - P13
+faixa_pedidos - P14
 
 '''
\ No newline at end of file
@@ -8,24 +8,76 @@ class PDF:
     """
 
     @staticmethod
-    def gerar_pdf(nome_arquivo: str, pedidos: list, faturamento_total: float) -> bool:
+    def gerar_pdf(nome_arquivo: str, pedidos: list, faturamento_total: float = None, periodo: str = None) -> bool:
         """
         Gera um arquivo PDF com os pedidos e o faturamento total.
 
+        Os pedidos são percorridos uma única vez, então podem vir de um gerador
+        (RelatorioControler.iter_dados_relatorio): as linhas são lidas do cursor aos poucos
+        e nenhuma lista de pedidos é montada. Com o pypdf instalado, o relatório é desenhado
+        em partes de PDFParalelo.PAGINAS_POR_PARTE páginas, cada uma salva em um arquivo
+        temporário, e as partes são copiadas uma a uma para o PDF final: a memória usada não
+        cresce com o tamanho do relatório. Sem o pypdf, o relatório é desenhado em um único
+        Canvas (desenhar_pdf), que guarda todas as páginas até o save().
+
         :param nome_arquivo: Caminho e nome do arquivo PDF.
-        :param pedidos: Lista de dicionários com pedidos e seus itens.
-        :param faturamento_total: Soma de todos os valores dos pedidos.
+        :param pedidos: Iterável de dicionários com pedidos e seus itens (Nome, Preco, Tipo, Descricao, Quantidade).
+        :param faturamento_total: Soma de todos os valores dos pedidos; se None, é somado durante o desenho.
+        :param periodo: Descrição do período do relatório (ex.: "01/07/2025 a 07/07/2025"), opcional.
         :return: True se o PDF for salvo com sucesso, False caso contrário.
         """
-        canva = canvas.Canvas(nome_arquivo, pagesize=A4)
-        largura, altura = A4
+        #importado aqui: report/relatorioParalelo.py importa este módulo
+        from report.relatorioParalelo import PDFParalelo, ExecucaoLocal, PdfReader
+        if PdfReader is None:
+            return PDF.desenhar_pdf(nome_arquivo, pedidos, faturamento_total, periodo)
+        return PDFParalelo.gerar_em_partes(nome_arquivo, pedidos, faturamento_total, periodo, ExecucaoLocal(), 1)
+
+    @staticmethod
+    def desenhar_pdf(nome_arquivo: str, pedidos: list, faturamento_total: float = None, periodo: str = None) -> bool:
+        """
+        Mesmo relatório de gerar_pdf, desenhado em um único Canvas: as páginas prontas ficam
+        em memória até o save(), então a memória cresce com o tamanho do relatório.
+        """
+        canva = canvas.Canvas(nome_arquivo, pagesize=A4, pageCompression=1)
+        soma_pedidos = 0
+
+        y = PDF.desenhar_titulo(canva, periodo)
+        for pedido in pedidos:
+            y = PDF.desenhar_pedido(canva, pedido, y)
+            soma_pedidos += pedido['valor']
+
+        # Faturamento final
+        if faturamento_total is None:
+            faturamento_total = soma_pedidos
+        PDF.desenhar_rodape(canva, y, faturamento_total, periodo)
+
+        try:
+            canva.save()
+            return True
+        except OSError as e:
+            print(e)
+            return False
+
+    #as etapas abaixo também são usadas pelo relatório em paralelo (report/relatorioParalelo.py),
+    #que depende de as quebras de página serem decididas apenas por y e pelo pedido
 
+    @staticmethod
+    def desenhar_titulo(canva: object, periodo: str = None) -> float:
+        """
+        Título e linha horizontal da primeira página
+
+        :return: posição y do primeiro pedido
+        """
+        largura, altura = A4
         x = 30
         y = altura - 50
 
         # Título
         canva.setFont("Helvetica-Bold", 16)
-        canva.drawCentredString(largura/2, y, "Pizza Mais - Relatório Geral")
+        if periodo:
+            canva.drawCentredString(largura/2, y, f"Pizza Mais - Relatório de {periodo}")
+        else:
+            canva.drawCentredString(largura/2, y, "Pizza Mais - Relatório Geral")
 
         # Linha horizontal abaixo do título
         y -= 10
@@ -34,57 +86,75 @@ class PDF:
 
         y -= 30
         canva.setFont("Helvetica", 11)
+        return y
 
-        for pedido in pedidos:
-            y -= 15 #espaçamento superior 
-            margem_direita = largura - 40 
-            # Calcular altura da caixa de pedido dinamicamente
-            # Cada pedido tem:
-            #   20 para linha do título do pedido
-            #   15 para "Itens:" cabeçalho
-            #   27 para cada item (12 para o nome, 15 para a descrição)
-            #   10 para espaçamento extra após os itens
-            itens_validos = [item for item in pedido["itens"] if item[0] is not None]
-            altura_caixa = 20 + 15 + (len(itens_validos) * 27) + 20
-
-            # Quebra de página se necessário
-            if y - altura_caixa < 50:
-                canva.showPage()
-                y = altura - 50
-
-            # Caixa visual para pedido
-            canva.setStrokeColor(colors.grey)
-            canva.setLineWidth(0.3)
-            canva.rect(x - 5, y + 15, largura - 60, -altura_caixa, stroke=1, fill=0)
-
-            # Conteúdo do pedido
-            # canva.setFont("Helvetica-Bold", 12)
-            # canva.drawString(x, y, f"Pedido #{pedido['id']} - Data: {pedido['data']} - Total: R$ {pedido['valor']:.2f}")
-            # y -= 20
-            # Cabeçalho do pedido: nome do pedido à esquerda, data à direita
-            canva.setFont("Helvetica-Bold", 12)
-            canva.drawString(x, y, f"Pedido #{pedido['id']}")
-            canva.drawRightString(margem_direita, y, f"Data: {pedido['data']}")
+    @staticmethod
+    def desenhar_pedido(canva: object, pedido: dict, y: float) -> float:
+        """
+        Caixa de um pedido, começando uma nova página se ela não couber na atual
 
+        :return: posição y do próximo pedido
+        """
+        largura, altura = A4
+        x = 30
+        y -= 15 #espaçamento superior 
+        margem_direita = largura - 40 
+        # Calcular altura da caixa de pedido dinamicamente
+        # Cada pedido tem:
+        #   20 para linha do título do pedido
+        #   15 para "Itens:" cabeçalho
+        #   27 para cada item distinto (12 para o nome, 15 para a descrição)
+        #   10 para espaçamento extra após os itens
+        itens_validos = [item for item in pedido["itens"] if item[0] is not None]
+        altura_caixa = 20 + 15 + (len(itens_validos) * 27) + 20
+
+        # Quebra de página se necessário
+        if y - altura_caixa < 50:
+            canva.showPage()
+            y = altura - 50
+
+        # Caixa visual para pedido
+        canva.setStrokeColor(colors.grey)
+        canva.setLineWidth(0.3)
+        canva.rect(x - 5, y + 15, largura - 60, -altura_caixa, stroke=1, fill=0)
+
+        # Conteúdo do pedido
+        # canva.setFont("Helvetica-Bold", 12)
+        # canva.drawString(x, y, f"Pedido #{pedido['id']} - Data: {pedido['data']} - Total: R$ {pedido['valor']:.2f}")
+        # y -= 20
+        # Cabeçalho do pedido: nome do pedido à esquerda, data à direita
+        canva.setFont("Helvetica-Bold", 12)
+        canva.drawString(x, y, f"Pedido #{pedido['id']}")
+        canva.drawRightString(margem_direita, y, f"Data: {pedido['data']}")
+
+        y -= 15
+        canva.setFont("Helvetica-Bold", 10)
+        canva.drawString(x + 10, y, "Itens:")
+        y -= 15
+        
+        canva.setFont("Helvetica", 10)
+        for nome, preco, tipo, descricao, quantidade in itens_validos:
+            canva.drawString(x + 20, y, f"- {quantidade}x {nome} ({tipo}) - R$ {preco:.2f}")
+            y -= 12
+            canva.setFillColor(colors.grey)
+            canva.drawString(x + 30, y, f"{descricao}")
+            canva.setFillColor(colors.black)
             y -= 15
-            canva.setFont("Helvetica-Bold", 10)
-            canva.drawString(x + 10, y, "Itens:")
-            y -= 15
-            
-            canva.setFont("Helvetica", 10)
-            for nome, preco, tipo, descricao in itens_validos:
-                canva.drawString(x + 20, y, f"- {nome} ({tipo}) - R$ {preco:.2f}")
-                y -= 12
-                canva.setFillColor(colors.grey)
-                canva.drawString(x + 30, y, f"{descricao}")
-                canva.setFillColor(colors.black)
-                y -= 15
-            # Valor total abaixo dos itens, alinhado à direita
-            canva.setFont("Helvetica-Bold", 11)
-            canva.drawRightString(margem_direita, y, f"Total: R$ {pedido['valor']:.2f}")
-
-
-            y -= 20 # espaço entre pedidos
+        # Valor total abaixo dos itens, alinhado à direita
+        canva.setFont("Helvetica-Bold", 11)
+        canva.drawRightString(margem_direita, y, f"Total: R$ {pedido['valor']:.2f}")
+
+
+        y -= 20 # espaço entre pedidos
+        return y
+
+    @staticmethod
+    def desenhar_rodape(canva: object, y: float, faturamento_total: float, periodo: str = None) -> None:
+        """
+        Linha separadora final e faturamento, após o último pedido
+        """
+        largura, altura = A4
+        x = 30
 
         # Linha separadora final
         if y <= 60:
@@ -96,13 +166,8 @@ class PDF:
         canva.line(x, y, largura - 30, y)
         y -= 25
 
-        # Faturamento final
         canva.setFont("Helvetica-Bold", 12)
-        canva.drawCentredString(largura / 2, y, f"Faturamento Total: R$ {faturamento_total:.2f}")
-
-        try:
-            canva.save()
-            return True
-        except OSError as e:
-            print(e)
-            return False
+        if periodo:
+            canva.drawCentredString(largura / 2, y, f"Faturamento do Período: R$ {faturamento_total:.2f}")
+        else:
+            canva.drawCentredString(largura / 2, y, f"Faturamento Total: R$ {faturamento_total:.2f}")
@@ -0,0 +1,307 @@
+import gc
+import os
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+
+#pypdf é opcional (pip install pypdf): sem ele o relatório é sempre gerado em série, em um único Canvas
+try:
+    from pypdf import PdfReader
+    from pypdf.generic import (ArrayObject, DecodedStreamObject, DictionaryObject, IndirectObject, NameObject,
+                               NumberObject, StreamObject)
+except ImportError:
+    PdfReader = None
+
+from report.relatorio1 import PDF
+
+
+class PDFParalelo:
+    """
+    Gera o mesmo relatório de PDF.gerar_pdf usando vários processos.
+
+    O processo principal percorre os pedidos uma única vez, calculando as quebras de página
+    com o próprio layout de relatorio1 (sobre um canvas que não desenha), e divide a sequência
+    em partes de PAGINAS_POR_PARTE páginas. Cada parte é desenhada por um processo em um PDF
+    temporário; as partes são unidas em ordem (unir) e a última recebe o rodapé com o
+    faturamento. As páginas saem iguais às do relatório em série.
+    """
+
+    PAGINAS_POR_PARTE = 40
+
+    #com processos > 1 (opção processos da seção [relatorio] de config.ini), só a partir desta
+    #quantidade de pedidos: abaixo dela o custo de iniciar os processos não compensa
+    MINIMO_PEDIDOS = 5000
+
+    @staticmethod
+    def disponivel(processos: int = None) -> bool:
+        """
+        :param processos: quantidade de processos (padrão 1, em série)
+        :return: True se o pypdf estiver instalado e houver mais de um processo (bool)
+        """
+        return PdfReader is not None and (processos or 1) > 1
+
+    @staticmethod
+    def gerar_pdf(nome_arquivo: str, pedidos: list, faturamento_total: float = None, periodo: str = None,
+                  processos: int = None, paginas_por_parte: int = None) -> bool:
+        """
+        Mesmos parâmetros e retorno de PDF.gerar_pdf. Sem o pypdf, ou com um único
+        processo, delega para PDF.gerar_pdf.
+
+        :param processos: quantidade de processos (padrão 1, em série)
+        :param paginas_por_parte: páginas desenhadas por tarefa (padrão PAGINAS_POR_PARTE)
+        """
+        processos = processos or 1
+        if not PDFParalelo.disponivel(processos):
+            return PDF.gerar_pdf(nome_arquivo, pedidos, faturamento_total, periodo)
+        executor = ProcessPoolExecutor(max_workers=processos, mp_context=get_context('spawn'))
+        return PDFParalelo.gerar_em_partes(nome_arquivo, pedidos, faturamento_total, periodo, executor, processos,
+                                           paginas_por_parte)
+
+    @staticmethod
+    def gerar_em_partes(nome_arquivo: str, pedidos, faturamento_total: float, periodo: str, executor,
+                        processos: int, paginas_por_parte: int = None) -> bool:
+        """
+        Desenha as partes com o executor (um ProcessPoolExecutor ou ExecucaoLocal) em uma pasta
+        temporária e as une em nome_arquivo (requer o pypdf)
+
+        :return: True se o PDF foi gerado (bool)
+        """
+        paginas_por_parte = paginas_por_parte or PDFParalelo.PAGINAS_POR_PARTE
+        try:
+            with tempfile.TemporaryDirectory() as pasta, executor:
+                partes = PDFParalelo.desenhar_partes(executor, pasta, processos, pedidos, faturamento_total,
+                                                     periodo, paginas_por_parte)
+                PDFParalelo.unir([parte["arquivo"] for parte in partes], nome_arquivo)
+            return True
+        except (OSError, BrokenProcessPool) as e:
+            print(e)
+            return False
+
+    @staticmethod
+    def unir(arquivos: list, nome_arquivo: str) -> None:
+        """
+        Une os PDFs das partes, na ordem da lista, em nome_arquivo (requer o pypdf).
+
+        As partes são lidas uma de cada vez e os seus objetos (páginas, conteúdo, fontes) são
+        gravados no arquivo final assim que copiados, com uma nova numeração; só as posições
+        dos objetos e a lista de páginas ficam em memória até o fim, então a memória usada
+        não cresce com o conteúdo do relatório. O conteúdo das páginas não muda.
+        """
+        posicoes = {}
+        paginas = []
+        #1: catálogo, 2: árvore de páginas, gravados no final
+        raiz = IndirectObject(2, 0, None)
+        proximo = 3
+        with open(nome_arquivo, 'wb') as saida:
+            saida.write(b'%PDF-1.4\n%\x93\x8c\x8b\x9e\n')
+
+            def gravar(numero, objeto):
+                posicoes[numero] = saida.tell()
+                saida.write(b'%d 0 obj\n' % numero)
+                objeto.write_to_stream(saida)
+                saida.write(b'\nendobj\n')
+
+            for arquivo in arquivos:
+                leitor = PdfReader(arquivo)
+                #número do objeto na parte -> número no arquivo final; pendentes ainda não foram gravados
+                numeros, pendentes = {}, []
+
+                def referencia(objeto):
+                    nonlocal proximo
+                    if objeto.idnum not in numeros:
+                        numeros[objeto.idnum] = proximo
+                        pendentes.append((proximo, objeto))
+                        proximo += 1
+                    return IndirectObject(numeros[objeto.idnum], 0, None)
+
+                for pagina in leitor.pages:
+                    paginas.append(referencia(pagina.indirect_reference))
+                while pendentes:
+                    numero, objeto = pendentes.pop()
+                    gravar(numero, PDFParalelo._copiar(objeto.get_object(), referencia, raiz))
+                #o leitor e os objetos lidos formam ciclos de referência, liberados só pelo coletor:
+                #sem a coleta a cada parte, as partes já gravadas se acumulariam na memória
+                gc.collect()
+
+            gravar(2, DictionaryObject({
+                NameObject('/Type'): NameObject('/Pages'),
+                NameObject('/Kids'): ArrayObject(paginas),
+                NameObject('/Count'): NumberObject(len(paginas)),
+            }))
+            gravar(1, DictionaryObject({NameObject('/Type'): NameObject('/Catalog'), NameObject('/Pages'): raiz}))
+            inicio_xref = saida.tell()
+            saida.write(b'xref\n0 %d\n0000000000 65535 f \n' % proximo)
+            for numero in range(1, proximo):
+                saida.write(b'%010d 00000 n \n' % posicoes[numero])
+            saida.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (proximo, inicio_xref))
+
+    @staticmethod
+    def _copiar(objeto, referencia, raiz):
+        """
+        Cópia de um objeto de uma parte para o arquivo final: referências a outros objetos são
+        renumeradas por referencia, o /Parent das páginas passa a ser a árvore de páginas final
+        e o conteúdo das streams é gravado com FlateDecode
+        """
+        if isinstance(objeto, IndirectObject):
+            return referencia(objeto)
+        if isinstance(objeto, ArrayObject):
+            return ArrayObject(PDFParalelo._copiar(valor, referencia, raiz) for valor in objeto)
+        if isinstance(objeto, StreamObject):
+            conteudo = DecodedStreamObject()
+            conteudo.set_data(objeto.get_data())
+            copia = conteudo.flate_encode()
+        elif isinstance(objeto, DictionaryObject):
+            copia = DictionaryObject()
+        else:
+            return objeto
+        for chave, valor in objeto.items():
+            if chave == '/Parent':
+                copia[NameObject(chave)] = raiz
+            elif not (isinstance(objeto, StreamObject) and chave in ('/Filter', '/DecodeParms', '/Length')):
+                copia[NameObject(chave)] = PDFParalelo._copiar(valor, referencia, raiz)
+        return copia
+
+    @staticmethod
+    def desenhar_partes(executor, pasta: str, processos: int, pedidos, faturamento_total: float,
+                        periodo: str, paginas_por_parte: int, continuacao: float = None, soma_anterior: float = 0) -> list:
+        """
+        Divide os pedidos em partes e desenha cada parte em um processo do executor
+
+        :param continuacao: posição y depois do último pedido de uma parte já desenhada: os pedidos
+                            continuam essa parte, sem título (usado pelo cache de relatórios); None começa pelo título
+        :param soma_anterior: soma dos pedidos das partes já desenhadas, para o rodapé quando
+                              faturamento_total é None
+        :raises ValueError: com continuacao, se o primeiro pedido couber na última página da parte anterior
+                            ou se não houver pedidos
+        :return: partes na ordem do relatório (list de dict), cada uma com "arquivo", "primeiro_id",
+                 "ultimo_id", "proximo_id" (primeiro pedido da parte seguinte), "y_inicio", "y_fim" e "soma";
+                 a última tem o rodapé e "proximo_id" None
+        """
+        tarefas = []
+        partes = []
+
+        def enviar(parte, y_inicio, y_fim, proximo_id, rodape):
+            arquivo = os.path.join(pasta, f'parte{len(partes)}.pdf')
+            primeira = continuacao is None and not partes
+            partes.append({
+                "arquivo": arquivo,
+                "primeiro_id": parte[0]["id"] if parte else None,
+                "ultimo_id": parte[-1]["id"] if parte else None,
+                "proximo_id": proximo_id,
+                "y_inicio": y_inicio,
+                "y_fim": y_fim,
+                "soma": sum(pedido["valor"] for pedido in parte),
+            })
+            tarefas.append(executor.submit(_desenhar_parte, arquivo, parte, y_inicio, primeira, periodo, rodape))
+            #limita as partes em memória: espera a mais antiga antes de acumular outras
+            if sum(not tarefa.done() for tarefa in tarefas) > processos * 2:
+                next(tarefa for tarefa in tarefas if not tarefa.done()).result()
+
+        simulacao = _SemDesenho()
+        if continuacao is None:
+            y = PDF.desenhar_titulo(simulacao, periodo)
+            paginas = 1
+        else:
+            #o primeiro pedido da continuação abre uma página nova, contada abaixo
+            y = continuacao
+            paginas = 0
+        parte, y_inicio = [], y
+        soma_pedidos = soma_anterior
+        for pedido in pedidos:
+            y_anterior, quebras = y, simulacao.paginas
+            y = PDF.desenhar_pedido(simulacao, pedido, y)
+            if simulacao.paginas != quebras:
+                if paginas == paginas_por_parte:
+                    enviar(parte, y_inicio, y_anterior, pedido["id"], None)
+                    parte, y_inicio, paginas = [], y_anterior, 0
+                paginas += 1
+            if paginas == 0:
+                raise ValueError('os pedidos não continuam a parte anterior em uma página nova')
+            parte.append(pedido)
+            soma_pedidos += pedido['valor']
+        if paginas == 0:
+            raise ValueError('não há pedidos para continuar a parte anterior')
+        if faturamento_total is None:
+            faturamento_total = soma_pedidos
+        enviar(parte, y_inicio, y, None, faturamento_total)
+        for tarefa in tarefas:
+            tarefa.result()
+        return partes
+
+
+class ExecucaoLocal:
+    """
+    Executor que desenha cada parte no próprio processo, no momento do submit: mesma interface
+    usada por desenhar_partes, para quando não compensa (ou não é possível) iniciar processos
+    """
+
+    def submit(self, funcao, *args) -> Future:
+        futuro = Future()
+        try:
+            futuro.set_result(funcao(*args))
+        except Exception as e:
+            futuro.set_exception(e)
+        return futuro
+
+    def __enter__(self) -> 'ExecucaoLocal':
+        return self
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+class _SemDesenho:
+    """
+    Canvas que não desenha nada e só conta as quebras de página
+    """
+
+    def __init__(self) -> None:
+        self.paginas = 0
+
+    def showPage(self) -> None:
+        self.paginas += 1
+
+    def __getattr__(self, nome: str):
+        return _nada
+
+
+def _nada(*args, **kwargs) -> None:
+    return None
+
+
+class _CanvasParte(canvas.Canvas):
+    """
+    Canvas de uma parte que começa em uma quebra de página: o primeiro pedido da parte
+    dispara a quebra que no relatório em série encerrou a página anterior, e ela é ignorada
+    """
+
+    def __init__(self, *args, ignorar_quebra: bool = False, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.ignorar_quebra = ignorar_quebra
+
+    def showPage(self) -> None:
+        if self.ignorar_quebra:
+            self.ignorar_quebra = False
+            return
+        super().showPage()
+
+
+def _desenhar_parte(arquivo: str, pedidos: list, y_inicio: float, primeira: bool, periodo: str, rodape: float) -> None:
+    """
+    Desenha uma parte do relatório (executada nos processos do ProcessPoolExecutor)
+
+    :param y_inicio: posição y antes do primeiro pedido, como no relatório em série
+    :param primeira: a parte começa pelo título (bool)
+    :param rodape: faturamento do rodapé na última parte, None nas demais
+    """
+    canva = _CanvasParte(arquivo, pagesize=A4, pageCompression=1, ignorar_quebra=not primeira)
+    y = PDF.desenhar_titulo(canva, periodo) if primeira else y_inicio
+    for pedido in pedidos:
+        y = PDF.desenhar_pedido(canva, pedido, y)
+    if rodape is not None:
+        PDF.desenhar_rodape(canva, y, rodape, periodo)
+    canva.save()
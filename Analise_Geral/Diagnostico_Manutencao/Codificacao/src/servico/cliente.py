@@ -0,0 +1,72 @@
+import json
+import socket
+
+
+class Cliente:
+    """
+    Cliente do serviço de pedidos (servico/servidor.py), usado pelos terminais de atendimento.
+    Mantém uma única conexão TCP e envia uma requisição JSON por linha.
+    Os métodos retornam o resultado da ação ou o código de erro (string), como os controllers.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', porta: int = 8765, tempo_limite: float = 30.0) -> None:
+        """
+        :param host: endereço do serviço (string)
+        :param porta: porta TCP do serviço (int)
+        :param tempo_limite: segundos de espera por uma resposta (float)
+        """
+        self.conexao = socket.create_connection((host, porta), timeout=tempo_limite)
+        self.conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.arquivo = self.conexao.makefile('rwb')
+
+    def chamar(self, acao: str, **args) -> object:
+        """
+        Envia uma requisição e espera a resposta
+
+        :param acao: nome da ação (string)
+        :param args: argumentos da ação
+        :return: resultado da ação ou código de erro (string)
+        """
+        try:
+            self.arquivo.write(json.dumps({'acao': acao, 'args': args}).encode('utf-8') + b'\n')
+            self.arquivo.flush()
+            linha = self.arquivo.readline()
+        except OSError as e:
+            print(e)
+            return 'C1'
+        if not linha:
+            return 'C1'
+        resposta = json.loads(linha)
+        if resposta['ok']:
+            return resposta['resultado']
+        return resposta['erro']
+
+    def fechar(self) -> None:
+        self.arquivo.close()
+        self.conexao.close()
+
+    def menu(self) -> object:
+        return self.chamar('menu')
+
+    def criar_pedido(self, itens: list, delivery: bool = False, endereco: str = None, status: int = 1) -> object:
+        return self.chamar('criar_pedido', itens=itens, delivery=delivery, endereco=endereco, status=status)
+
+    def pedido(self, indice: int) -> object:
+        return self.chamar('pedido', indice=indice)
+
+    def atualizar_status(self, indice: int, status: int) -> object:
+        return self.chamar('atualizar_status', indice=indice, status=status)
+
+    def pagina_pedidos(self, referencia: int = 0, tamanho: int = None, anterior: bool = False) -> object:
+        return self.chamar('pagina_pedidos', referencia=referencia, tamanho=tamanho, anterior=anterior)
+
+    def faturamento_periodo(self, inicio: str, fim: str) -> object:
+        return self.chamar('faturamento_periodo', inicio=inicio, fim=fim)
+
+
+'''
+Códigos de Erro
+
+conexão com o serviço perdida - C1
+
+'''
@@ -0,0 +1,297 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from sqlite3 import Error
+
+from model.database import Database
+from model.pedido import Pedido
+from model.item import Item
+from controler.pedidoControler import PedidoControler
+from controler.itemControler import ItemControler
+
+
+class Servidor:
+    """
+    Serviço local de pedidos para vários terminais de atendimento (servico/terminal.py).
+
+    Protocolo: uma requisição JSON por linha, {"acao": str, "args": dict}, respondida com
+    uma linha {"ok": true, "resultado": ...} ou {"ok": false, "erro": código}.
+
+    Todas as gravações passam por uma única tarefa escritora, que junta as gravações
+    pendentes em um lote e confirma o lote com um único commit, em uma conexão própria:
+    não há disputa de trava entre terminais. As leituras são executadas em um grupo de
+    threads que usa as conexões do pool (Database.conexao).
+    """
+
+    HOST = '127.0.0.1'
+    PORTA = 8765
+
+    #quantidade máxima de gravações confirmadas por commit
+    LOTE_MAXIMO = 64
+
+    def __init__(self, database_name: str, host: str = HOST, porta: int = PORTA) -> None:
+        """
+        :param database_name: nome do banco de dados (string)
+        :param host: endereço de escuta, apenas localhost (string)
+        :param porta: porta TCP (int), 0 escolhe uma porta livre
+        """
+        self.database_name = database_name
+        self.host = host
+        self.porta = porta
+        self.leitores = ThreadPoolExecutor(max_workers=Database.TAMANHO_POOL, thread_name_prefix='leitor')
+        self.escritor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='escritor')
+        self.conexao_escrita = None
+        self.fila_escrita = None
+        self.tarefa_escritor = None
+        self.servidor = None
+        self.lotes = 0
+        self.gravacoes = 0
+
+        #ação -> função de leitura (database_name, **args)
+        self.leituras = {
+            'menu': ItemControler.mostrar_itens_menu,
+            'pedido': Servidor._ler_pedido,
+            'pagina_pedidos': PedidoControler.listar_pedidos_pagina,
+            'faturamento_total': PedidoControler.faturamento_total,
+            'faturamento_periodo': PedidoControler.faturamento_periodo,
+            'fila_cozinha': PedidoControler.fila_cozinha,
+        }
+        #ação -> função de gravação (conexão de escrita, **args), executada dentro do lote
+        self.escritas = {
+            'criar_pedido': self._gravar_pedido,
+            'atualizar_status': self._gravar_status,
+            'inserir_item': self._gravar_item,
+        }
+
+    async def iniciar(self) -> None:
+        """
+        Abre a conexão de escrita, inicia a tarefa escritora e passa a aceitar terminais
+        """
+        self.conexao_escrita = Database.conect_database(self.database_name)
+        if isinstance(self.conexao_escrita, str):
+            raise OSError(f'Erro na conexão ({self.conexao_escrita})')
+        self.fila_escrita = asyncio.Queue()
+        self.tarefa_escritor = asyncio.create_task(self._escritor())
+        self.servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = self.servidor.sockets[0].getsockname()[1]
+
+    async def executar(self) -> None:
+        """
+        Inicia o serviço e atende os terminais até ser interrompido (Ctrl+C)
+        """
+        await self.iniciar()
+        print(f'Serviço de pedidos em {self.host}:{self.porta} (banco {self.database_name})')
+        try:
+            await self.servidor.serve_forever()
+        finally:
+            await self.encerrar()
+
+    async def encerrar(self) -> None:
+        """
+        Para de aceitar terminais, grava o que estiver na fila e fecha as conexões
+        """
+        if self.servidor is not None:
+            self.servidor.close()
+            await self.servidor.wait_closed()
+        if self.tarefa_escritor is not None:
+            await self.fila_escrita.join()
+            self.tarefa_escritor.cancel()
+        self.leitores.shutdown()
+        self.escritor.shutdown()
+        if self.conexao_escrita is not None:
+            self.conexao_escrita.close()
+        Database.fechar_conexoes(self.database_name)
+
+    async def _atender(self, reader, writer) -> None:
+        """
+        Atende um terminal: lê uma requisição por linha e responde na mesma ordem
+        """
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                resposta = await self._processar(linha)
+                writer.write(json.dumps(resposta).encode('utf-8') + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _processar(self, linha: bytes) -> dict:
+        """
+        Executa uma requisição: leituras no grupo de leitores, gravações pela fila do escritor
+
+        :param linha: requisição JSON (bytes)
+        :return: resposta (dict)
+        """
+        try:
+            requisicao = json.loads(linha)
+            acao = requisicao['acao']
+            args = requisicao.get('args', {})
+        except (ValueError, KeyError, TypeError):
+            return {'ok': False, 'erro': 'S1'}
+        if acao in self.leituras:
+            loop = asyncio.get_running_loop()
+            try:
+                resultado = await loop.run_in_executor(self.leitores, lambda: self.leituras[acao](self.database_name, **args))
+            except Exception as e:
+                print(e)
+                return {'ok': False, 'erro': 'S3'}
+        elif acao in self.escritas:
+            concluida = asyncio.get_running_loop().create_future()
+            await self.fila_escrita.put((acao, args, concluida))
+            resultado = await concluida
+        else:
+            return {'ok': False, 'erro': 'S2'}
+        if isinstance(resultado, str):
+            return {'ok': False, 'erro': resultado}
+        return {'ok': True, 'resultado': resultado}
+
+    async def _escritor(self) -> None:
+        """
+        Tarefa escritora: espera a primeira gravação, junta as que já estiverem na fila
+        (até LOTE_MAXIMO) e grava o lote inteiro com um único commit. Um erro inesperado
+        no lote responde S5 a todas as gravações dele; a tarefa continua atendendo a fila.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self.fila_escrita.get()]
+            while len(lote) < Servidor.LOTE_MAXIMO and not self.fila_escrita.empty():
+                lote.append(self.fila_escrita.get_nowait())
+            try:
+                resultados = await loop.run_in_executor(self.escritor, self._gravar_lote, lote)
+            except Exception as e:
+                print(e)
+                resultados = ['S5'] * len(lote)
+            for (acao, args, concluida), resultado in zip(lote, resultados):
+                if not concluida.done():
+                    concluida.set_result(resultado)
+                self.fila_escrita.task_done()
+
+    def _gravar_lote(self, lote: list) -> list:
+        """
+        Grava um lote na conexão de escrita, em uma transação. Cada gravação fica em um
+        SAVEPOINT próprio: uma gravação inválida (qualquer exceção) é desfeita sem afetar as
+        demais do lote. A transação nunca fica aberta: ou o lote é confirmado, ou é desfeito.
+
+        :param lote: lista de (ação, args, future)
+        :return: resultado de cada gravação, na ordem do lote (list)
+        """
+        conn = self.conexao_escrita
+        resultados = []
+        try:
+            conn.execute('BEGIN IMMEDIATE;')
+            for acao, args, concluida in lote:
+                conn.execute('SAVEPOINT gravacao;')
+                try:
+                    resultado = self.escritas[acao](conn, **args)
+                except Exception as e:
+                    print(e)
+                    resultado = 'S4'
+                if isinstance(resultado, str):
+                    conn.execute('ROLLBACK TO gravacao;')
+                conn.execute('RELEASE gravacao;')
+                resultados.append(resultado)
+            conn.commit()
+        except Error as e:
+            print(e)
+            return ['S5'] * len(lote)
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+        self.lotes += 1
+        self.gravacoes += len(lote)
+        if any(acao == 'inserir_item' for acao, args, concluida in lote):
+            ItemControler.invalidar_cache(self.database_name)
+        return resultados
+
+    @staticmethod
+    def _ler_pedido(database_name: str, indice: int) -> object:
+        """
+        Dados de um pedido e os seus itens, como exibidos pela Janela2
+
+        :return: {"pedido": linha de Pedidos, "itens": [(Nome, Preco, Tipo, Descricao, Quantidade)]},
+                 None se o pedido não existir, ou código de erro
+        """
+        pedido = PedidoControler.search_in_pedidos_id(database_name, indice)
+        if isinstance(pedido, str):
+            return pedido
+        if not pedido:
+            return None
+        itens = ItemControler.search_into_itens_pedidos_id(database_name, indice)
+        if isinstance(itens, str):
+            return itens
+        return {'pedido': pedido[0], 'itens': itens}
+
+    def _gravar_pedido(self, conn: object, itens: list, delivery: bool = False, endereco: str = None,
+                       status: int = 1, data: str = None) -> object:
+        """
+        Grava um pedido com o valor total calculado pelos preços do menu
+
+        :param itens: lista de [IdItem, Quantidade]
+        :param delivery: pedido para entrega (bool)
+        :param endereco: endereço de entrega (string)
+        :param status: 1-preparo, 2-pronto, 3-entregue (int)
+        :param data: data no formato AAAA-MM-DD (string), padrão hoje
+        :return: IdPedido (int) ou código de erro (string)
+        """
+        if data is None:
+            data = date.today().isoformat()
+        else:
+            #as consultas de período comparam Data como texto: só datas AAAA-MM-DD são aceitas
+            try:
+                data = date.fromisoformat(data).isoformat()
+            except (TypeError, ValueError):
+                return 'S4'
+        quantidade_por_item = {}
+        for item, quantidade in itens:
+            quantidade_por_item[int(item)] = quantidade_por_item.get(int(item), 0) + int(quantidade)
+        itens = list(quantidade_por_item.items())
+        valor_total = PedidoControler.calcular_valor_total(self.database_name, itens)
+        estado = PedidoControler.ESTADOS.get(status)
+        if not itens or valor_total is False or estado is None:
+            return 'S4'
+        if not delivery:
+            endereco = 'Retirada no local'
+        pedido = Pedido(estado, str(bool(delivery)), endereco, data, float(valor_total))
+        return Pedido.gravar_pedido(conn, pedido, itens)
+
+    def _gravar_status(self, conn: object, indice: int, status: int) -> object:
+        """
+        Atualiza o estado de um pedido
+
+        :param indice: IdPedido (int)
+        :param status: 1-preparo, 2-pronto, 3-entregue (int)
+        :return: True, False se o pedido não existir, ou código de erro (string)
+        """
+        estado = PedidoControler.ESTADOS.get(status)
+        if estado is None:
+            return 'S4'
+        return Pedido.gravar_status(conn, indice, estado)
+
+    def _gravar_item(self, conn: object, nome: str, preco: float, tipo: str, descricao: str) -> object:
+        """
+        Insere um item no menu, com as mesmas regras de cadastro da Janela3 e da importação
+
+        :return: IdItens (int) ou código de erro (string)
+        """
+        dados, erro = ItemControler.validar_item(nome, preco, tipo, descricao)
+        if erro:
+            print(erro)
+            return 'S4'
+        return Item.gravar_item(conn, Item(*dados))
+
+
+'''
+Códigos de Erro
+
+requisição inválida - S1
+ação desconhecida - S2
+erro na leitura - S3
+gravação inválida (desfeita) - S4
+erro no commit do lote (lote inteiro desfeito) - S5
+
+'''
@@ -0,0 +1,93 @@
+from servico.cliente import Cliente
+
+
+class Terminal:
+    """
+    Terminal de atendimento: cadastra e consulta pedidos pelo serviço de pedidos,
+    sem abrir o banco de dados. Vários terminais podem ser usados ao mesmo tempo.
+    """
+
+    @staticmethod
+    def mostrar_terminal(cliente: Cliente) -> None:
+        while True:
+            opcao = input('\n1 - Cadastrar\n2 - Consultar pedido\n3 - Atualizar Estado\n4 - Encerrar\nDigite: ').strip()
+            if opcao == '1':
+                Terminal.cadastrar(cliente)
+            elif opcao == '2':
+                Terminal.consultar(cliente)
+            elif opcao == '3':
+                Terminal.atualizar_estado(cliente)
+            elif opcao == '4':
+                break
+
+    @staticmethod
+    def cadastrar(cliente: Cliente) -> None:
+        menu = cliente.menu()
+        if isinstance(menu, str):
+            print(f'Erro ao buscar o menu: {menu}')
+            return
+        print('\n----------Menu----------')
+        for item in menu:
+            print(f'{item[0]} - {item[1]}| {item[3]}| R$ {item[2]}')
+        precos = {item[0]: item[2] for item in menu}
+        itens = []
+        while True:
+            try:
+                item = int(input('Numero do item (0 para finalizar): '))
+                if item == 0:
+                    break
+                quantidade = int(input('Quantidade: '))
+            except ValueError:
+                print('Entrada inválida! Por favor, digite apenas NÚMEROS para o item e a quantidade.')
+                continue
+            if item not in precos or quantidade <= 0:
+                print('ERRO: item ou quantidade inválidos.')
+                continue
+            itens.append([item, quantidade])
+        if not itens:
+            print('Pedido cancelado')
+            return
+        delivery = input('Delivery (S/N): ').lower().strip() in ['s', 'sim']
+        endereco = input('Endereco: ') if delivery else None
+        print(f'Valor Final: R${sum(precos[item] * quantidade for item, quantidade in itens):.2f}')
+        numero_pedido = cliente.criar_pedido(itens, delivery, endereco)
+        if isinstance(numero_pedido, int):
+            print(f'Numero do pedido: {numero_pedido}')
+            print('Pedido cadastrado com sucesso!')
+        else:
+            print(f'Erro ao cadastrar o pedido: {numero_pedido}')
+
+    @staticmethod
+    def consultar(cliente: Cliente) -> None:
+        try:
+            indice = int(input('Índice do pedido: '))
+        except ValueError:
+            print('Entrada inválida! Por favor, digite apenas o número do pedido.')
+            return
+        resultado = cliente.pedido(indice)
+        if resultado is None:
+            print(f'\nPedido com o índice {indice} não existe.')
+            return
+        if isinstance(resultado, str):
+            print(f'Erro ao buscar o pedido: {resultado}')
+            return
+        for elem in resultado['itens']:
+            print(f'Qtd: {elem[4]}| Tipo: {elem[2]}| Sabor: {elem[0]}| R$ {elem[1]}|')
+        pedido = resultado['pedido']
+        print(f'Status: {pedido[1]}\nDelivery: {pedido[2]}\nEndereco: {pedido[3]}\nData: {pedido[4]}\nR$ {pedido[5]}')
+
+    @staticmethod
+    def atualizar_estado(cliente: Cliente) -> None:
+        try:
+            indice = int(input('Índice do pedido: '))
+            status = int(input('preparo - 1 | pronto - 2 | entregue - 3: '))
+        except ValueError:
+            print('Entrada inválida! Digite apenas números.')
+            return
+        resultado = cliente.atualizar_status(indice, status)
+        if resultado is True:
+            print(f'Status do Pedido {indice} atualizado com sucesso')
+        elif resultado is False:
+            print(f'Pedido com o índice {indice} não existe.')
+        else:
+            print(f'Erro ao atualizar o status: {resultado}')
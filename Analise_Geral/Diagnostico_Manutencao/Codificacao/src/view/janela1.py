@@ -2,13 +2,6 @@
 from datetime import date
 import time
 
-#Necessário para realizar import em python
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
-
 #importando os módulos de model
 from model.pedido import Pedido
 
@@ -51,11 +44,9 @@ class Janela1:
             if entrada_usuario in respostas_positivas:
                 print('----------Cadastrar pedido----------\n')
                 
-                lista_itens = []
+                quantidade_por_item = {} # IdItem -> quantidade, uma linha por item no pedido
                 valor_total = 0
                 adicionar = 's'
-                pedidos = PedidoControler.search_in_pedidos_all(database_name)
-                numero_pedido = len(pedidos) + 1
                 
                 # Loop para adicionar itens ao pedido
                 while adicionar == 's':
@@ -79,12 +70,11 @@ class Janela1:
                         except ValueError:
                             print("Entrada inválida! Por favor, digite apenas NÚMEROS para o item e a quantidade.")
                     
-                    a = ItemControler.valor_item(database_name, item)
+                    # 'a' já contém o preço consultado na validação acima (cache do menu)
                     b = a[0][0] * quantidade
                     valor_total += b
                     
-                    for x in range(quantidade):
-                        lista_itens.append((numero_pedido, item))
+                    quantidade_por_item[item] = quantidade_por_item.get(item, 0) + quantidade
                     
                     # Validação para adicionar mais itens
                     while True:
@@ -100,7 +90,6 @@ class Janela1:
                 
                 # Finalização do pedido
                 print('\n----------Finalizar pedido----------\n')
-                print(f'Numero do pedido: {numero_pedido}')
 
                 while True:
                     delivery_input = str(input('Delivery (S/N): ')).lower().strip()
@@ -139,13 +128,17 @@ class Janela1:
  
                 print(f'Valor Final: R${valor_total:.2f}') # Formatando a saída do valor total
                 data_hoje = date.today()
-                data_formatada = data_hoje.strftime('%d/%m/%Y')
+                data_formatada = data_hoje.isoformat() # AAAA-MM-DD: ordenável e indexável no banco
                 
                 pedido = Pedido(status, str(delivery), endereco, data_formatada, float(valor_total))
-                PedidoControler.insert_into_pedidos(database_name, pedido)
-                for elem in lista_itens:
-                    ItemControler.insert_into_itens_pedidos(database_name, elem)
-                print("Pedido cadastrado com sucesso!")
+                # O número do pedido é o IdPedido gerado pelo banco, gravado junto com os itens em uma única transação
+                lista_itens = list(quantidade_por_item.items())
+                numero_pedido = PedidoControler.criar_pedido_completo(database_name, pedido, lista_itens)
+                if isinstance(numero_pedido, int):
+                    print(f'Numero do pedido: {numero_pedido}')
+                    print("Pedido cadastrado com sucesso!")
+                else:
+                    print(f"Erro ao cadastrar o pedido: {numero_pedido}")
 
             # --- Bloco ELIF: Se o usuário NÃO quer cadastrar ---
             elif entrada_usuario in respostas_negativas:
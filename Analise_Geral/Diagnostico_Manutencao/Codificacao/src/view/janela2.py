@@ -1,10 +1,3 @@
-#Necessário para realizar import em python
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
-
 from controler.pedidoControler import PedidoControler
 from controler.itemControler import ItemControler
 
@@ -12,7 +5,7 @@ class Janela2:
     def mostrar_janela2(database_name:str):
         faturamento = 0
         print('------Pesquisar Pedido--------')
-        q = int(input('Unico-1\nTodos-2\nAtualizar Estado-3\nDigite: '))
+        q = int(input('Unico-1\nTodos-2\nAtualizar Estado-3\nFaturamento por período-4\nPor estado-5\nDigite: '))
         if q==1:
             while True:
                 try:
@@ -30,31 +23,52 @@ class Janela2:
             else:
                 resume = ItemControler.search_into_itens_pedidos_id(database_name, indice)
                 informacoes_pedido = PedidoControler.search_in_pedidos_id(database_name,indice)[0]
-                quantidade_itens = len(resume)
+                quantidade_itens = sum(elem[4] or 0 for elem in resume) # soma das quantidades de cada linha
                 exibir_tela = ''
                 for elem in resume:
-                    exibir_tela+=f'Tipo: {elem[2]}| Sabor: {elem[0]}| Descricao: {elem[3]}| R$ {elem[1]}|\n'
+                    exibir_tela+=f'Qtd: {elem[4]}| Tipo: {elem[2]}| Sabor: {elem[0]}| Descricao: {elem[3]}| R$ {elem[1]}|\n'
                 print(f'\nResumo do pedido {indice}: \n {exibir_tela}\nItens: {quantidade_itens}\n\n')
                 if len(informacoes_pedido)>0:
-                    print(f'Status: {informacoes_pedido[1]}\nDelivery: {informacoes_pedido[2]}\nEndereco: {informacoes_pedido[3]}\nData: {informacoes_pedido[4]}\nR$ {informacoes_pedido[5]}')
+                    print(f'Status: {informacoes_pedido[1]}\nDelivery: {informacoes_pedido[2]}\nEndereco: {informacoes_pedido[3]}\nData: {PedidoControler.formatar_data(informacoes_pedido[4])}\nR$ {informacoes_pedido[5]}')
             print('Voltando ao menu inicial\n')
             
         elif q==2:
-            row = PedidoControler.search_in_pedidos_all(database_name)            
-            faturamento = 0
-            exibir_tela = ''
-            endereco =''
-            i=1
-            for elem in row:
-                endereco_raw = elem.endereco
-                if isinstance(endereco_raw, (tuple, list)):
-                    endereco_raw = endereco_raw[0]
-                faturamento+=elem.valor_total
-                endereco = endereco_raw or 'Nao informado'
-                exibir_tela+= f'Nº: {i}| Estado: {elem.status}| Delivery: {elem.delivery}| Endereco: {endereco}| Valor: R$ {elem.valor_total} \n'
-                i+=1
-            print(f'\nPedidos \n\n{exibir_tela}')
-            print(f'Faturamento R$ {faturamento}')
+            # listagem paginada por IdPedido: cada página é uma consulta que parte da última chave exibida
+            try:
+                tamanho = int(input(f'Pedidos por página (Enter = {PedidoControler.TAMANHO_PAGINA}): ') or PedidoControler.TAMANHO_PAGINA)
+            except ValueError:
+                tamanho = PedidoControler.TAMANHO_PAGINA
+            pagina = PedidoControler.listar_pedidos_pagina(database_name, 0, tamanho)
+            while True:
+                if isinstance(pagina, str):
+                    print(f'Erro ao buscar os pedidos: {pagina}')
+                    break
+                exibir_tela = ''
+                for elem in pagina:
+                    endereco = elem[3] or 'Nao informado'
+                    exibir_tela+= f'Nº: {elem[0]}| Estado: {elem[1]}| Delivery: {elem[2]}| Endereco: {endereco}| Valor: R$ {elem[5]} \n'
+                print(f'\nPedidos \n\n{exibir_tela}')
+                opcao = input('p - próxima página | a - página anterior | s - sair: ').lower().strip()
+                if opcao == 'p' or opcao == 'a':
+                    if not pagina:
+                        proxima = []
+                    elif opcao == 'p':
+                        proxima = PedidoControler.listar_pedidos_pagina(database_name, pagina[-1][0], tamanho)
+                    else:
+                        proxima = PedidoControler.listar_pedidos_pagina(database_name, pagina[0][0], tamanho, anterior=True)
+                    if proxima:
+                        pagina = proxima
+                    else:
+                        print('Não há mais pedidos nessa direção.')
+                elif opcao == 's':
+                    break
+                else:
+                    print('Opção inválida!')
+            # o faturamento vem do resumo diário (uma linha por dia), sem percorrer os pedidos
+            resumo = PedidoControler.faturamento_total(database_name)
+            if isinstance(resumo, dict):
+                print(f'Total de pedidos: {resumo["quantidade"]} (delivery: {resumo["delivery"]} | retirada: {resumo["retirada"]})')
+                print(f'Faturamento R$ {resumo["faturamento"]}')
         
         elif q==3:
             while True:
@@ -72,16 +86,16 @@ class Janela2:
                 print(f"\nPedido com o índice {indice} não existe.")
             else:
                 resume = ItemControler.search_into_itens_pedidos_id(database_name, indice)
-                quantidade_itens = len(resume)
+                quantidade_itens = sum(elem[4] or 0 for elem in resume) # soma das quantidades de cada linha
                 exibir_tela = ''
-                if quantidade_itens>0:
+                if len(resume)>0:
                     informacoes_pedido = PedidoControler.search_in_pedidos_id(database_name,indice)[0]
 
                     for elem in resume:
-                        exibir_tela+=f'Tipo: {elem[2]}| Sabor: {elem[0]}| Descricao: {elem[3]}| R$ {elem[1]}|\n'
+                        exibir_tela+=f'Qtd: {elem[4]}| Tipo: {elem[2]}| Sabor: {elem[0]}| Descricao: {elem[3]}| R$ {elem[1]}|\n'
                     print(f'\nResumo do pedido {indice}: \n {exibir_tela}\nItens: {quantidade_itens}\n')
                     print('Informações do Pedido\n')
-                    print(f'Status: {informacoes_pedido[1]}\nDelivery: {informacoes_pedido[2]}\nEndereco: {informacoes_pedido[3]}\nData: {informacoes_pedido[4]}\nR$ {informacoes_pedido[5]}')
+                    print(f'Status: {informacoes_pedido[1]}\nDelivery: {informacoes_pedido[2]}\nEndereco: {informacoes_pedido[3]}\nData: {PedidoControler.formatar_data(informacoes_pedido[4])}\nR$ {informacoes_pedido[5]}')
                     
                     while True:
                         try:
@@ -99,6 +113,55 @@ class Janela2:
                             print('Entrada inválida! Digite apenas números (1, 2 ou 3).')
                 else:
                     print('Indice inválido')    
+
+        elif q==4:
+            # datas digitadas no formato dd/mm/aaaa; os valores vêm do resumo diário, um registro por dia
+            # vazio ou 0 cancela e volta ao menu
+            while True:
+                resultado = None
+                inicio = input('Data inicial (dd/mm/aaaa, vazio ou 0 para cancelar): ').strip()
+                if inicio in ('', '0'):
+                    break
+                fim = input('Data final (dd/mm/aaaa, vazio ou 0 para cancelar): ').strip()
+                if fim in ('', '0'):
+                    break
+                resultado = PedidoControler.faturamento_periodo(database_name, inicio, fim)
+                if resultado is False:
+                    print('Data inválida! Utilize o formato dd/mm/aaaa.')
+                    continue
+                break
+            if resultado is None:
+                print('Consulta cancelada')
+            elif isinstance(resultado, dict):
+                print(f'\nPeríodo: {inicio} a {fim}\n')
+                dias = PedidoControler.resumo_diario(database_name, inicio, fim)
+                if isinstance(dias, list):
+                    for dia in dias:
+                        print(f'{dia["data"]}| Pedidos: {dia["quantidade"]}| Delivery: {dia["delivery"]}| Retirada: {dia["retirada"]}| R$ {dia["faturamento"]:.2f}')
+                print(f'\nPedidos: {resultado["quantidade"]} (delivery: {resultado["delivery"]} | retirada: {resultado["retirada"]})')
+                print(f'Faturamento R$ {resultado["faturamento"]:.2f}')
+            else:
+                print(f'Erro ao calcular o faturamento: {resultado}')
+        elif q==5:
+            while True:
+                try:
+                    opcao = int(input('preparo - 1 | pronto - 2 | entregue - 3: '))
+                    if opcao in PedidoControler.ESTADOS:
+                        break
+                    print('Opção inválida! Digite apenas 1, 2 ou 3.')
+                except ValueError:
+                    print('Entrada inválida! Digite apenas números (1, 2 ou 3).')
+            status = PedidoControler.ESTADOS[opcao]
+            # os pedidos são lidos do banco em lotes e exibidos à medida que chegam
+            quantidade = 0
+            print(f'\nPedidos em {status}\n')
+            for pedido in PedidoControler.iter_pedidos(database_name, {'status': status}):
+                endereco = pedido.endereco or 'Nao informado'
+                print(f'Nº: {pedido.id_pedido}| Delivery: {pedido.delivery}| Endereco: {endereco}| Data: {PedidoControler.formatar_data(pedido.date)}| Valor: R$ {pedido.valor_total}')
+                quantidade += 1
+                faturamento += pedido.valor_total
+            print(f'\nTotal de pedidos: {quantidade}')
+            print(f'Faturamento R$ {faturamento}')
         else:
             print('Entrada inválida, retornando')
             
@@ -1,10 +1,3 @@
-# Necessário para realizar import em python
-import sys
-from pathlib import Path
-file = Path(__file__).resolve()
-parent, root = file.parent, file.parents[1]
-sys.path.append(str(root))
-
 from controler.itemControler import ItemControler
 
 class Janela3:
@@ -23,46 +16,36 @@ class Janela3:
             print("\nPreencha os dados do novo item:")
             
             # Nome (campo obrigatório)
-            nome = input("Nome do item: ")
-            while not nome.strip():
-                print("Erro: O nome do item é obrigatório!")
-                nome = input("Nome do item: ")
+            # as regras de cada campo ficam no ItemControler, também usadas na importação do menu
+            nome, erro = ItemControler.validar_nome(input("Nome do item: "))
+            while erro:
+                print(f"Erro: {erro}")
+                nome, erro = ItemControler.validar_nome(input("Nome do item: "))
             
             # Descrição (campo obrigatório)
-            descricao = input("Descrição: ")
-            while not descricao.strip():
-                print("Erro: A descrição é obrigatória!")
-                descricao = input("Descrição: ")
+            descricao, erro = ItemControler.validar_descricao(input("Descrição: "))
+            while erro:
+                print(f"Erro: {erro}")
+                descricao, erro = ItemControler.validar_descricao(input("Descrição: "))
             
             # Preço (deve ser numérico)
-            preco = None
-            while preco is None:
-                try:
-                    preco = float(input("Preço (R$): "))
-                    if preco <= 0:
-                        print("Erro: O preço deve ser maior que zero!")
-                        preco = None
-                except ValueError:
-                    print("Erro: Digite um valor numérico válido!")
+            preco, erro = ItemControler.validar_preco(input("Preço (R$): "))
+            while erro:
+                print(f"Erro: {erro}")
+                preco, erro = ItemControler.validar_preco(input("Preço (R$): "))
             
             # Categoria
             print("\nSelecione a categoria:")
-            print("1 - Pizza")
-            print("2 - Bebida")
-            print("3 - Sobremesa")
-            print("4 - Outro")
+            categorias = {}
+            for numero, categoria in enumerate(ItemControler.CATEGORIAS, start=1):
+                print(f"{numero} - {categoria}")
+                categorias[str(numero)] = categoria
             
             opcao = input("Opção: ")
-            while opcao not in ['1', '2', '3', '4']:
-                print("Erro: Selecione uma opção válida (1-4)!")
+            while opcao not in categorias:
+                print(f"Erro: Selecione uma opção válida (1-{len(categorias)})!")
                 opcao = input("Opção: ")
             
-            categorias = {
-                '1': 'Pizza',
-                '2': 'Bebida',
-                '3': 'Sobremesa',
-                '4': 'Outro'
-            }
             tipo = categorias[opcao]
             
             # Confirmação
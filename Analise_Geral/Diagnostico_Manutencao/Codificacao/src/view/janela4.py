@@ -0,0 +1,59 @@
+import time
+from datetime import datetime
+
+from controler.pedidoControler import PedidoControler
+
+class Janela4:
+
+    #intervalo, em segundos, entre duas verificações de alteração no banco
+    INTERVALO = 1.0
+
+    @staticmethod
+    def mostrar_janela4(database_name: str, intervalo: float = None) -> None:
+        """
+        Painel da cozinha: lista os pedidos em preparo e prontos, agrupados por estado.
+        A cada intervalo apenas PRAGMA data_version é lido; a fila só é consultada de novo
+        quando outro terminal confirmou alguma alteração no banco. Ctrl+C volta ao menu.
+
+        :param database_name: Nome do banco de dados
+        :param intervalo: Segundos entre verificações (padrão Janela4.INTERVALO)
+        :return: None
+        """
+        intervalo = intervalo or Janela4.INTERVALO
+        monitor = PedidoControler.abrir_monitor(database_name)
+        if isinstance(monitor, str):
+            print(f'Erro ao abrir o painel da cozinha: {monitor}')
+            return
+        versao = None
+        try:
+            while True:
+                versao_atual = PedidoControler.versao_dados(monitor)
+                if versao_atual != versao:
+                    versao = versao_atual
+                    Janela4.desenhar(PedidoControler.fila_cozinha(database_name))
+                time.sleep(intervalo)
+        except KeyboardInterrupt:
+            print('\nPainel da cozinha encerrado. Voltando ao menu inicial\n')
+        finally:
+            monitor.close()
+
+    @staticmethod
+    def desenhar(fila: object) -> None:
+        """
+        Limpa o terminal e exibe a fila da cozinha
+
+        :param fila: Dicionário estado -> pedidos (PedidoControler.fila_cozinha) ou código de erro
+        :return: None
+        """
+        print('\033[2J\033[H', end='')
+        print(f'---------- Painel da Cozinha ({datetime.now():%H:%M:%S}) ----------')
+        if isinstance(fila, str):
+            print(f'Erro ao buscar os pedidos: {fila}')
+            return
+        for estado, pedidos in fila.items():
+            print(f'\n{estado.upper()} ({len(pedidos)})')
+            for pedido in pedidos:
+                tipo = 'Delivery' if pedido["delivery"] in ('True', 1) else 'Retirada'
+                itens = ', '.join(f'{quantidade}x {nome}' for nome, quantidade in pedido["itens"])
+                print(f'  Nº {pedido["id"]}| {tipo}| {itens}')
+        print('\nCtrl+C para sair')
@@ -0,0 +1,41 @@
+from controler.filaRelatorios import FilaRelatorios
+
+class Janela5:
+
+    @staticmethod
+    def solicitar_relatorio(fila: FilaRelatorios) -> None:
+        """
+        Opção 3 do menu: coloca um relatório em PDF na fila e volta ao menu imediatamente.
+        O aviso de relatório pronto aparece quando a geração termina.
+
+        :param fila: Fila de relatórios do software
+        :return: None
+        """
+        inicio = input('Data inicial do relatório (dd/mm/aaaa, Enter para todo o histórico): ').strip()
+        fim = input('Data final do relatório (dd/mm/aaaa): ').strip() if inicio else None
+        numero = fila.solicitar(inicio, fim)
+        if numero is False:
+            print('Data inválida! Utilize o formato dd/mm/aaaa.')
+            return
+        if isinstance(numero, str):
+            print(f'Erro ao solicitar o relatório: {numero}')
+            return
+        pendentes = fila.pendentes()
+        print(f'Relatório {numero} solicitado; {pendentes} relatório(s) na fila. '
+              'Acompanhe na opção 8 - o menu continua disponível.')
+
+    @staticmethod
+    def mostrar_janela5(fila: FilaRelatorios) -> None:
+        """
+        Opção 8 do menu: estado e progresso dos relatórios solicitados nesta sessão
+
+        :param fila: Fila de relatórios do software
+        :return: None
+        """
+        trabalhos = fila.trabalhos()
+        print('---------- Relatórios ----------')
+        if not trabalhos:
+            print('Nenhum relatório solicitado.')
+            return
+        for trabalho in trabalhos:
+            print(FilaRelatorios.descrever(trabalho))